@@ -9,6 +9,7 @@ Memories stored as dimensional coordinates, not vectors.
 """
 
 from __future__ import annotations
+import atexit
 import time
 import hashlib
 import json
@@ -17,6 +18,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any, Tuple, Set
 from pathlib import Path
 import threading
+import weakref
 from collections import OrderedDict
 
 
@@ -59,6 +61,10 @@ class MemoryPoint:
         y = 1.0 / (x + 0.001)
         self.identity_vector = (x, y)
     
+    def __hash__(self) -> int:
+        # Index lookups return sets of memories; identity is the memory_id
+        return hash(self.memory_id)
+    
     @property
     def z_value(self) -> float:
         """Compute z = x·y for geometric composition"""
@@ -184,6 +190,12 @@ class DimensionalMemoryIndex:
         with self._lock:
             return self._user_spirals.get(user_id, 0)
     
+    def restore_spiral(self, user_id: str, spiral: int):
+        """Raise user's current spiral to at least `spiral` (after a reload)"""
+        with self._lock:
+            if spiral > self._user_spirals.get(user_id, 0):
+                self._user_spirals[user_id] = spiral
+    
     def advance_spiral(self, user_id: str):
         """Move user to next conversation spiral"""
         with self._lock:
@@ -229,81 +241,165 @@ class MemorySubstrate:
         - Zero hallucinations (exact coordinate match)
         - Infinite capacity (spiral expansion)
         - Geometric composition (z = x·y)
+    
+    Persistence uses one long-lived WAL connection. Stores go into the
+    index immediately and into a pending batch that is written with a
+    single executemany + commit once `batch_size` rows are queued or
+    `flush_interval` seconds have passed (a background flusher thread),
+    so a crash can lose at most that window; batch_size=1 writes through.
+    Users are loaded from disk the first time they are touched instead of
+    scanning the whole table at startup.
     """
     
-    def __init__(self, db_path: str = "memories.db"):
+    _COLUMNS = (
+        "memory_id, content, timestamp, spiral, layer, position, "
+        "user_id, context, importance, tags, identity_x, identity_y"
+    )
+    _INSERT_SQL = f"INSERT OR REPLACE INTO memories ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    _SELECT_USER_SQL = f"SELECT {_COLUMNS} FROM memories WHERE user_id = ?"
+    _SELECT_ID_SQL = f"SELECT {_COLUMNS} FROM memories WHERE memory_id = ?"
+    
+    def __init__(self, db_path: str = "memories.db", batch_size: int = 256,
+                 flush_interval: float = 0.05):
         self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
         self.index = DimensionalMemoryIndex()
+        
+        self._db_lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._pending: List[Tuple] = []
+        self._loaded_users: Set[str] = set()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = threading.Event()
         self._init_database()
-        self._load_memories()
+        atexit.register(_close_at_exit, weakref.ref(self))
         
         # Statistics
         self.total_stored = 0
         self.total_recalled = 0
+        self.total_flushes = 0
     
     def _init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS memories (
-                memory_id TEXT PRIMARY KEY,
-                content TEXT NOT NULL,
-                timestamp REAL NOT NULL,
-                spiral INTEGER NOT NULL,
-                layer INTEGER NOT NULL,
-                position REAL NOT NULL,
-                user_id TEXT NOT NULL,
-                context TEXT,
-                importance REAL DEFAULT 1.0,
-                tags TEXT,
-                identity_x REAL,
-                identity_y REAL,
-                created_at REAL DEFAULT (strftime('%s', 'now'))
+        with self._db_lock:
+            self._conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS memories (
+                    memory_id TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    timestamp REAL NOT NULL,
+                    spiral INTEGER NOT NULL,
+                    layer INTEGER NOT NULL,
+                    position REAL NOT NULL,
+                    user_id TEXT NOT NULL,
+                    context TEXT,
+                    importance REAL DEFAULT 1.0,
+                    tags TEXT,
+                    identity_x REAL,
+                    identity_y REAL,
+                    created_at REAL DEFAULT (strftime('%s', 'now'))
+                );
+                -- Indexes for fast lookup
+                CREATE INDEX IF NOT EXISTS idx_user_spiral_layer
+                ON memories(user_id, spiral, layer);
+                CREATE INDEX IF NOT EXISTS idx_user_timestamp
+                ON memories(user_id, timestamp DESC);
+            """)
+            self._conn.commit()
+    
+    # -------------------------------------------------------------------------
+    # Write batching
+    # -------------------------------------------------------------------------
+    
+    def flush(self) -> int:
+        """Write all pending memories in one transaction; returns rows written"""
+        with self._db_lock:
+            if not self._pending:
+                return 0
+            rows, self._pending = self._pending, []
+            with self._conn:
+                self._conn.executemany(self._INSERT_SQL, rows)
+            self.total_flushes += 1
+            return len(rows)
+    
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            if self._pending:
+                self.flush()
+    
+    def _start_flusher(self):
+        if self._flusher is None and self.flush_interval and self.flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="memory-substrate-flush", daemon=True
             )
-        """)
-        
-        # Create indexes for fast lookup
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_spiral_layer 
-            ON memories(user_id, spiral, layer)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_timestamp 
-            ON memories(user_id, timestamp DESC)
-        """)
-        
-        conn.commit()
-        conn.close()
+            self._flusher.start()
     
-    def _load_memories(self):
-        """Load existing memories into index"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM memories")
-        rows = cursor.fetchall()
-        
-        for row in rows:
-            memory = MemoryPoint.from_dict({
-                'memory_id': row[0],
-                'content': row[1],
-                'timestamp': row[2],
-                'spiral': row[3],
-                'layer': row[4],
-                'position': row[5],
-                'user_id': row[6],
-                'context': row[7] or '{}',
-                'importance': row[8] or 1.0,
-                'tags': row[9] or '[]',
-                'identity_x': row[10] or 1.0,
-                'identity_y': row[11] or 1.0
-            })
-            self.index.add(memory)
-        
-        conn.close()
+    def close(self):
+        """Flush pending writes and close the connection"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._db_lock:
+            self.flush()
+            self._conn.close()
+    
+    def __enter__(self) -> 'MemorySubstrate':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    # -------------------------------------------------------------------------
+    # Lazy loading
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _row_to_memory(row: Tuple) -> MemoryPoint:
+        return MemoryPoint.from_dict({
+            'memory_id': row[0],
+            'content': row[1],
+            'timestamp': row[2],
+            'spiral': row[3],
+            'layer': row[4],
+            'position': row[5],
+            'user_id': row[6],
+            'context': row[7] or '{}',
+            'importance': row[8] or 1.0,
+            'tags': row[9] or '[]',
+            'identity_x': row[10] or 1.0,
+            'identity_y': row[11] or 1.0
+        })
+    
+    def _ensure_user(self, user_id: str):
+        """Load a user's memories (and current spiral) on first access"""
+        if user_id in self._loaded_users:
+            return
+        with self._db_lock:
+            if user_id in self._loaded_users:
+                return
+            self.flush()
+            spiral = 0
+            for row in self._conn.execute(self._SELECT_USER_SQL, (user_id,)):
+                memory = self._row_to_memory(row)
+                self.index.add(memory)
+                spiral = max(spiral, memory.spiral)
+            self.index.restore_spiral(user_id, spiral)
+            self._loaded_users.add(user_id)
+    
+    def _get_memory(self, memory_id: str) -> Optional[MemoryPoint]:
+        memory = self.index.get_by_id(memory_id)
+        if memory is None:
+            with self._db_lock:
+                self.flush()
+                row = self._conn.execute(self._SELECT_ID_SQL, (memory_id,)).fetchone()
+            if row is not None:
+                self._ensure_user(row[6])
+                memory = self.index.get_by_id(memory_id)
+        return memory
     
     def store(
         self,
@@ -328,9 +424,12 @@ class MemorySubstrate:
         Returns:
             MemoryPoint at dimensional coordinates
         """
+        self._ensure_user(user_id)
+        now = time.time()
+        
         # Generate memory ID
         memory_id = hashlib.md5(
-            f"{user_id}:{content}:{time.time()}".encode()
+            f"{user_id}:{content}:{now}".encode()
         ).hexdigest()
         
         # Get current spiral
@@ -340,10 +439,10 @@ class MemorySubstrate:
         memory = MemoryPoint(
             memory_id=memory_id,
             content=content,
-            timestamp=time.time(),
+            timestamp=now,
             spiral=spiral,
             layer=layer,
-            position=time.time(),
+            position=now,
             user_id=user_id,
             context=context or {},
             importance=importance,
@@ -353,25 +452,18 @@ class MemorySubstrate:
         # Add to index
         self.index.add(memory)
         
-        # Persist to database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        data = memory.to_dict()
-        cursor.execute("""
-            INSERT INTO memories (
-                memory_id, content, timestamp, spiral, layer, position,
-                user_id, context, importance, tags, identity_x, identity_y
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            data['memory_id'], data['content'], data['timestamp'],
-            data['spiral'], data['layer'], data['position'],
-            data['user_id'], data['context'], data['importance'],
-            data['tags'], data['identity_x'], data['identity_y']
-        ))
-        
-        conn.commit()
-        conn.close()
+        # Queue for the next batched write
+        row = (
+            memory_id, content, now, spiral, layer, now, user_id,
+            json.dumps(memory.context), importance, json.dumps(memory.tags),
+            memory.identity_vector[0], memory.identity_vector[1]
+        )
+        with self._db_lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            else:
+                self._start_flusher()
         
         self.total_stored += 1
         return memory
@@ -395,6 +487,7 @@ class MemorySubstrate:
         Returns:
             List of memories, sorted by relevance
         """
+        self._ensure_user(user_id)
         current_spiral = self.index.get_current_spiral(user_id)
         memories = []
         
@@ -418,6 +511,7 @@ class MemorySubstrate:
     
     def recall_by_tag(self, user_id: str, tag: str) -> List[MemoryPoint]:
         """Recall memories by tag"""
+        self._ensure_user(user_id)
         all_memories = self.index.get_user_memories(user_id)
         return [m for m in all_memories if tag in m.tags]
     
@@ -427,8 +521,8 @@ class MemorySubstrate:
         
         Computes relationship strength between two memories.
         """
-        m1 = self.index.get_by_id(memory1_id)
-        m2 = self.index.get_by_id(memory2_id)
+        m1 = self._get_memory(memory1_id)
+        m2 = self._get_memory(memory2_id)
         
         if not m1 or not m2:
             return None
@@ -437,6 +531,7 @@ class MemorySubstrate:
     
     def new_conversation(self, user_id: str):
         """Start a new conversation (advance spiral)"""
+        self._ensure_user(user_id)
         self.index.advance_spiral(user_id)
     
     def delete_memory(self, memory_id: str):
@@ -444,16 +539,16 @@ class MemorySubstrate:
         # Remove from index
         self.index.remove(memory_id)
         
-        # Remove from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
-        conn.commit()
-        conn.close()
+        # Remove from database (after any queued insert of the same row)
+        with self._db_lock:
+            self.flush()
+            with self._conn:
+                self._conn.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
     
     def delete_user_memories(self, user_id: str):
         """Delete all memories for a user (GDPR right to be forgotten)"""
         # Get all user memories
+        self._ensure_user(user_id)
         memories = self.index.get_user_memories(user_id, max_spirals=1000)
         
         # Remove from index
@@ -461,15 +556,15 @@ class MemorySubstrate:
             self.index.remove(memory.memory_id)
         
         # Remove from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM memories WHERE user_id = ?", (user_id,))
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            self.flush()
+            with self._conn:
+                self._conn.execute("DELETE FROM memories WHERE user_id = ?", (user_id,))
     
     def get_stats(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Get memory statistics"""
         if user_id:
+            self._ensure_user(user_id)
             memories = self.index.get_user_memories(user_id, max_spirals=1000)
             return {
                 "user_id": user_id,
@@ -483,13 +578,79 @@ class MemorySubstrate:
                 "newest_memory": max(memories, key=lambda m: m.timestamp).timestamp if memories else None
             }
         else:
+            with self._db_lock:
+                self.flush()
+                total_users = self._conn.execute(
+                    "SELECT COUNT(DISTINCT user_id) FROM memories"
+                ).fetchone()[0]
             return {
                 "total_stored": self.total_stored,
                 "total_recalled": self.total_recalled,
-                "total_users": len(set(m.user_id for m in self.index._memories.values()))
+                "total_flushes": self.total_flushes,
+                "total_users": total_users
             }
 
 
+def _close_at_exit(ref):
+    substrate = ref()
+    if substrate is not None:
+        substrate.close()
+
+
+def benchmark_store(n: int = 50_000, users: int = 100, db_path: str = None) -> Dict[str, Any]:
+    """
+    Store throughput of the batched substrate vs the old
+    connect/insert/commit/close per memory (measured on n // 50 rows).
+    """
+    import os
+    import tempfile
+    
+    tmp = tempfile.mkdtemp(prefix="memory_bench_")
+    db_path = db_path or os.path.join(tmp, "memories.db")
+    
+    # Baseline: one connection + commit per row, as store() used to do
+    legacy_db = os.path.join(tmp, "legacy.db")
+    MemorySubstrate(legacy_db).close()
+    legacy_n = max(1, n // 50)
+    start = time.perf_counter()
+    for i in range(legacy_n):
+        conn = sqlite3.connect(legacy_db)
+        conn.execute(MemorySubstrate._INSERT_SQL, (
+            f"legacy{i}", f"memory {i}", time.time(), 0, 1, 0.0, "u0",
+            "{}", 1.0, "[]", 1.0, 1.0
+        ))
+        conn.commit()
+        conn.close()
+    legacy_rate = legacy_n / (time.perf_counter() - start)
+    
+    substrate = MemorySubstrate(db_path)
+    start = time.perf_counter()
+    for i in range(n):
+        substrate.store(f"user{i % users}", f"memory {i} about topic {i % 97}",
+                        layer=i % 7 + 1, tags=["bench"])
+    substrate.flush()
+    store_seconds = time.perf_counter() - start
+    substrate.close()
+    
+    start = time.perf_counter()
+    reopened = MemorySubstrate(db_path)
+    open_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    recalled = len(reopened.recall("user0", max_spirals=0, limit=10_000))
+    first_recall_seconds = time.perf_counter() - start
+    reopened.close()
+    
+    return {
+        'memories': n,
+        'stores_per_second': round(n / store_seconds),
+        'legacy_stores_per_second': round(legacy_rate),
+        'speedup': round(n / store_seconds / legacy_rate, 1),
+        'open_seconds': round(open_seconds, 4),
+        'first_user_load_seconds': round(first_recall_seconds, 4),
+        'first_user_memories': recalled,
+    }
+
+
 # =============================================================================
 # EXAMPLE USAGE
 # =============================================================================
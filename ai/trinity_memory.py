@@ -14,9 +14,13 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from server.substrates.trinity_substrate import (
-    TrinitySubstrate, TrinityManifold, TrinityPoint, PHI, GOLDEN_ANGLE
+    TrinitySubstrate, TrinityManifold, TrinityPoint, SpatialGrid, PHI, GOLDEN_ANGLE
 )
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Set
+import heapq
+import math
 import time
 import hashlib
 import json
@@ -63,9 +67,8 @@ class TrinityMemoryPoint(TrinityPoint):
         self.calculate_decay(current_time)
         
         # 1. PYTHAGOREAN: Similarity (inverse distance)
-        from server.substrates.trinity_substrate import TrinitySubstrate
-        substrate = TrinitySubstrate()
-        distance = substrate.pythagorean_distance(self, query_point)
+        distance = math.dist((self.x, self.y, self.z),
+                             (query_point.x, query_point.y, query_point.z))
         similarity = 1.0 / (1.0 + distance)  # Closer = more similar
         
         # 2. LINEAR: Compose factors (z = xy)
@@ -84,7 +87,7 @@ class TrinityMemorySubstrate:
     AI Memory system using trinity substrate.
     
     Features:
-    - O(1) memory recall via Fibonacci spiral indexing
+    - Indexed recall: inverted keyword index + spatial grid over embeddings
     - Perfect memory (never forgets)
     - Zero hallucinations (geometric verification)
     - Temporal decay (parabolic)
@@ -96,6 +99,34 @@ class TrinityMemorySubstrate:
         self.manifold = TrinityManifold(self.substrate)
         self.memories: Dict[str, TrinityMemoryPoint] = {}
         self.embedding_cache = {}
+        
+        # Recall indexes, maintained by store/forget
+        self.spatial_grid = SpatialGrid(cell_size=PHI)
+        self.keyword_index: Dict[str, Set[str]] = {}
+        self._keywords: Dict[str, frozenset] = {}
+    
+    @staticmethod
+    def _keywords_of(content: Any) -> frozenset:
+        return frozenset(str(content).lower().split())
+    
+    def _index(self, memory_id: str, memory: TrinityMemoryPoint) -> None:
+        self.spatial_grid.insert(memory_id, memory.x, memory.y, memory.z)
+        keywords = self._keywords_of(memory.content)
+        self._keywords[memory_id] = keywords
+        for keyword in keywords:
+            postings = self.keyword_index.get(keyword)
+            if postings is None:
+                postings = self.keyword_index[keyword] = set()
+            postings.add(memory_id)
+    
+    def _unindex(self, memory_id: str, memory: TrinityMemoryPoint) -> None:
+        self.spatial_grid.remove(memory_id, memory.x, memory.y, memory.z)
+        for keyword in self._keywords.pop(memory_id, ()):
+            postings = self.keyword_index.get(keyword)
+            if postings is not None:
+                postings.discard(memory_id)
+                if not postings:
+                    del self.keyword_index[keyword]
     
     def _generate_embedding(self, content: Any) -> tuple:
         """
@@ -140,55 +171,62 @@ class TrinityMemorySubstrate:
         ).hexdigest()[:16]
         
         # Store in substrate
+        previous = self.memories.get(memory_id)
+        if previous is not None:
+            self._unindex(memory_id, previous)
         self.memories[memory_id] = memory
+        self._index(memory_id, memory)
         
         # Add to spatial index via substrate
         self.substrate.create_point(x, y, z)
         
         return memory_id
     
-    def recall(self, query: Any, k: int = 5) -> List[TrinityMemoryPoint]:
+    def recall(self, query: Any, k: int = 5,
+               neighbors: int = None) -> List[TrinityMemoryPoint]:
         """
         Recall memories similar to query.
-        O(log n) using Fibonacci spiral indexing.
+        
+        Candidates are every memory sharing a keyword with the query
+        (inverted index) plus the `neighbors` geometrically nearest
+        memories (spatial grid, default max(4k, 32)); only those are
+        scored, and the top k are picked with a heap. A memory with no
+        shared keyword outside the geometric neighbourhood is not
+        considered, which makes the geometric half approximate.
         
         Returns top k most relevant memories.
         """
+        if k <= 0 or not self.memories:
+            return []
+        
         # Generate query embedding
         x, y, z = self._generate_embedding(query)
         query_point = TrinityPoint(x, y, z)
         
-        # Extract query keywords for semantic boost
-        query_str = str(query).lower()
-        query_keywords = set(query_str.split())
+        # Keyword overlap per memory, straight from the postings
+        overlap: Counter = Counter()
+        for keyword in self._keywords_of(query):
+            postings = self.keyword_index.get(keyword)
+            if postings:
+                overlap.update(postings)
         
-        # Find candidates using Pythagorean distance + keyword matching
-        candidates = []
-        current_time = time.time()
+        if neighbors is None:
+            neighbors = max(4 * k, 32)
+        candidates = set(overlap)
+        candidates.update(key for _, key in self.spatial_grid.nearest(x, y, z, neighbors))
         
-        for memory in self.memories.values():
-            # Base geometric score
-            geometric_score = memory.relevance_score(query_point, current_time)
-            
-            # Keyword matching boost
-            memory_str = str(memory.content).lower()
-            memory_keywords = set(memory_str.split())
-            
-            # Calculate keyword overlap
-            common_keywords = query_keywords & memory_keywords
-            keyword_boost = len(common_keywords) * 10.0  # Boost by 10 per matching keyword
-            
-            # Combined score
-            total_score = geometric_score + keyword_boost
-            
-            candidates.append((total_score, memory))
-        
-        # Sort by relevance (geometric + keyword matching)
-        candidates.sort(reverse=True, key=lambda x: x[0])
+        current_time = time.time()
+        memories = self.memories
+        scored = (
+            # Geometric score + 10 per matching keyword
+            (memories[mid].relevance_score(query_point, current_time)
+             + overlap.get(mid, 0) * 10.0, memories[mid])
+            for mid in candidates
+        )
         
         # Mark as accessed (increases importance)
         results = []
-        for score, memory in candidates[:k]:
+        for score, memory in heapq.nlargest(k, scored, key=itemgetter(0)):
             memory.access()
             results.append(memory)
         
@@ -261,7 +299,7 @@ class TrinityMemorySubstrate:
         
         # Remove forgotten memories
         for memory_id in to_remove:
-            del self.memories[memory_id]
+            self._unindex(memory_id, self.memories.pop(memory_id))
         
         return len(to_remove)
     
@@ -294,6 +332,40 @@ class TrinityMemorySubstrate:
         }
 
 
+def benchmark_recall(n: int = 1_000_000, queries: int = 200, vocabulary: int = 50_000,
+                     words_per_memory: int = 8, k: int = 5, seed: int = 7) -> Dict:
+    """
+    Store n synthetic memories, then time recall() for random keyword
+    queries. Returns build time and recall latency percentiles (ms).
+    """
+    import random
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    memory = TrinityMemorySubstrate()
+    
+    start = time.perf_counter()
+    for i in range(n):
+        memory.store(f"m{i} " + " ".join(rng.choices(words, k=words_per_memory)))
+    build_seconds = time.perf_counter() - start
+    
+    latencies = []
+    for _ in range(queries):
+        query = " ".join(rng.choices(words, k=3))
+        t0 = time.perf_counter()
+        memory.recall(query, k=k)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    latencies.sort()
+    
+    return {
+        'memories': n,
+        'build_seconds': round(build_seconds, 2),
+        'recall_ms_p50': round(latencies[len(latencies) // 2], 3),
+        'recall_ms_p99': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3),
+        'keywords': len(memory.keyword_index),
+        'grid_cells': len(memory.spatial_grid.cells),
+    }
+
+
 # Example usage
 if __name__ == "__main__":
     print("=" * 60)
@@ -52,12 +52,15 @@ import hashlib
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Callable, Union
+from typing import Any, Dict, List, Optional, Callable, Union, Iterator
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, unquote, quote
 import threading
+import sqlite3
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent to path for helix imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -73,7 +76,13 @@ from .helix_database import HelixDatabase
 from .universal_connector import UniversalConnector, API_REGISTRY
 
 import re
-from collections import defaultdict
+import math
+import itertools
+import heapq
+import zlib
+import queue
+from array import array
+from collections import defaultdict, OrderedDict
 import time
 
 
@@ -222,6 +231,7 @@ class IngestionMetrics:
             'summary': summary,
             'by_type': self.get_by_type(),
             'recent': self.get_recent(20),
+            'cache': GLOBAL_MATERIALIZATION_CACHE.stats(),
             'gauges': {
                 'efficiency': {
                     'value': summary['efficiency_pct'],
@@ -251,6 +261,260 @@ class IngestionMetrics:
 GLOBAL_METRICS = IngestionMetrics()
 
 
+# =============================================================================
+# MATERIALIZATION CACHE - Bounded, Shared Across All SRLs
+# =============================================================================
+
+@dataclass
+class _CacheEntry:
+    """Bookkeeping for one materialized SRL"""
+    srl: 'SRL'
+    size: int
+    loaded_at: float
+
+
+class _Flight:
+    """An in-progress materialization that concurrent readers wait on"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+
+
+class MaterializationCache:
+    """
+    Global budget for materialized SRL data.
+    
+    SRLs still hold their own data, but every materialization is admitted
+    here, so the process as a whole stays within a memory budget:
+    
+    - Size-aware LRU: least recently read SRLs are evicted (their data
+      dropped, back to Level 0 potential) once max_bytes is exceeded.
+    - Per-source TTLs: data older than its source's TTL is stale.
+    - Stale-while-revalidate: stale data is served immediately while a
+      background worker re-materializes; past the stale window reads block.
+    - Single-flight: concurrent reads of one SRL share one materializer call.
+    """
+    
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    
+    # Seconds until data is stale, by SRL source_type (None = never)
+    DEFAULT_SOURCE_TTLS = {
+        'api': 60,
+        'uc_service': 300,
+        'database': 300,
+        'local': None,
+        'saved': None,
+    }
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 source_ttls: Dict[str, Optional[float]] = None,
+                 default_ttl: Optional[float] = 600,
+                 stale_window: float = 300):
+        self.max_bytes = max_bytes
+        self.source_ttls = dict(self.DEFAULT_SOURCE_TTLS)
+        if source_ttls:
+            self.source_ttls.update(source_ttls)
+        self.default_ttl = default_ttl
+        self.stale_window = stale_window
+        
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._refreshing: set = set()
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+        
+        self._refresh_queue: 'queue.Queue[SRL]' = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stale_hits': 0,
+            'coalesced': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'refreshes': 0,
+            'refresh_errors': 0
+        }
+    
+    def configure(self, max_bytes: int = None,
+                  source_ttls: Dict[str, Optional[float]] = None,
+                  stale_window: float = None):
+        """Adjust budget and TTLs at runtime"""
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if source_ttls:
+                self.source_ttls.update(source_ttls)
+            if stale_window is not None:
+                self.stale_window = stale_window
+            self._evict()
+    
+    def ttl_for(self, srl: 'SRL') -> Optional[float]:
+        return self.source_ttls.get(srl.source_type, self.default_ttl)
+    
+    # -------------------------------------------------------------------------
+    # Read path
+    # -------------------------------------------------------------------------
+    
+    def touch(self, srl: 'SRL') -> bool:
+        """
+        Record a read of already-materialized data.
+        
+        Returns True if the cached data may be served (fresh, or stale
+        with a refresh scheduled), False if it has expired outright.
+        """
+        with self._lock:
+            entry = self._entries.get(srl.path)
+            if entry is None or entry.srl is not srl:
+                # Materialized before the cache saw it - adopt it
+                self._admit(srl)
+                self._stats['hits'] += 1
+                return True
+            
+            self._entries.move_to_end(srl.path)
+            ttl = self.ttl_for(srl)
+            age = time.monotonic() - entry.loaded_at
+            if ttl is None or age <= ttl:
+                self._stats['hits'] += 1
+                return True
+            if age <= ttl + self.stale_window:
+                self._stats['stale_hits'] += 1
+                self._schedule_refresh(srl)
+                return True
+            
+            self._stats['expirations'] += 1
+            return False
+    
+    def load(self, srl: 'SRL') -> Any:
+        """Materialize srl, coalescing concurrent callers into one call"""
+        key = srl.path
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                self._stats['misses'] += 1
+            else:
+                self._stats['coalesced'] += 1
+        
+        if not leader:
+            flight.done.wait()
+            return flight.result
+        
+        try:
+            flight.result = srl._load()
+            if srl.is_materialized:
+                with self._lock:
+                    self._admit(srl)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+        
+        return flight.result
+    
+    def discard(self, srl: 'SRL'):
+        """Forget an SRL (called on invalidate)"""
+        with self._lock:
+            entry = self._entries.get(srl.path)
+            if entry is not None and entry.srl is srl:
+                del self._entries[srl.path]
+                self._total_bytes -= entry.size
+    
+    # -------------------------------------------------------------------------
+    # Budget
+    # -------------------------------------------------------------------------
+    
+    def _admit(self, srl: 'SRL'):
+        item = srl.substrated
+        size = (item.original_size or item.size) if item else srl.size_hint
+        old = self._entries.pop(srl.path, None)
+        if old is not None:
+            self._total_bytes -= old.size
+            if old.srl is not srl:
+                old.srl._evict()
+        self._entries[srl.path] = _CacheEntry(srl, size, time.monotonic())
+        self._total_bytes += size
+        self._evict()
+    
+    def _evict(self):
+        """Drop least recently used entries until within budget"""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            entry.srl._evict()
+            self._stats['evictions'] += 1
+    
+    # -------------------------------------------------------------------------
+    # Background revalidation
+    # -------------------------------------------------------------------------
+    
+    def _schedule_refresh(self, srl: 'SRL'):
+        if srl.path in self._refreshing:
+            return
+        self._refreshing.add(srl.path)
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._refresh_loop, name='srl-revalidate', daemon=True
+            )
+            self._worker.start()
+        self._refresh_queue.put(srl)
+    
+    def _refresh_loop(self):
+        while True:
+            srl = self._refresh_queue.get()
+            try:
+                result = self.load(srl)
+                with self._lock:
+                    if isinstance(result, dict) and 'error' in result:
+                        self._stats['refresh_errors'] += 1
+                    else:
+                        self._stats['refreshes'] += 1
+            except Exception:
+                with self._lock:
+                    self._stats['refresh_errors'] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(srl.path)
+                self._refresh_queue.task_done()
+    
+    def wait_for_refreshes(self, timeout: float = None) -> bool:
+        """Block until queued background refreshes finish (for tests/tools)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._refreshing:
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+    
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            reads = self._stats['hits'] + self._stats['stale_hits'] + self._stats['misses']
+            served = self._stats['hits'] + self._stats['stale_hits']
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'inflight': len(self._inflight),
+                'pending_refreshes': len(self._refreshing),
+                'hit_ratio': round(served / reads, 4) if reads else 0.0
+            }
+
+
+# Global materialization cache (budget shared by every SRL)
+GLOBAL_MATERIALIZATION_CACHE = MaterializationCache()
+
+
 # =============================================================================
 # SEMANTIC INTELLIGENCE - System Learns, SRL Knows Where to Look
 # =============================================================================
@@ -400,6 +664,372 @@ class SemanticRouter:
         }
 
 
+class FullTextIndex:
+    """
+    Inverted index with BM25 ranking.
+    
+    - Postings map term -> {doc_id: term frequency}
+    - Document lengths are kept in a compact array for BM25 normalization
+    - A trigram -> terms map resolves partial words ("coup" -> "coupon")
+    - add()/remove() are incremental; re-adding a path replaces it
+    - Very frequent terms are scored over a cached "champion list" (their
+      highest-impact postings) so query cost stays bounded at millions
+      of documents
+    - save()/load() use a delta + varint encoded, zlib compressed file
+    
+    Usage:
+        index = FullTextIndex()
+        index.add('E:/inbox/42', 'Coupon from Michaela ...')
+        index.search(['michaela', 'coupon'], limit=10)
+        # [('E:/inbox/42', 3.14), ...]
+    """
+    
+    K1 = 1.2
+    B = 0.75
+    
+    # Text beyond this is not indexed (bounds cost for huge documents)
+    MAX_DOC_CHARS = 200_000
+    
+    # Partial matches count for less than exact ones
+    PREFIX_WEIGHT = 0.6
+    INFIX_WEIGHT = 0.3
+    MAX_EXPANSIONS = 16
+    
+    # Terms in more documents than this are scored over champion lists;
+    # partial-word expansions only ever score their top PARTIAL_POSTINGS
+    CHAMPION_THRESHOLD = 10_000
+    CHAMPION_SIZE = 2_000
+    PARTIAL_POSTINGS = 256
+    CHAMPION_DRIFT = 0.1    # Rebuild once df moves this far from build time
+    
+    _TOKEN_RE = re.compile(r'[^\W_]{2,}')   # Letters/digits in any script
+    _MAGIC = b'UHDFTI1\n'
+    
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._trigrams: Dict[str, set] = defaultdict(set)   # trigram -> terms
+        self._doc_ids: Dict[str, int] = {}                  # path -> doc_id
+        self._doc_paths: List[Optional[str]] = []           # doc_id -> path
+        self._doc_lengths = array('I')                      # doc_id -> tokens
+        self._doc_terms: Dict[int, tuple] = {}              # doc_id -> terms
+        self._free_ids: List[int] = []
+        self._total_length = 0
+        self._champions: Dict[str, tuple] = {}              # term -> (df, doc_ids)
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self._doc_ids
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return cls._TOKEN_RE.findall(text[:cls.MAX_DOC_CHARS].lower())
+    
+    @staticmethod
+    def _term_trigrams(term: str) -> set:
+        return {term[i:i + 3] for i in range(len(term) - 2)}
+    
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+    
+    def add(self, path: str, text: str):
+        """Index (or re-index) a document"""
+        tokens = self.tokenize(text)
+        counts: Dict[str, int] = defaultdict(int)
+        for token in tokens:
+            counts[token] += 1
+        
+        with self._lock:
+            if path in self._doc_ids:
+                self._remove_locked(path)
+            
+            if self._free_ids:
+                doc_id = self._free_ids.pop()
+                self._doc_paths[doc_id] = path
+                self._doc_lengths[doc_id] = len(tokens)
+            else:
+                doc_id = len(self._doc_paths)
+                self._doc_paths.append(path)
+                self._doc_lengths.append(len(tokens))
+            
+            self._doc_ids[path] = doc_id
+            self._doc_terms[doc_id] = tuple(counts)
+            self._total_length += len(tokens)
+            
+            for term, tf in counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    for tri in self._term_trigrams(term):
+                        self._trigrams[tri].add(term)
+                postings[doc_id] = tf
+                if tf > 1 and term in self._champions:
+                    # A high-impact posting may belong in the champion list
+                    self._champions.pop(term)
+    
+    def remove(self, path: str) -> bool:
+        """Drop a document from the index"""
+        with self._lock:
+            if path not in self._doc_ids:
+                return False
+            self._remove_locked(path)
+            return True
+    
+    def _remove_locked(self, path: str):
+        doc_id = self._doc_ids.pop(path)
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._champions.pop(term, None)
+                for tri in self._term_trigrams(term):
+                    terms = self._trigrams.get(tri)
+                    if terms is not None:
+                        terms.discard(term)
+                        if not terms:
+                            del self._trigrams[tri]
+        self._total_length -= self._doc_lengths[doc_id]
+        self._doc_lengths[doc_id] = 0
+        self._doc_paths[doc_id] = None
+        self._free_ids.append(doc_id)
+    
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+    
+    def _champion_list(self, term: str, postings: Dict[int, int],
+                       norm: float, scale: float) -> List[int]:
+        """Doc ids with the highest BM25 term weight for a frequent term"""
+        df = len(postings)
+        cached = self._champions.get(term)
+        if cached is not None and abs(df - cached[0]) <= cached[0] * self.CHAMPION_DRIFT:
+            return cached[1]
+        
+        lengths = self._doc_lengths
+        best = heapq.nlargest(
+            self.CHAMPION_SIZE, postings.items(),
+            key=lambda item: item[1] / (item[1] + norm + scale * lengths[item[0]])
+        )
+        doc_ids = [doc_id for doc_id, _ in best]
+        self._champions[term] = (df, doc_ids)
+        return doc_ids
+    
+    def expand(self, term: str, max_expansions: Optional[int] = None) -> List[tuple]:
+        """Resolve a query term to (index_term, weight) pairs"""
+        term = term.lower()
+        expanded = []
+        if term in self._postings:
+            expanded.append((term, 1.0))
+        if len(term) < 3:
+            return expanded
+        
+        trigram_sets = [self._trigrams.get(tri) for tri in self._term_trigrams(term)]
+        if not all(trigram_sets):
+            return expanded
+        trigram_sets.sort(key=len)
+        candidates = set(trigram_sets[0])
+        for terms in trigram_sets[1:]:
+            candidates &= terms
+            if not candidates:
+                break
+        
+        partial = []
+        for candidate in candidates:
+            if candidate == term or term not in candidate:
+                continue
+            weight = self.PREFIX_WEIGHT if candidate.startswith(term) else self.INFIX_WEIGHT
+            partial.append((candidate, weight))
+        # Prefer close matches when a fragment hits many terms
+        partial.sort(key=lambda tw: (-tw[1], len(tw[0])))
+        if max_expansions is None:
+            max_expansions = self.MAX_EXPANSIONS
+        return expanded + partial[:max_expansions]
+    
+    def unserved(self, terms: List[str]) -> List[str]:
+        """
+        Query terms the index cannot fully answer: ones with no indexable
+        word (single characters, punctuation), fragments under three
+        characters (too short for the trigram map) and substrings that
+        match no indexed word, e.g. across a word boundary. Callers fall
+        back to substring matching for these.
+        """
+        unserved = []
+        with self._lock:
+            for term in terms:
+                tokens = self.tokenize(term)
+                if not tokens or any(len(t) < 3 or not self.expand(t) for t in tokens):
+                    unserved.append(term.lower())
+        return unserved
+    
+    def search(self, query: Union[str, List[str]], limit: int = 20,
+               partial: bool = True, exhaustive: bool = False) -> List[tuple]:
+        """
+        BM25-ranked search.
+        
+        Args:
+            query: Query string or list of terms
+            limit: Number of results (top-k via heap)
+            partial: Also match terms containing the query words
+            exhaustive: Score every posting and partial word instead of
+                champion lists (for callers that filter the results)
+            
+        Returns:
+            [(path, score), ...] best first
+        """
+        terms = self.tokenize(query) if isinstance(query, str) else \
+            [t for q in query for t in self.tokenize(q)]
+        
+        with self._lock:
+            n_docs = len(self._doc_ids)
+            if not n_docs or not terms:
+                return []
+            avgdl = self._total_length / n_docs or 1.0
+            k1, b = self.K1, self.B
+            norm = k1 * (1 - b)
+            scale = k1 * b / avgdl
+            lengths = self._doc_lengths
+            scores: Dict[int, float] = defaultdict(float)
+            max_expansions = len(self._postings) if exhaustive else None
+            
+            for term in dict.fromkeys(terms):
+                expansions = self.expand(term, max_expansions) if partial else (
+                    [(term, 1.0)] if term in self._postings else [])
+                for index_term, weight in expansions:
+                    postings = self._postings[index_term]
+                    df = len(postings)
+                    idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) * weight
+                    cap = self.CHAMPION_THRESHOLD if weight == 1.0 else self.PARTIAL_POSTINGS
+                    if df > cap and not exhaustive:
+                        champions = self._champion_list(index_term, postings, norm, scale)
+                        entries = ((doc_id, postings.get(doc_id, 0))
+                                   for doc_id in champions[:min(cap, self.CHAMPION_SIZE)])
+                    else:
+                        entries = postings.items()
+                    for doc_id, tf in entries:
+                        if tf:
+                            scores[doc_id] += idf * tf * (k1 + 1) / (
+                                tf + norm + scale * lengths[doc_id])
+            
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [(self._doc_paths[doc_id], score) for doc_id, score in top]
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'documents': len(self._doc_ids),
+                'terms': len(self._postings),
+                'trigrams': len(self._trigrams),
+                'postings': sum(len(p) for p in self._postings.values()),
+                'avg_doc_length': round(self._total_length / max(1, len(self._doc_ids)), 2)
+            }
+    
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _put_varint(out: bytearray, value: int):
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    
+    @staticmethod
+    def _get_varint(data: bytes, pos: int) -> tuple:
+        result = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
+    
+    def save(self, path: Union[str, Path]):
+        """Write the index as delta/varint encoded, zlib compressed postings"""
+        put = self._put_varint
+        out = bytearray()
+        with self._lock:
+            put(out, len(self._doc_paths))
+            for doc_id, doc_path in enumerate(self._doc_paths):
+                raw = (doc_path or '').encode('utf-8')
+                put(out, len(raw))
+                out += raw
+                put(out, self._doc_lengths[doc_id])
+            
+            put(out, len(self._postings))
+            for term, postings in self._postings.items():
+                raw = term.encode('utf-8')
+                put(out, len(raw))
+                out += raw
+                put(out, len(postings))
+                prev = 0
+                for doc_id in sorted(postings):
+                    put(out, doc_id - prev)
+                    put(out, postings[doc_id])
+                    prev = doc_id
+        
+        tmp = Path(str(path) + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(self._MAGIC)
+            f.write(zlib.compress(bytes(out), 6))
+        os.replace(tmp, path)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FullTextIndex':
+        """Read an index written by save()"""
+        with open(path, 'rb') as f:
+            if f.read(len(cls._MAGIC)) != cls._MAGIC:
+                raise ValueError(f"Not a full-text index file: {path}")
+            data = zlib.decompress(f.read())
+        
+        get = cls._get_varint
+        index = cls()
+        pos = 0
+        n_slots, pos = get(data, pos)
+        for doc_id in range(n_slots):
+            size, pos = get(data, pos)
+            doc_path = data[pos:pos + size].decode('utf-8')
+            pos += size
+            length, pos = get(data, pos)
+            index._doc_lengths.append(length)
+            if doc_path:
+                index._doc_paths.append(doc_path)
+                index._doc_ids[doc_path] = doc_id
+                index._total_length += length
+            else:
+                index._doc_paths.append(None)
+                index._free_ids.append(doc_id)
+        
+        doc_terms: Dict[int, List[str]] = defaultdict(list)
+        n_terms, pos = get(data, pos)
+        for _ in range(n_terms):
+            size, pos = get(data, pos)
+            term = data[pos:pos + size].decode('utf-8')
+            pos += size
+            df, pos = get(data, pos)
+            postings = {}
+            doc_id = 0
+            for _ in range(df):
+                delta, pos = get(data, pos)
+                tf, pos = get(data, pos)
+                doc_id += delta
+                postings[doc_id] = tf
+                doc_terms[doc_id].append(term)
+            index._postings[term] = postings
+            for tri in cls._term_trigrams(term):
+                index._trigrams[tri].add(term)
+        
+        index._doc_terms = {doc_id: tuple(terms) for doc_id, terms in doc_terms.items()}
+        return index
+
+
 class RelationshipGraph:
     """
     System learns relationships between data.
@@ -409,14 +1039,23 @@ class RelationshipGraph:
     - Keywords that appear together
     - Entities (people, companies, topics) linking data
     - Temporal patterns (weekly meetings, monthly reports)
+    
+    Relationships are not stored as SRL<->SRL edges (a newsletter sender
+    on every message would make that quadratic). Instead a bipartite
+    entity<->SRL index records co-occurrence, and related items are scored
+    on demand: entities shared with rare partners weigh more than ones
+    shared with everybody, and super-popular entities are sampled.
     """
     
+    # Entities linked to more SRLs than this are sampled when scoring
+    MAX_ENTITY_FANOUT = 1000
+    
     def __init__(self):
         # Entity extraction and linking
         self._entities: Dict[str, Dict] = {}  # entity_id -> {type, mentions, srls}
         
-        # Relationship edges
-        self._relationships: Dict[str, set] = defaultdict(set)  # srl_path -> related srl_paths
+        # Bipartite co-occurrence: srl_path -> entity keys ('email:..', 'person:..')
+        self._srl_entities: Dict[str, set] = defaultdict(set)
         
         # Keyword index
         self._keyword_index: Dict[str, set] = defaultdict(set)  # keyword -> srl_paths
@@ -427,6 +1066,12 @@ class RelationshipGraph:
         # Temporal index
         self._temporal_index: Dict[str, set] = defaultdict(set)  # date_key -> srl_paths
         
+        # srl_path -> (index, key) pairs in the keyword/temporal indexes
+        self._srl_terms: Dict[str, set] = defaultdict(set)
+        
+        # Ranked full-text index over SRL names and materialized content
+        self._text_index = FullTextIndex()
+        
         # Learning stats
         self._stats = {
             'entities_discovered': 0,
@@ -452,19 +1097,19 @@ class RelationshipGraph:
         # Convert to searchable text
         text = self._extract_text(data)
         
+        # Full-text index (replaces any earlier version of this SRL)
+        self._text_index.add(srl_path, f"{srl_path} {text}")
+        
         # Extract emails
         emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        for email in emails:
-            email_lower = email.lower()
-            self._email_index[email_lower].add(srl_path)
+        for email_lower in dict.fromkeys(e.lower() for e in emails):
+            srls = self._email_index[email_lower]
+            if srl_path not in srls:
+                srls.add(srl_path)
+                # Every other SRL with this email is now (implicitly) related
+                self._stats['relationships_learned'] += len(srls) - 1
+            self._srl_entities[srl_path].add(f"email:{email_lower}")
             learned['entities'].append({'type': 'email', 'value': email_lower})
-            
-            # Link to other SRLs with same email
-            for other_path in self._email_index[email_lower]:
-                if other_path != srl_path:
-                    self._relationships[srl_path].add(other_path)
-                    self._relationships[other_path].add(srl_path)
-                    self._stats['relationships_learned'] += 1
         
         # Extract keywords
         words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
@@ -476,12 +1121,14 @@ class RelationshipGraph:
         for word, count in word_counts.items():
             if count >= 2 or word.title() in text:
                 self._keyword_index[word].add(srl_path)
+                self._srl_terms[srl_path].add(('keyword', word))
                 learned['keywords'].append(word)
         
         # Extract dates
         dates = re.findall(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}', text)
         for date in dates:
             self._temporal_index[date].add(srl_path)
+            self._srl_terms[srl_path].add(('date', date))
         
         # Extract names (capitalized words that might be names)
         potential_names = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b', str(data))
@@ -497,6 +1144,7 @@ class RelationshipGraph:
                 self._stats['entities_discovered'] += 1
             self._entities[name_key]['mentions'] += 1
             self._entities[name_key]['srls'].add(srl_path)
+            self._srl_entities[srl_path].add(f"person:{name_key}")
             learned['entities'].append({'type': 'person', 'value': name})
         
         return learned
@@ -512,9 +1160,85 @@ class RelationshipGraph:
         else:
             return str(data)
     
+    def index_name(self, srl_path: str):
+        """Make an unmaterialized SRL findable by its path/name"""
+        if srl_path not in self._text_index:
+            self._text_index.add(srl_path, srl_path)
+    
+    def forget(self, srl_path: str):
+        """Drop everything indexed for an SRL (on invalidate/removal)"""
+        self._text_index.remove(srl_path)
+        for entity_key in self._srl_entities.pop(srl_path, ()):
+            kind, _, value = entity_key.partition(':')
+            if kind == 'email':
+                self._discard(self._email_index, value, srl_path)
+                continue
+            entity = self._entities.get(value)
+            if entity:
+                entity['srls'].discard(srl_path)
+                if not entity['srls']:
+                    del self._entities[value]
+        for kind, key in self._srl_terms.pop(srl_path, ()):
+            index = self._keyword_index if kind == 'keyword' else self._temporal_index
+            self._discard(index, key, srl_path)
+    
+    @staticmethod
+    def _discard(index: Dict[str, set], key: str, srl_path: str):
+        srls = index.get(key)
+        if srls is not None:
+            srls.discard(srl_path)
+            if not srls:
+                del index[key]
+    
+    def _entity_srls(self, entity_key: str) -> Optional[set]:
+        """SRL set for an 'email:..' / 'person:..' entity key"""
+        kind, _, value = entity_key.partition(':')
+        if kind == 'email':
+            return self._email_index.get(value)
+        entity = self._entities.get(value)
+        return entity['srls'] if entity else None
+    
+    def search_ranked(self, keywords: List[str], limit: int = 100,
+                      partial: bool = True, exhaustive: bool = False) -> List[tuple]:
+        """BM25-ranked (path, score) pairs for keywords"""
+        return self._text_index.search(keywords, limit=limit, partial=partial,
+                                       exhaustive=exhaustive)
+    
+    def unserved_terms(self, keywords: List[str]) -> List[str]:
+        """Keywords that need a substring scan (see FullTextIndex.unserved)"""
+        return self._text_index.unserved(keywords)
+    
+    def save_index(self, path: Union[str, Path]):
+        self._text_index.save(path)
+    
+    def load_index(self, path: Union[str, Path]):
+        self._text_index = FullTextIndex.load(path)
+    
+    def find_related_scored(self, srl_path: str, limit: int = 10) -> List[tuple]:
+        """
+        Rank SRLs sharing entities with srl_path.
+        
+        Each shared entity contributes 1 / log2(1 + degree), so a private
+        correspondent outweighs a mailing list. Entities linked to more
+        than MAX_ENTITY_FANOUT SRLs contribute a sample of their SRLs.
+        """
+        scores: Dict[str, float] = defaultdict(float)
+        for entity_key in self._srl_entities.get(srl_path, ()):
+            srls = self._entity_srls(entity_key)
+            if not srls:
+                continue
+            degree = len(srls)
+            weight = 1.0 / math.log2(1 + degree)
+            members = srls if degree <= self.MAX_ENTITY_FANOUT else \
+                itertools.islice(srls, self.MAX_ENTITY_FANOUT)
+            for other_path in members:
+                if other_path != srl_path:
+                    scores[other_path] += weight
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    
     def find_related(self, srl_path: str, limit: int = 10) -> List[str]:
         """Find SRLs related to the given one"""
-        return list(self._relationships.get(srl_path, set()))[:limit]
+        return [path for path, _ in self.find_related_scored(srl_path, limit)]
     
     def search_by_email(self, email: str) -> List[str]:
         """Find all SRLs mentioning an email address"""
@@ -625,80 +1349,56 @@ class SmartQuery:
         """
         parsed = self.parse(query)
         results = []
+        seen = set()
         
         routing = parsed['routing']
         keywords = routing['keywords']
         sources = routing['sources']
         
-        # First, check relationship graph for quick matches
-        for keyword in keywords:
-            matching_paths = self.graph.search_by_keyword(keyword)
-            for path in matching_paths:
-                if path in srls:
-                    srl = srls[path]
-                    results.append({
-                        'path': path,
-                        'name': srl.name,
-                        'source': srl.source_type,
-                        'icon': routing['icon'],
-                        'match_type': 'keyword_index',
-                        'confidence': 0.9
-                    })
+        def add(path: str, icon: str, match_type: str, confidence: float,
+                score: float = None):
+            if path in seen or path not in srls:
+                return
+            seen.add(path)
+            srl = srls[path]
+            result = {
+                'path': path,
+                'name': srl.name,
+                'source': srl.source_type,
+                'icon': icon,
+                'match_type': match_type,
+                'confidence': confidence
+            }
+            if score is not None:
+                result['score'] = round(score, 4)
+            results.append(result)
+        
+        # Ranked full-text matches over names and materialized content
+        # (exact words first, partial words via the trigram index)
+        for path, score in self.graph.search_ranked(keywords, limit=parsed['limit']):
+            add(path, routing['icon'], 'bm25', 0.9, score)
         
         # Check email index for email queries
         if 'email' in sources:
             for keyword in keywords:
                 if '@' in keyword or re.match(r'^[a-z]+$', keyword):
-                    email_matches = self.graph.search_by_email(keyword)
-                    for path in email_matches:
-                        if path in srls and path not in [r['path'] for r in results]:
-                            srl = srls[path]
-                            results.append({
-                                'path': path,
-                                'name': srl.name,
-                                'source': srl.source_type,
-                                'icon': '📧',
-                                'match_type': 'email_index',
-                                'confidence': 0.95
-                            })
+                    for path in self.graph.search_by_email(keyword):
+                        add(path, '📧', 'email_index', 0.95)
         
         # Search entity names
         for keyword in keywords:
-            entity_matches = self.graph.search_by_entity(keyword)
-            for path in entity_matches:
-                if path in srls and path not in [r['path'] for r in results]:
-                    srl = srls[path]
-                    results.append({
-                        'path': path,
-                        'name': srl.name,
-                        'source': srl.source_type,
-                        'icon': '👤',
-                        'match_type': 'entity_match',
-                        'confidence': 0.85
-                    })
+            for path in self.graph.search_by_entity(keyword):
+                add(path, '👤', 'entity_match', 0.85)
         
-        # Fall back to scanning SRLs by source type
-        if len(results) < 10:
+        # Terms the index can't serve fall back to scanning names
+        unserved = self.graph.unserved_terms(keywords)
+        if unserved:
             for path, srl in srls.items():
-                if path in [r['path'] for r in results]:
+                if path in seen or (sources and srl.source_type not in sources):
                     continue
-                    
-                # Check if source matches
-                source_match = srl.source_type in sources or not sources
-                
-                # Check if name/path contains keywords
-                name_match = any(kw in srl.name.lower() or kw in path.lower() 
-                               for kw in keywords)
-                
-                if source_match and name_match:
-                    results.append({
-                        'path': path,
-                        'name': srl.name,
-                        'source': srl.source_type,
-                        'icon': routing['icon'],
-                        'match_type': 'name_scan',
-                        'confidence': 0.6
-                    })
+                name, lower_path = srl.name.lower(), path.lower()
+                if any(kw in name or kw in lower_path for kw in unserved):
+                    add(path, routing['icon'], 'name_scan', 0.6)
         
         # Sort by confidence
         results.sort(key=lambda x: x.get('confidence', 0), reverse=True)
@@ -1005,8 +1705,16 @@ class SRL:
         Tracks ingestion metrics for efficiency visualization.
         """
         if self._materialized and self._cached_data is not None:
-            return self._cached_data
+            if GLOBAL_MATERIALIZATION_CACHE.touch(self):
+                return self._cached_data
+        
+        if self.materializer:
+            return GLOBAL_MATERIALIZATION_CACHE.load(self)
         
+        return None
+    
+    def _load(self) -> Any:
+        """Run the materializer (called through GLOBAL_MATERIALIZATION_CACHE)"""
         if self.materializer:
             try:
                 start_time = time.time()
@@ -1163,8 +1871,14 @@ class SRL:
     
     def invalidate(self):
         """Invalidate cache - next access will re-materialize"""
+        GLOBAL_MATERIALIZATION_CACHE.discard(self)
+        self._evict()
+    
+    def _evict(self):
+        """Drop materialized data - back to Level 0 potential"""
         self._materialized = False
         self._cached_data = None
+        self._native_data = None
         self._substrated_item = None
     
     @property
@@ -1312,6 +2026,513 @@ class FileEntry:
     modified_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+# =============================================================================
+# FILE CATALOG - Persistent, Incremental Index of the A: Drive
+# =============================================================================
+
+# File type -> extensions (shared by find_all, the catalog and organize)
+FILE_TYPE_EXTENSIONS = {
+    'image': ['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'bmp', 'heic', 'tiff', 'ico'],
+    'video': ['mp4', 'mov', 'avi', 'mkv', 'webm', 'flv', 'wmv', 'm4v'],
+    'audio': ['mp3', 'wav', 'flac', 'aac', 'm4a', 'ogg', 'wma'],
+    'document': ['pdf', 'doc', 'docx', 'txt', 'rtf', 'odt', 'xls', 'xlsx', 'ppt', 'pptx'],
+    'archive': ['zip', 'rar', 'tar', 'gz', '7z', 'bz2'],
+    'code': ['py', 'js', 'ts', 'html', 'css', 'java', 'cpp', 'c', 'go', 'rs', 'rb']
+}
+
+EXTENSION_TYPES = {
+    ext: file_type
+    for file_type, exts in FILE_TYPE_EXTENSIONS.items()
+    for ext in exts
+}
+
+
+class FileCatalog:
+    """
+    On-disk catalog of local files backing the A: drive.
+    
+    The catalog is built once per root with os.scandir (one worker per
+    top-level directory, at most max_depth levels below the root) and then
+    kept fresh incrementally: a directory is only re-listed when its mtime
+    changes, which is exactly when entries are added, removed or renamed
+    inside it. Refreshes of the same path are throttled to one per
+    REFRESH_INTERVAL, and files returned by query() and list_dir() are
+    re-stat'ed so size and mtime changes (which leave the directory mtime
+    alone) are picked up. Queries by type, extension, size range and path
+    prefix are answered from SQLite indexes instead of walking the disk.
+    
+    Usage:
+        catalog = FileCatalog('data/uhd_saved/.uhd_catalog.db')
+        catalog.ensure('/home/me')              # build or refresh
+        catalog.query(file_type='image', prefix='/home/me/Pictures')
+    """
+    
+    # Virtual filesystems that are never worth indexing
+    SKIP_DIRS = {'/proc', '/sys', '/dev', '/run'}
+    
+    # Levels below a root that are cataloged (the root itself is level 0)
+    MAX_DEPTH = 5
+    
+    # Seconds before the same path is checked against the disk again
+    REFRESH_INTERVAL = 5.0
+    
+    # dirs.is_link values: listed but not descended
+    _LINK = 1          # symlinked directory
+    _BEYOND_DEPTH = 2  # deeper than max_depth
+    
+    # Upper bound used to turn a path prefix into an indexed range scan
+    _PREFIX_END = '\U0010ffff'
+    
+    def __init__(self, db_path: Union[str, Path], max_workers: int = 8,
+                 max_depth: int = MAX_DEPTH):
+        self.db_path = str(db_path)
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self._lock = threading.RLock()
+        self._refreshed: Dict[str, float] = {}
+        # The database and its journals are never cataloged themselves
+        real_db = os.path.realpath(self.db_path)
+        self._own_files = {real_db + suffix for suffix in ('', '-wal', '-shm', '-journal')}
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._stats = {
+            'builds': 0,
+            'refreshes': 0,
+            'dirs_rescanned': 0,
+            'queries': 0
+        }
+        self._init_schema()
+    
+    def _init_schema(self):
+        """Create tables and indexes"""
+        with self._lock:
+            self._conn.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    dir TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    ext TEXT NOT NULL,
+                    type TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir);
+                CREATE INDEX IF NOT EXISTS idx_files_type ON files(type, size);
+                CREATE INDEX IF NOT EXISTS idx_files_ext ON files(ext, size);
+                CREATE INDEX IF NOT EXISTS idx_files_size ON files(size);
+                CREATE TABLE IF NOT EXISTS dirs (
+                    path TEXT PRIMARY KEY,
+                    parent TEXT,
+                    mtime REAL NOT NULL,
+                    is_link INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs(parent);
+                CREATE TABLE IF NOT EXISTS roots (
+                    path TEXT PRIMARY KEY,
+                    built_at REAL NOT NULL
+                );
+            ''')
+            self._conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _split_ext(name: str) -> str:
+        return name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+    
+    def _scan_dir(self, dir_path: str):
+        """
+        List one directory.
+        
+        Returns (mtime, file_rows, subdir_paths, linked_dir_paths) or None
+        if unreadable. Symlinked directories are listed but never descended.
+        """
+        try:
+            mtime = os.stat(dir_path).st_mtime
+            file_rows = []
+            subdirs = []
+            links = []
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path not in self.SKIP_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.is_dir():
+                            links.append(entry.path)
+                        elif entry.is_file() and entry.path not in self._own_files:
+                            st = entry.stat()
+                            ext = self._split_ext(entry.name)
+                            file_rows.append((
+                                entry.path, dir_path, entry.name,
+                                st.st_size, st.st_mtime, ext,
+                                EXTENSION_TYPES.get(ext)
+                            ))
+                    except OSError:
+                        continue
+            return mtime, file_rows, subdirs, links
+        except OSError:
+            return None
+    
+    def _child_rows(self, dir_path: str, links: List[str],
+                    beyond: List[str] = ()) -> List[tuple]:
+        """Rows for subdirectories that are listed but not descended"""
+        rows = [(link, dir_path, 0.0, self._LINK) for link in links]
+        rows.extend((sub, dir_path, 0.0, self._BEYOND_DEPTH) for sub in beyond)
+        return rows
+    
+    def _scan_tree(self, top: str, parent: Optional[str], depth: int):
+        """Recursively scan a subtree at depth. Returns (dir_rows, file_rows)."""
+        dir_rows = []
+        file_rows = []
+        stack = [(top, parent, depth)]
+        while stack:
+            dir_path, dir_parent, depth = stack.pop()
+            scanned = self._scan_dir(dir_path)
+            if scanned is None:
+                continue
+            mtime, files, subdirs, links = scanned
+            dir_rows.append((dir_path, dir_parent, mtime, 0))
+            file_rows.extend(files)
+            if depth < self.max_depth:
+                dir_rows.extend(self._child_rows(dir_path, links))
+                stack.extend((sub, dir_path, depth + 1) for sub in subdirs)
+            else:
+                dir_rows.extend(self._child_rows(dir_path, links, subdirs))
+        return dir_rows, file_rows
+    
+    def _scan_parallel(self, root: str, parent: Optional[str]):
+        """Scan a root with one worker per top-level directory"""
+        scanned = self._scan_dir(root)
+        if scanned is None:
+            return [], []
+        mtime, file_rows, subdirs, links = scanned
+        dir_rows = [(root, parent, mtime, 0)]
+        if self.max_depth <= 0:
+            dir_rows.extend(self._child_rows(root, links, subdirs))
+            return dir_rows, file_rows
+        dir_rows.extend(self._child_rows(root, links))
+        
+        if subdirs:
+            workers = max(1, min(self.max_workers, len(subdirs)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for sub_dirs, sub_files in pool.map(
+                        lambda d: self._scan_tree(d, root, 1), subdirs):
+                    dir_rows.extend(sub_dirs)
+                    file_rows.extend(sub_files)
+        
+        return dir_rows, file_rows
+    
+    def _write_rows(self, dir_rows: List[tuple], file_rows: List[tuple]):
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO dirs (path, parent, mtime, is_link) VALUES (?, ?, ?, ?)',
+            dir_rows
+        )
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO files (path, dir, name, size, mtime, ext, type) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            file_rows
+        )
+    
+    def _prefix_range(self, path: str):
+        """Bounds for an indexed range scan over everything below path"""
+        prefix = path if path.endswith(os.sep) else path + os.sep
+        return prefix, prefix + self._PREFIX_END
+    
+    def _delete_subtree(self, path: str):
+        low, high = self._prefix_range(path)
+        self._conn.execute('DELETE FROM files WHERE path >= ? AND path < ?', (low, high))
+        self._conn.execute('DELETE FROM dirs WHERE path >= ? AND path < ?', (low, high))
+        self._conn.execute('DELETE FROM files WHERE dir = ?', (path,))
+        self._conn.execute('DELETE FROM dirs WHERE path = ?', (path,))
+    
+    # -------------------------------------------------------------------------
+    # Build & Refresh
+    # -------------------------------------------------------------------------
+    
+    def roots(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._conn.execute('SELECT path FROM roots')]
+    
+    def covering_root(self, path: str) -> Optional[str]:
+        """Return the innermost cataloged root containing path, if any"""
+        path = os.path.normpath(path)
+        for root in sorted(self.roots(), key=len, reverse=True):
+            if path == root or path.startswith(self._prefix_range(root)[0]):
+                return root
+        return None
+    
+    def _depth(self, path: str) -> int:
+        """Levels between path and its cataloged root"""
+        root = self.covering_root(path)
+        if root is None or path == root:
+            return 0
+        return os.path.relpath(path, root).count(os.sep) + 1
+    
+    def build(self, root: str) -> Dict:
+        """(Re)build the catalog for a root directory from scratch"""
+        root = os.path.normpath(root)
+        start = time.time()
+        # A root below an existing one (past its max_depth) stays listed in its parent
+        parent = os.path.dirname(root) if self.covering_root(root) not in (None, root) else None
+        dir_rows, file_rows = self._scan_parallel(root, parent)
+        
+        with self._lock:
+            self._delete_subtree(root)
+            self._write_rows(dir_rows, file_rows)
+            # A new root subsumes any roots below it
+            low, high = self._prefix_range(root)
+            self._conn.execute('DELETE FROM roots WHERE path >= ? AND path < ?', (low, high))
+            self._conn.execute(
+                'INSERT OR REPLACE INTO roots (path, built_at) VALUES (?, ?)',
+                (root, time.time())
+            )
+            self._conn.commit()
+            self._stats['builds'] += 1
+            self._refreshed[root] = start
+        
+        return {
+            'root': root,
+            'dirs': len(dir_rows),
+            'files': len(file_rows),
+            'seconds': round(time.time() - start, 3)
+        }
+    
+    def refresh(self, path: str, max_age: Optional[float] = None) -> Dict:
+        """
+        Incrementally refresh everything below path.
+        
+        Only directories whose mtime changed are re-listed; new
+        subdirectories are scanned (down to max_depth) and vanished ones
+        dropped. Skipped if path was refreshed less than max_age seconds
+        ago (default REFRESH_INTERVAL).
+        """
+        path = os.path.normpath(path)
+        max_age = self.REFRESH_INTERVAL if max_age is None else max_age
+        start = time.time()
+        if start - self._refreshed.get(path, 0.0) < max_age:
+            return {'path': path, 'skipped': True}
+        
+        low, high = self._prefix_range(path)
+        with self._lock:
+            known = dict(self._conn.execute(
+                'SELECT path, mtime FROM dirs '
+                'WHERE is_link = 0 AND (path = ? OR (path >= ? AND path < ?))',
+                (path, low, high)
+            ).fetchall())
+        
+        rescanned = 0
+        removed = set()
+        for dir_path, old_mtime in known.items():
+            try:
+                mtime = os.stat(dir_path).st_mtime
+            except OSError:
+                mtime = None
+            if mtime == old_mtime:
+                continue
+            
+            with self._lock:
+                if mtime is None:
+                    self._delete_subtree(dir_path)
+                    removed.add(dir_path)
+                    continue
+                
+                scanned = self._scan_dir(dir_path)
+                if scanned is None:
+                    continue
+                mtime, file_rows, subdirs, links = scanned
+                rescanned += 1
+                
+                # Replace this directory's direct files
+                self._conn.execute('DELETE FROM files WHERE dir = ?', (dir_path,))
+                self._conn.execute(
+                    'UPDATE dirs SET mtime = ? WHERE path = ?', (mtime, dir_path)
+                )
+                self._write_rows([], file_rows)
+                
+                # Reconcile subdirectories
+                old_subdirs = {r[0] for r in self._conn.execute(
+                    'SELECT path FROM dirs WHERE parent = ?', (dir_path,)
+                )}
+                for gone in old_subdirs - set(subdirs):
+                    self._delete_subtree(gone)
+                    if gone not in links:
+                        removed.add(gone)
+                new_subdirs = set(subdirs) - old_subdirs
+                depth = self._depth(dir_path)
+                if depth < self.max_depth:
+                    for new in new_subdirs:
+                        self._write_rows(*self._scan_tree(new, dir_path, depth + 1))
+                    self._write_rows(self._child_rows(dir_path, links), [])
+                else:
+                    self._write_rows(self._child_rows(dir_path, links, new_subdirs), [])
+        
+        with self._lock:
+            self._conn.commit()
+            self._stats['refreshes'] += 1
+            self._stats['dirs_rescanned'] += rescanned
+            self._refreshed[path] = start
+        
+        return {'path': path, 'dirs_checked': len(known),
+                'dirs_rescanned': rescanned, 'dirs_removed': len(removed)}
+    
+    def _verify(self, rows: List[tuple]) -> List[tuple]:
+        """
+        Re-stat cataloged file rows (path, ..., size, mtime at 3 and 4).
+        
+        Rewriting a file in place does not touch its directory's mtime,
+        so rows about to be returned are checked against the disk;
+        changed ones are updated and vanished ones dropped.
+        """
+        fresh, changed, gone = [], [], []
+        for row in rows:
+            try:
+                st = os.stat(row[0])
+            except OSError:
+                gone.append((row[0],))
+                continue
+            if st.st_size != row[3] or st.st_mtime != row[4]:
+                row = row[:3] + (st.st_size, st.st_mtime) + row[5:]
+                changed.append((st.st_size, st.st_mtime, row[0]))
+            fresh.append(row)
+        
+        if changed or gone:
+            with self._lock:
+                self._conn.executemany(
+                    'UPDATE files SET size = ?, mtime = ? WHERE path = ?', changed)
+                self._conn.executemany('DELETE FROM files WHERE path = ?', gone)
+                self._conn.commit()
+        return fresh
+    
+    def is_cataloged(self, path: str) -> bool:
+        """True if path is a directory the catalog has listed"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT 1 FROM dirs WHERE path = ? AND is_link = 0',
+                (os.path.normpath(path),)
+            ).fetchone() is not None
+    
+    def ensure(self, path: str) -> Dict:
+        """Make sure path is cataloged and fresh: refresh if covered, else build"""
+        if self.is_cataloged(path):
+            return self.refresh(path)
+        return self.build(path)
+    
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    
+    def query(self, file_type: str = None, extensions: List[str] = None,
+              min_size: int = None, max_size: int = None,
+              prefix: str = None, limit: int = None) -> List[Dict]:
+        """
+        Indexed file query.
+        
+        Args:
+            file_type: 'image', 'video', 'audio', 'document', 'archive', 'code'
+            extensions: Explicit extensions (without dots); overrides file_type
+            min_size / max_size: Inclusive size range in bytes
+            prefix: Only files below this directory
+            limit: Maximum rows
+        """
+        clauses = []
+        params: List[Any] = []
+        
+        if extensions:
+            exts = [e.lower().strip('.') for e in extensions]
+            clauses.append(f"ext IN ({','.join('?' * len(exts))})")
+            params.extend(exts)
+        elif file_type:
+            clauses.append('type = ?')
+            params.append(file_type.lower())
+        if min_size is not None:
+            clauses.append('size >= ?')
+            params.append(min_size)
+        if max_size is not None:
+            clauses.append('size <= ?')
+            params.append(max_size)
+        if prefix:
+            low, high = self._prefix_range(os.path.normpath(prefix))
+            clauses.append('path >= ? AND path < ?')
+            params.extend([low, high])
+        
+        sql = 'SELECT path, dir, name, size, mtime, ext, type FROM files'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY path'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            self._stats['queries'] += 1
+        
+        rows = [r for r in self._verify(rows)
+                if (min_size is None or r[3] >= min_size)
+                and (max_size is None or r[3] <= max_size)]
+        return [
+            {'path': r[0], 'dir': r[1], 'name': r[2], 'size': r[3],
+             'modified': r[4], 'extension': r[5], 'type': r[6]}
+            for r in rows
+        ]
+    
+    def list_dir(self, dir_path: str) -> Optional[List[Dict]]:
+        """
+        Directory listing from the catalog.
+        
+        Returns None when the directory is not cataloged. A stale directory
+        is re-listed (and its new subdirectories scanned) before answering.
+        """
+        dir_path = os.path.normpath(dir_path)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT mtime FROM dirs WHERE path = ? AND is_link = 0', (dir_path,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            if os.stat(dir_path).st_mtime != row[0]:
+                self.refresh(dir_path, max_age=0)
+        except OSError:
+            return None
+        
+        with self._lock:
+            subdirs = self._conn.execute(
+                'SELECT path FROM dirs WHERE parent = ?', (dir_path,)
+            ).fetchall()
+            files = self._conn.execute(
+                'SELECT path, dir, name, size, mtime FROM files WHERE dir = ?', (dir_path,)
+            ).fetchall()
+        
+        entries = [{'name': os.path.basename(p), 'is_folder': True, 'size': 0}
+                   for (p,) in subdirs]
+        entries.extend({'name': r[2], 'is_folder': False, 'size': r[3]}
+                       for r in self._verify(files))
+        return entries
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            files, total = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files'
+            ).fetchone()
+            dirs = self._conn.execute('SELECT COUNT(*) FROM dirs').fetchone()[0]
+        return {
+            **self._stats,
+            'files': files,
+            'dirs': dirs,
+            'total_bytes': total,
+            'roots': self.roots()
+        }
+
+
 # =============================================================================
 # CREDENTIAL VAULT - Secure Storage for Connection Credentials
 # =============================================================================
@@ -2337,6 +3558,12 @@ class UniversalHardDrive:
     DRIVE_CACHE = 'E'
     DRIVE_SAVED = 'Z'
     
+    # Local file materialization limits
+    PREVIEW_CHARS = 50000                  # Text shown for a plain read
+    LARGE_FILE_BYTES = 8 * 1024 * 1024     # Above this JSON is previewed, not loaded
+    JSON_PREVIEW_ITEMS = 100               # Array elements in a JSON preview
+    STREAM_CHUNK_BYTES = 64 * 1024         # Chunk size for streamed reads
+    
     def __init__(self, save_dir: str = "data/uhd_saved"):
         # Core components
         self.kernel = HelixKernel()
@@ -2361,6 +3588,9 @@ class UniversalHardDrive:
         # File tree cache (for navigation)
         self._tree_cache: Dict[str, FileNode] = {}
         
+        # Persistent catalog of the A: drive (find_all, dedupe, organize)
+        self._catalog = FileCatalog(self.save_dir / '.uhd_catalog.db')
+        
         # Connected data sources
         self._connector: Optional[UniversalConnector] = None
         self._database: Optional[HelixDatabase] = None
@@ -2385,6 +3615,14 @@ class UniversalHardDrive:
         self._relationship_graph = RelationshipGraph()
         self._smart_query = SmartQuery(self._semantic_router, self._relationship_graph)
         
+        # Full-text index persisted between runs
+        self._search_index_path = self.save_dir / '.uhd_search.idx'
+        if self._search_index_path.exists():
+            try:
+                self._relationship_graph.load_index(self._search_index_path)
+            except (OSError, ValueError, zlib.error) as e:
+                self.logger.plane(f"Search index not loaded: {e}")
+        
         # Stats
         self._stats = {
             'srls_created': 0,
@@ -2911,7 +4149,9 @@ class UniversalHardDrive:
         
         if conn_id:
             # Remove SRLs for this drive
-            self._srls = {k: v for k, v in self._srls.items() if not k.startswith(f"{drive_letter}:")}
+            for k in [k for k in self._srls if k.startswith(f"{drive_letter}:")]:
+                self._relationship_graph.forget(k)
+                del self._srls[k]
             
             # Remove connection
             if conn_id in self._connections:
@@ -2977,6 +4217,7 @@ class UniversalHardDrive:
         
         self._srls[path] = srl
         self._stats['srls_created'] += 1
+        self._relationship_graph.index_name(path)
         
         # Register as potential in substrate
         self.substrate.create_token(
@@ -3108,11 +4349,17 @@ class UniversalHardDrive:
         self._stats['materializations'] += 1
         
         try:
+            large = file_path.stat().st_size > self.LARGE_FILE_BYTES
             if file_path.suffix.lower() == '.json':
+                if large:
+                    return self.preview_json(str(file_path), self.JSON_PREVIEW_ITEMS)
                 with open(file_path, 'r') as f:
                     return json.load(f)
             else:
                 with open(file_path, 'r', errors='replace') as f:
+                    if large:
+                        return {'content': f.read(self.PREVIEW_CHARS), 'type': 'text',
+                                'truncated': True}
                     return {'content': f.read(), 'type': 'text'}
         except Exception as e:
             return {'error': str(e), 'path': str(file_path)}
@@ -3133,6 +4380,8 @@ class UniversalHardDrive:
             
             # Handle different file types
             if ext == '.json':
+                if os.path.getsize(real_path) > self.LARGE_FILE_BYTES:
+                    return self.preview_json(real_path, self.JSON_PREVIEW_ITEMS)
                 with open(real_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
             
@@ -3140,15 +4389,16 @@ class UniversalHardDrive:
                         '.yaml', '.yml', '.log', '.sh', '.bat', '.ini', '.cfg',
                         '.csv', '.sql', '.c', '.cpp', '.h', '.java', '.ts', '.tsx',
                         '.jsx', '.vue', '.rb', '.php', '.go', '.rs', '.swift']:
+                size = os.path.getsize(real_path)
                 with open(real_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                    # Limit size for display
-                    if len(content) > 50000:
-                        content = content[:50000] + f'\n\n... (truncated, {len(content)} bytes total)'
+                    # Only read what can be displayed
+                    content = f.read(self.PREVIEW_CHARS + 1)
+                    if len(content) > self.PREVIEW_CHARS:
+                        content = content[:self.PREVIEW_CHARS] + f'\n\n... (truncated, {size} bytes total)'
                     return {
                         'type': 'text',
                         'path': real_path,
-                        'size': os.path.getsize(real_path),
+                        'size': size,
                         'content': content
                     }
             
@@ -3216,6 +4466,190 @@ class UniversalHardDrive:
         except Exception as e:
             return {'error': str(e), 'path': real_path}
     
+    # -------------------------------------------------------------------------
+    # Range-Aware Materialization (large local files never load whole)
+    # -------------------------------------------------------------------------
+    
+    def _local_real_path(self, path: str) -> str:
+        """Accept an A:/ virtual path or a real path"""
+        return self._decode_local_path(path) if path.startswith('A:') else path
+    
+    def iter_bytes(self, path: str, start: int = 0, length: int = None,
+                   chunk_size: int = None) -> Iterator[bytes]:
+        """
+        Stream a byte range of a local file in chunks.
+        
+        Args:
+            path: A:/ virtual path or real path
+            start: First byte offset (negative counts from the end)
+            length: Number of bytes (None = to end of file)
+            chunk_size: Bytes per chunk (defaults to STREAM_CHUNK_BYTES)
+        """
+        real_path = self._local_real_path(path)
+        chunk_size = chunk_size or self.STREAM_CHUNK_BYTES
+        size = os.path.getsize(real_path)
+        if start < 0:
+            start = max(0, size + start)
+        end = size if length is None else min(size, start + length)
+        
+        with open(real_path, 'rb') as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+    
+    def read_bytes(self, path: str, start: int = 0, length: int = None) -> bytes:
+        """Read a byte range of a local file via mmap (no full read)"""
+        real_path = self._local_real_path(path)
+        size = os.path.getsize(real_path)
+        if size == 0:
+            return b''
+        if start < 0:
+            start = max(0, size + start)
+        end = size if length is None else min(size, start + length)
+        
+        with open(real_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[start:end]
+    
+    def read_lines(self, path: str, mode: str = 'head', count: int = 100,
+                   page: int = 0) -> Dict:
+        """
+        Line-range access to a local text file.
+        
+        Args:
+            path: A:/ virtual path or real path
+            mode: 'head' (first lines), 'tail' (last lines) or 'page'
+            count: Lines per result / page size
+            page: Zero-based page number for mode='page'
+        """
+        real_path = self._local_real_path(path)
+        size = os.path.getsize(real_path)
+        if size == 0:
+            return {'path': path, 'mode': mode, 'lines': [], 'size': 0}
+        
+        with open(real_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mode == 'tail':
+                    # Walk newlines backwards from the end
+                    end = size - 1 if mm[size - 1:size] == b'\n' else size
+                    pos = end
+                    for _ in range(count):
+                        pos = mm.rfind(b'\n', 0, pos)
+                        if pos < 0:
+                            break
+                    start = pos + 1
+                    first_line = None
+                else:
+                    skip = page * count if mode == 'page' else 0
+                    start = 0
+                    for _ in range(skip):
+                        nl = mm.find(b'\n', start)
+                        if nl < 0:
+                            start = size
+                            break
+                        start = nl + 1
+                    end = start
+                    for _ in range(count):
+                        if end >= size:
+                            break
+                        nl = mm.find(b'\n', end)
+                        end = size if nl < 0 else nl + 1
+                    first_line = skip
+                
+                text = mm[start:end].decode('utf-8', errors='replace')
+        
+        return {
+            'path': path,
+            'mode': mode,
+            'page': page if mode == 'page' else None,
+            'first_line': first_line,
+            'byte_range': [start, end],
+            'size': size,
+            'lines': text.splitlines()
+        }
+    
+    def preview_json(self, path: str, limit: int = 100) -> Dict:
+        """
+        Incrementally parse the first elements of a top-level JSON array.
+        
+        Reads in chunks and decodes one element at a time, so only the
+        previewed elements are ever held in memory. Non-array documents
+        fall back to a text head preview.
+        """
+        real_path = self._local_real_path(path)
+        size = os.path.getsize(real_path)
+        decoder = json.JSONDecoder()
+        items = []
+        complete = False
+        
+        with open(real_path, 'r', encoding='utf-8', errors='replace') as f:
+            buf = f.read(self.STREAM_CHUNK_BYTES).lstrip()
+            if not buf.startswith('['):
+                return {
+                    'type': 'json_preview',
+                    'path': real_path,
+                    'size': size,
+                    'preview': 'text',
+                    'content': buf[:self.PREVIEW_CHARS],
+                    'truncated': size > len(buf)
+                }
+            
+            pos = 1
+            eof = False
+            while len(items) < limit:
+                # Skip whitespace and separators
+                while True:
+                    while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                        pos += 1
+                    if pos < len(buf) or eof:
+                        break
+                    more = f.read(self.STREAM_CHUNK_BYTES)
+                    eof = not more
+                    buf, pos = buf[pos:] + more, 0
+                
+                if pos >= len(buf):
+                    break
+                if buf[pos] == ']':
+                    complete = True
+                    break
+                
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        break
+                    # Element spans the chunk boundary - pull more data
+                    more = f.read(self.STREAM_CHUNK_BYTES)
+                    eof = not more
+                    buf, pos = buf[pos:] + more, 0
+                    continue
+                if (not eof and isinstance(item, (int, float)) and not isinstance(item, bool)
+                        and (end == len(buf) or buf[end] in '.eE+-')):
+                    # A number cut at the chunk boundary still decodes -
+                    # only accept it once the next chunk shows where it ends
+                    more = f.read(self.STREAM_CHUNK_BYTES)
+                    eof = not more
+                    buf, pos = buf[pos:] + more, 0
+                    continue
+                
+                items.append(item)
+                buf, pos = buf[end:], 0
+        
+        return {
+            'type': 'json_preview',
+            'path': real_path,
+            'size': size,
+            'preview': 'array',
+            'items': items,
+            'count': len(items),
+            'truncated': not complete
+        }
+    
     # -------------------------------------------------------------------------
     # File System Operations (Everything looks like local files)
     # -------------------------------------------------------------------------
@@ -3311,62 +4745,68 @@ class UniversalHardDrive:
         if not os.path.isdir(real_path):
             return []
         
-        results = []
-        try:
-            for entry in os.scandir(real_path):
-                try:
-                    # Skip hidden files and system files
-                    if entry.name.startswith('.'):
-                        continue
-                    
-                    # Get icon based on type
-                    if entry.is_dir():
-                        icon = '📁'
-                        # Encode the path for virtual representation
-                        if virtual_path.endswith('/'):
-                            item_path = f"{virtual_path}{entry.name}/"
-                        else:
-                            item_path = f"{virtual_path}/{entry.name}/"
-                    else:
-                        # Determine icon by extension
-                        ext = os.path.splitext(entry.name)[1].lower()
-                        icon_map = {
-                            '.txt': '📝', '.md': '📝', '.log': '📝',
-                            '.py': '🐍', '.js': '📜', '.html': '🌐', '.css': '🎨',
-                            '.json': '📋', '.xml': '📋', '.yaml': '📋', '.yml': '📋',
-                            '.png': '🖼️', '.jpg': '🖼️', '.jpeg': '🖼️', '.gif': '🖼️', '.svg': '🖼️',
-                            '.mp3': '🎵', '.wav': '🎵', '.flac': '🎵',
-                            '.mp4': '🎬', '.mkv': '🎬', '.avi': '🎬',
-                            '.pdf': '📕', '.doc': '📘', '.docx': '📘', '.xls': '📗', '.xlsx': '📗',
-                            '.zip': '📦', '.tar': '📦', '.gz': '📦', '.7z': '📦',
-                            '.exe': '⚙️', '.sh': '⚙️', '.bat': '⚙️',
-                        }
-                        icon = icon_map.get(ext, '📄')
-                        if virtual_path.endswith('/'):
-                            item_path = f"{virtual_path}{entry.name}"
-                        else:
-                            item_path = f"{virtual_path}/{entry.name}"
-                    
-                    # Get size
+        # Served from the catalog when this directory has been indexed
+        entries = self._catalog.list_dir(real_path)
+        if entries is None:
+            entries = []
+            try:
+                for entry in os.scandir(real_path):
                     try:
-                        size = entry.stat().st_size if entry.is_file() else 0
-                    except:
-                        size = 0
-                    
-                    results.append({
-                        'name': entry.name,
-                        'path': item_path,
-                        'is_folder': entry.is_dir(),
-                        'icon': icon,
-                        'size': size,
-                        'source': 'local'
-                    })
-                except PermissionError:
-                    continue
-                except Exception:
-                    continue
-        except PermissionError:
-            return [{'name': '⛔ Access Denied', 'path': '', 'is_folder': False, 'icon': '⛔'}]
+                        is_dir = entry.is_dir()
+                        try:
+                            size = entry.stat().st_size if entry.is_file() else 0
+                        except:
+                            size = 0
+                        entries.append({'name': entry.name, 'is_folder': is_dir, 'size': size})
+                    except PermissionError:
+                        continue
+                    except Exception:
+                        continue
+            except PermissionError:
+                return [{'name': '⛔ Access Denied', 'path': '', 'is_folder': False, 'icon': '⛔'}]
+        
+        results = []
+        for entry in entries:
+            # Skip hidden files and system files
+            if entry['name'].startswith('.'):
+                continue
+            
+            # Get icon based on type
+            if entry['is_folder']:
+                icon = '📁'
+                # Encode the path for virtual representation
+                if virtual_path.endswith('/'):
+                    item_path = f"{virtual_path}{entry['name']}/"
+                else:
+                    item_path = f"{virtual_path}/{entry['name']}/"
+            else:
+                # Determine icon by extension
+                ext = os.path.splitext(entry['name'])[1].lower()
+                icon_map = {
+                    '.txt': '📝', '.md': '📝', '.log': '📝',
+                    '.py': '🐍', '.js': '📜', '.html': '🌐', '.css': '🎨',
+                    '.json': '📋', '.xml': '📋', '.yaml': '📋', '.yml': '📋',
+                    '.png': '🖼️', '.jpg': '🖼️', '.jpeg': '🖼️', '.gif': '🖼️', '.svg': '🖼️',
+                    '.mp3': '🎵', '.wav': '🎵', '.flac': '🎵',
+                    '.mp4': '🎬', '.mkv': '🎬', '.avi': '🎬',
+                    '.pdf': '📕', '.doc': '📘', '.docx': '📘', '.xls': '📗', '.xlsx': '📗',
+                    '.zip': '📦', '.tar': '📦', '.gz': '📦', '.7z': '📦',
+                    '.exe': '⚙️', '.sh': '⚙️', '.bat': '⚙️',
+                }
+                icon = icon_map.get(ext, '📄')
+                if virtual_path.endswith('/'):
+                    item_path = f"{virtual_path}{entry['name']}"
+                else:
+                    item_path = f"{virtual_path}/{entry['name']}"
+            
+            results.append({
+                'name': entry['name'],
+                'path': item_path,
+                'is_folder': entry['is_folder'],
+                'icon': icon,
+                'size': entry['size'],
+                'source': 'local'
+            })
         
         # Sort: folders first, then files alphabetically
         results.sort(key=lambda x: (not x['is_folder'], x['name'].lower()))
@@ -3542,7 +4982,13 @@ class UniversalHardDrive:
             return {"error": f"File not found: {path}"}
         
         srl.invalidate()
-        return srl.materialize()
+        self._relationship_graph.forget(path)
+        data = srl.materialize()
+        if data and (not isinstance(data, dict) or 'error' not in data):
+            self._relationship_graph.learn(path, data, srl.source_type)
+        else:
+            self._relationship_graph.index_name(path)
+        return data
     
     def save(self, source_path: str, dest_path: str = None) -> bool:
         """
@@ -3620,60 +5066,34 @@ class UniversalHardDrive:
             uhd.find_all(extension='pdf')  # All PDFs
             uhd.find_all('video', location='A:/home/')  # Videos in home
         """
-        type_extensions = {
-            'image': ['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'bmp', 'heic', 'tiff', 'ico'],
-            'video': ['mp4', 'mov', 'avi', 'mkv', 'webm', 'flv', 'wmv', 'm4v'],
-            'audio': ['mp3', 'wav', 'flac', 'aac', 'm4a', 'ogg', 'wma'],
-            'document': ['pdf', 'doc', 'docx', 'txt', 'rtf', 'odt', 'xls', 'xlsx', 'ppt', 'pptx'],
-            'archive': ['zip', 'rar', 'tar', 'gz', '7z', 'bz2'],
-            'code': ['py', 'js', 'ts', 'html', 'css', 'java', 'cpp', 'c', 'go', 'rs', 'rb']
-        }
-        
         extensions = []
-        if file_type and file_type.lower() in type_extensions:
-            extensions = type_extensions[file_type.lower()]
+        if file_type and file_type.lower() in FILE_TYPE_EXTENSIONS:
+            extensions = FILE_TYPE_EXTENSIONS[file_type.lower()]
         if extension:
             extensions = [extension.lower().strip('.')]
         
         results = []
         
-        # Search local filesystem for A: drive
+        # Search local filesystem for A: drive (answered from the catalog)
         if location.startswith('A:'):
             real_path = self._decode_local_path(location) or '/'
             
-            try:
-                for root, dirs, files in os.walk(real_path):
-                    # Limit depth
-                    depth = root.replace(real_path, '').count(os.sep)
-                    if depth > 5:
-                        dirs.clear()
-                        continue
-                    
-                    for filename in files:
-                        if extensions:
-                            ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
-                            if ext not in extensions:
-                                continue
-                        
-                        filepath = os.path.join(root, filename)
-                        try:
-                            stat = os.stat(filepath)
-                            results.append({
-                                'name': filename,
-                                'path': filepath,
-                                'virtual_path': f"A:/{os.path.relpath(filepath, '/')}",
-                                'size': stat.st_size,
-                                'modified': stat.st_mtime,
-                                'extension': filename.rsplit('.', 1)[-1].lower() if '.' in filename else '',
-                                'icon': self._get_file_icon(filename.rsplit('.', 1)[-1].lower() if '.' in filename else '')
-                            })
-                            
-                            if len(results) >= max_results:
-                                return results
-                        except:
-                            continue
-            except PermissionError:
-                pass
+            if os.path.isdir(real_path):
+                self._catalog.ensure(real_path)
+                for f in self._catalog.query(extensions=extensions or None,
+                                             prefix=real_path, limit=max_results):
+                    results.append({
+                        'name': f['name'],
+                        'path': f['path'],
+                        'virtual_path': f"A:/{os.path.relpath(f['path'], '/')}",
+                        'size': f['size'],
+                        'modified': f['modified'],
+                        'extension': f['extension'],
+                        'icon': self._get_file_icon(f['extension'])
+                    })
+                
+                if len(results) >= max_results:
+                    return results
         
         # Also search SRLs for other drives
         for path, srl in self._srls.items():
@@ -3939,7 +5359,7 @@ class UniversalHardDrive:
                 folder = ext.upper() if ext else 'NoExtension'
             elif by == 'date':
                 try:
-                    mtime = os.path.getmtime(filepath)
+                    mtime = f.get('modified') or os.path.getmtime(filepath)
                     dt = datetime.fromtimestamp(mtime)
                     folder = f"{dt.year}/{dt.month:02d}"
                 except:
@@ -4083,16 +5503,7 @@ class UniversalHardDrive:
             else:
                 search_terms.append(part.lower())
         
-        # Search through all SRLs
-        for path, srl in self._srls.items():
-            # Name match
-            name_match = not search_terms or any(
-                term in srl.name.lower() or term in path.lower() 
-                for term in search_terms
-            )
-            
-            if not name_match:
-                continue
+        for path, srl in self._query_candidates(search_terms):
             
             # Filter: source
             if 'source' in filters:
@@ -4122,6 +5533,41 @@ class UniversalHardDrive:
         
         return results
     
+    def _query_candidates(self, search_terms: List[str]):
+        """
+        (path, srl) candidates for query(), best first.
+        
+        Ranked index results are paged in growing batches (exhaustively
+        past the first) so filters applied by the caller never cut off
+        matches, then terms the index can't serve are matched by
+        substring against names and paths.
+        """
+        if not search_terms:
+            yield from self._srls.items()
+            return
+        
+        graph = self._relationship_graph
+        seen = set()
+        fetch, exhaustive = 1000, False
+        while True:
+            ranked = graph.search_ranked(search_terms, limit=fetch, exhaustive=exhaustive)
+            for path, _ in ranked:
+                if path not in seen:
+                    seen.add(path)
+                    if path in self._srls:
+                        yield path, self._srls[path]
+            if len(ranked) < fetch and exhaustive:
+                break
+            fetch, exhaustive = fetch * 4, True
+        
+        unserved = graph.unserved_terms(search_terms)
+        if unserved:
+            for path, srl in self._srls.items():
+                if path not in seen:
+                    name, lower_path = srl.name.lower(), path.lower()
+                    if any(term in name or term in lower_path for term in unserved):
+                        yield path, srl
+    
     def ask(self, question: str) -> Dict:
         """
         Ask a natural language question.
@@ -4162,6 +5608,19 @@ class UniversalHardDrive:
             }
         }
     
+    def save_search_index(self) -> str:
+        """Persist the full-text index so the next start skips re-learning"""
+        self._relationship_graph.save_index(self._search_index_path)
+        return str(self._search_index_path)
+    
+    def close(self):
+        """Persist the search index and close the catalog (on shutdown)"""
+        try:
+            self.save_search_index()
+        except OSError as e:
+            self.logger.plane(f"Search index not saved: {e}")
+        self._catalog.close()
+    
     def find_common_contacts(self, limit: int = 20) -> List[Dict]:
         """Find most common email addresses across all data"""
         return self._relationship_graph.get_common_emails(limit)
@@ -5829,6 +7288,30 @@ class UHDHandler(BaseHTTPRequestHandler):
         elif parsed.path == '/api/read':
             path = params.get('path', [''])[0]
             self.serve_json(self.uhd.read(unquote(path)))
+        elif parsed.path == '/api/stream':
+            # Raw bytes of a local file, streamed in chunks (honors Range)
+            path = params.get('path', [''])[0]
+            self.serve_stream(unquote(path), params)
+        elif parsed.path == '/api/lines':
+            # Line-range access: mode=head|tail|page, count, page
+            path = params.get('path', [''])[0]
+            try:
+                self.serve_json(self.uhd.read_lines(
+                    unquote(path),
+                    mode=params.get('mode', ['head'])[0],
+                    count=int(params.get('count', ['100'])[0]),
+                    page=int(params.get('page', ['0'])[0])
+                ))
+            except (OSError, ValueError) as e:
+                self.serve_json({'error': str(e), 'path': path})
+        elif parsed.path == '/api/json-preview':
+            # First N elements of a (possibly huge) JSON array
+            path = params.get('path', [''])[0]
+            try:
+                limit = int(params.get('limit', ['100'])[0])
+                self.serve_json(self.uhd.preview_json(unquote(path), limit))
+            except (OSError, ValueError) as e:
+                self.serve_json({'error': str(e), 'path': path})
         elif parsed.path == '/api/info':
             path = params.get('path', [''])[0]
             self.serve_json(self.uhd.info(unquote(path)))
@@ -6883,6 +8366,76 @@ class UHDHandler(BaseHTTPRequestHandler):
         self._send_cors_headers()
         self.end_headers()
     
+    def serve_stream(self, path: str, params: Dict):
+        """
+        Stream a local file (or byte range) without loading it into memory.
+        
+        ?start= and ?length= select a range; a negative start counts back
+        from the end of the file. A Range header takes precedence.
+        """
+        if not path.startswith('A:'):
+            self.send_error(400, 'Streaming is only available for A: paths')
+            return
+        real_path = self.uhd._local_real_path(path)
+        if not os.path.isfile(real_path):
+            self.send_error(404)
+            return
+        
+        size = os.path.getsize(real_path)
+        try:
+            start = int(params.get('start', ['0'])[0])
+            length = params.get('length', [None])[0]
+            length = int(length) if length is not None else None
+        except ValueError:
+            self.send_error(400, 'start and length must be integers')
+            return
+        if length is not None and length < 0:
+            self.send_error(400, 'length must not be negative')
+            return
+        status = 200
+        
+        # HTTP Range header takes precedence: "bytes=START-END" or "bytes=-N"
+        range_header = self.headers.get('Range', '')
+        match = re.match(r'bytes=(\d*)-(\d*)$', range_header.strip())
+        if match and (match.group(1) or match.group(2)):
+            first, last = match.group(1), match.group(2)
+            if first and last and int(last) < int(first):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.end_headers()
+                return
+            if first:
+                start = int(first)
+                length = (int(last) - start + 1) if last else None
+            else:
+                start = max(0, size - int(last))
+                length = None
+            status = 206
+        
+        if start < 0:
+            start = max(0, size + start)
+        if start >= size and size > 0:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.end_headers()
+            return
+        end = size if length is None else min(size, start + length)
+        
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(end - start))
+        self.send_header('Accept-Ranges', 'bytes')
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{max(start, end - 1)}/{size}')
+        self._send_cors_headers()
+        self.end_headers()
+        
+        try:
+            for chunk in self.uhd.iter_bytes(real_path, start, end - start):
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
     def serve_json(self, data):
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
@@ -6924,12 +8477,144 @@ def run_server(uhd: UniversalHardDrive = None, host: str = '127.0.0.1', port: in
     except KeyboardInterrupt:
         print("\nServer stopped")
         server.shutdown()
+    finally:
+        uhd.close()
 
 
 # =============================================================================
 # DEMO
 # =============================================================================
 
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def generate_search_corpus(num_docs: int = 100_000, vocab_size: int = 50_000,
+                           doc_length: int = 40, seed: int = 42):
+    """
+    Synthetic corpus for search benchmarks.
+    
+    Word frequencies follow a Zipf-like distribution so posting lists have
+    the realistic mix of a few huge and many tiny lists. Yields
+    (srl_path, text) pairs.
+    """
+    import random
+    rng = random.Random(seed)
+    consonants = 'bcdfghjklmnprstvwz'
+    vowels = 'aeiou'
+    vocab_set = set()
+    while len(vocab_set) < vocab_size:
+        syllables = rng.randint(2, 5)
+        vocab_set.add(''.join(rng.choice(consonants) + rng.choice(vowels)
+                              for _ in range(syllables)))
+    vocab = sorted(vocab_set)
+    rng.shuffle(vocab)
+    weights = [1.0 / (rank + 1) for rank in range(vocab_size)]
+    cumulative = []
+    total = 0.0
+    for w in weights:
+        total += w
+        cumulative.append(total)
+    
+    for doc in range(num_docs):
+        words = rng.choices(vocab, cum_weights=cumulative, k=doc_length)
+        yield f"E:/mail/{doc // 1000:04d}/msg_{doc}.eml", ' '.join(words)
+
+
+def benchmark_search(num_docs: int = 100_000, num_queries: int = 200,
+                     seed: int = 42) -> Dict:
+    """
+    Time FullTextIndex build and BM25 queries on a synthetic corpus.
+    
+    Queries mix rare, mid-frequency and partial words.
+    """
+    import random
+    rng = random.Random(seed)
+    index = FullTextIndex()
+    
+    start = time.perf_counter()
+    for path, text in generate_search_corpus(num_docs, seed=seed):
+        index.add(path, text)
+    build_seconds = time.perf_counter() - start
+    
+    terms = sorted(index._postings, key=lambda t: len(index._postings[t]))
+    rare = terms[:len(terms) // 2]
+    mid = terms[len(terms) // 2:-50] or terms
+    queries = []
+    for _ in range(num_queries):
+        kind = rng.random()
+        if kind < 0.4:
+            queries.append([rng.choice(rare), rng.choice(rare)])
+        elif kind < 0.8:
+            queries.append([rng.choice(mid), rng.choice(rare)])
+        else:
+            queries.append([rng.choice(rare)[:4]])
+    
+    timings = []
+    for q in queries:
+        t0 = time.perf_counter()
+        index.search(q, limit=20)
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    
+    return {
+        'documents': num_docs,
+        'build_seconds': round(build_seconds, 2),
+        'docs_per_second': round(num_docs / build_seconds),
+        'query_ms_p50': round(timings[len(timings) // 2], 3),
+        'query_ms_p99': round(timings[int(len(timings) * 0.99) - 1], 3),
+        'index': index.stats()
+    }
+
+
+def benchmark_relationship_ingest(num_messages: int = 500_000, chunk: int = 50_000,
+                                  seed: int = 42) -> Dict:
+    """
+    Time RelationshipGraph.learn over a synthetic mailbox.
+    
+    Every message is addressed to the owner and 30% come from one
+    newsletter sender - the two super-popular entities that made the old
+    edge-per-pair linking quadratic. Per-chunk timings should stay flat.
+    """
+    import random
+    rng = random.Random(seed)
+    graph = RelationshipGraph()
+    contacts = [f"person{i}@example.com" for i in range(5000)]
+    topics = ['invoice', 'meeting', 'coupon', 'report', 'travel', 'family',
+              'project', 'receipt', 'schedule', 'update']
+    
+    chunk_seconds = []
+    start = chunk_start = time.perf_counter()
+    for i in range(num_messages):
+        sender = 'news@bigco.example' if rng.random() < 0.3 else rng.choice(contacts)
+        topic = rng.choice(topics)
+        message = {
+            'from': sender,
+            'to': 'me@home.example',
+            'subject': f"{topic.title()} update {i}",
+            'body': f"About the {topic}: see {topic} details. Reply to {sender}."
+        }
+        graph.learn(f"E:/inbox/{i}.eml", message, 'email')
+        if (i + 1) % chunk == 0:
+            now = time.perf_counter()
+            chunk_seconds.append(round(now - chunk_start, 2))
+            chunk_start = now
+    total = time.perf_counter() - start
+    
+    probe = time.perf_counter()
+    related = graph.find_related(f"E:/inbox/{num_messages - 1}.eml", limit=10)
+    related_ms = (time.perf_counter() - probe) * 1000
+    
+    return {
+        'messages': num_messages,
+        'seconds': round(total, 2),
+        'messages_per_second': round(num_messages / total),
+        'chunk_seconds': chunk_seconds,
+        'find_related_ms': round(related_ms, 3),
+        'related_found': len(related)
+    }
+
+
 def demo():
     """Demonstrate the Universal Hard Drive"""
     print("=" * 60)
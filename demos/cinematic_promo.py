@@ -16,12 +16,16 @@ Uses AI Substrate for orchestration.
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import os
-import subprocess
+import sys
 import tempfile
 import math
 import wave
 import struct
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helix.packages.media_pkg import RenderPipeline, add_pipeline_arguments
+
 # ============================================================================
 # NARRATION SCRIPT WITH TIMINGS
 # ============================================================================
@@ -671,67 +675,55 @@ def generate_cinematic_audio(output_path):
 # MAIN RENDER FUNCTION
 # ============================================================================
 
-def render_video():
+def segment_mode(frame_num):
+    """Progress label for a frame"""
+    return get_current_segment(frame_num / FPS)[1]
+
+
+def render_video(workers=None, start=0, stop=None, segment_frames=None,
+                 null_sink=False):
     """Main video rendering function"""
     print("=" * 60)
     print("ButterflyFX CINEMATIC PROMO VIDEO GENERATOR")
     print("=" * 60)
     print()
     
-    # Create temp directory
+    # Temp directory holds the audio track only - frames stream to ffmpeg
     temp_dir = tempfile.mkdtemp(prefix='butterflyfx_cinematic_')
-    frames_dir = os.path.join(temp_dir, 'frames')
-    os.makedirs(frames_dir)
     
     print(f"Temp directory: {temp_dir}")
     print(f"Target: {WIDTH}x{HEIGHT} @ {FPS}fps, {DURATION}s")
     print()
     
-    # Generate frames
-    print("STEP 1: Generating video frames...")
-    for frame_num in range(TOTAL_FRAMES):
-        if frame_num % 90 == 0:
-            pct = frame_num / TOTAL_FRAMES * 100
-            t = frame_num / FPS
-            _, mode, _ = get_current_segment(t)
-            print(f"  Frame {frame_num}/{TOTAL_FRAMES} ({pct:.1f}%) - {t:.1f}s [{mode}]")
-        
-        img = create_frame(frame_num)
-        frame_path = os.path.join(frames_dir, f'frame_{frame_num:05d}.png')
-        img.save(frame_path, 'PNG')
-    
-    print(f"  Generated {TOTAL_FRAMES} frames")
-    
-    # Generate audio
-    print("\nSTEP 2: Generating cinematic audio...")
-    audio_path = os.path.join(temp_dir, 'cinematic.wav')
-    generate_cinematic_audio(audio_path)
-    print(f"  Audio: {audio_path}")
-    
-    # Encode video
-    print("\nSTEP 3: Encoding video with ffmpeg...")
+    # Generate audio (ffmpeg needs it before frames start streaming)
+    print("STEP 1: Generating cinematic audio...")
+    audio_path = None
+    if null_sink:
+        print("  Skipped (null sink)")
+    else:
+        audio_path = os.path.join(temp_dir, 'cinematic.wav')
+        generate_cinematic_audio(audio_path)
+        print(f"  Audio: {audio_path}")
+    
+    # Render frames straight into the encoder
+    print("\nSTEP 2: Rendering and encoding video frames...")
     output_path = '/opt/butterflyfx/dimensionsos/demos/butterflyfx_promo.mp4'
     
-    result = subprocess.run([
-        'ffmpeg', '-y',
-        '-framerate', str(FPS),
-        '-i', os.path.join(frames_dir, 'frame_%05d.png'),
-        '-i', audio_path,
-        '-c:v', 'libx264', '-preset', 'medium', '-crf', '20',
-        '-c:a', 'aac', '-b:a', '192k',
-        '-pix_fmt', 'yuv420p',
-        '-shortest',
-        output_path
-    ], capture_output=True, text=True)
-    
-    if result.returncode == 0:
-        size = os.path.getsize(output_path)
-        print(f"\n✓ SUCCESS: {output_path}")
-        print(f"  Size: {size / 1024 / 1024:.2f} MB")
-        print(f"  Duration: {DURATION} seconds")
-        print(f"  Resolution: {WIDTH}x{HEIGHT} @ {FPS}fps")
+    pipeline = RenderPipeline(create_frame, WIDTH, HEIGHT, FPS, TOTAL_FRAMES,
+                              workers=workers, progress_every=90,
+                              label_fn=segment_mode)
+    try:
+        pipeline.run(output_path, audio_path, start, stop, segment_frames,
+                     null_sink, crf=20, preset='medium')
+    except RuntimeError as e:
+        print(f"\nFFMPEG Error: {e}")
     else:
-        print(f"\nFFMPEG Error: {result.stderr}")
+        if not null_sink:
+            size = os.path.getsize(output_path)
+            print(f"\n✓ SUCCESS: {output_path}")
+            print(f"  Size: {size / 1024 / 1024:.2f} MB")
+            print(f"  Duration: {DURATION} seconds")
+            print(f"  Resolution: {WIDTH}x{HEIGHT} @ {FPS}fps")
     
     # Cleanup
     import shutil
@@ -749,4 +741,7 @@ def render_video():
 
 
 if __name__ == "__main__":
-    render_video()
+    import argparse
+    parser = argparse.ArgumentParser(description="Render the ButterflyFX cinematic promo")
+    add_pipeline_arguments(parser)
+    render_video(**vars(parser.parse_args()))
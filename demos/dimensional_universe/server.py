@@ -35,16 +35,40 @@ def index():
     return send_from_directory('static', 'index.html')
 
 
+def page_args():
+    """depth/offset/limit query parameters for paginated visualization data (clamped to >= 0)"""
+    return {
+        "depth": max(0, request.args.get('depth', 0, type=int)),
+        "offset": max(0, request.args.get('offset', 0, type=int)),
+        "limit": max(0, request.args.get('limit', DimensionalUniverse.PAGE_SIZE, type=int))
+    }
+
+
 @app.route('/api/universe', methods=['GET'])
 def get_universe_state():
-    """Get current universe visualization data"""
+    """Get current universe visualization data (?depth=&offset=&limit=)"""
     u = get_universe()
     return jsonify({
         "success": True,
-        **u.get_visualization_data()
+        **u.get_visualization_data(**page_args())
     })
 
 
+@app.route('/api/subtree/<point_id>', methods=['GET'])
+def get_subtree(point_id):
+    """Lazily load a page of any point's inner universe (?depth=&offset=&limit=)"""
+    u = get_universe()
+    subtree = u.get_subtree(point_id, **page_args())
+    
+    if subtree:
+        return jsonify({
+            "success": True,
+            **subtree
+        })
+    else:
+        return jsonify({"success": False, "error": "Point not found"}), 404
+
+
 @app.route('/api/universe/stats', methods=['GET'])
 def get_stats():
     """Get universe statistics"""
@@ -177,7 +201,8 @@ def search():
     """Search points by name"""
     u = get_universe()
     query = request.args.get('q', '')
-    results = u.search(query)
+    limit = request.args.get('limit', 20, type=int)
+    results = u.search(query, max(0, min(limit, DimensionalUniverse.PAGE_SIZE)))
     
     return jsonify({
         "success": True,
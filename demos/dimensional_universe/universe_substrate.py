@@ -16,11 +16,13 @@ Drill up = current universe becomes one point in higher dimension.
 The address τ(d, x, y, z, ...) gives O(1) access to any point at any depth.
 """
 
+import itertools
 import json
+import os
 import time
 import math
 import uuid
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
@@ -102,6 +104,83 @@ class DimensionalPoint:
         return result
 
 
+class TrigramIndex:
+    """
+    Incremental substring index over point names.
+    
+    Every lowercased name is split into overlapping 3-character grams,
+    each mapping to the ids containing it. A query's candidates are the
+    intersection of its grams' id sets (smallest first), so a search
+    touches only points that can match instead of the whole universe.
+    Queries shorter than 3 characters fall back to a scan of the names.
+    """
+    
+    N = 3
+    
+    def __init__(self):
+        self._grams: Dict[str, Set[str]] = {}
+        self._names: Dict[str, str] = {}  # id -> lowercased name
+        self._order: Dict[str, int] = {}  # id -> insertion sequence
+        self._seq = 0
+    
+    @classmethod
+    def grams(cls, text: str) -> Set[str]:
+        """All N-grams of already lowercased text"""
+        return {text[i:i + cls.N] for i in range(len(text) - cls.N + 1)}
+    
+    def add(self, point_id: str, name: str):
+        """Index (or re-index) a point's name"""
+        seq = self._order.get(point_id)
+        if seq is None:
+            seq = self._seq
+            self._seq += 1
+        else:
+            self.remove(point_id)
+        lowered = name.lower()
+        self._names[point_id] = lowered
+        self._order[point_id] = seq
+        for gram in self.grams(lowered):
+            self._grams.setdefault(gram, set()).add(point_id)
+    
+    def remove(self, point_id: str):
+        """Drop a point from the index"""
+        lowered = self._names.pop(point_id, None)
+        if lowered is None:
+            return
+        self._order.pop(point_id, None)
+        for gram in self.grams(lowered):
+            ids = self._grams.get(gram)
+            if ids is not None:
+                ids.discard(point_id)
+                if not ids:
+                    del self._grams[gram]
+    
+    def search(self, query: str, limit: int = 20) -> List[str]:
+        """Ids whose name contains query, in creation order (at most limit, >= 0)"""
+        query = query.lower()
+        limit = max(0, limit)
+        if len(query) < self.N:
+            matches = (pid for pid, name in self._names.items() if query in name)
+            return [pid for pid, _ in zip(matches, range(limit))]
+        
+        id_sets = []
+        for gram in self.grams(query):
+            ids = self._grams.get(gram)
+            if not ids:
+                return []
+            id_sets.append(ids)
+        id_sets.sort(key=len)
+        candidates = id_sets[0].intersection(*id_sets[1:])
+        
+        # Grams present does not imply contiguous - confirm each candidate
+        matches = [pid for pid in candidates if query in self._names[pid]]
+        matches.sort(key=self._order.__getitem__)
+        return matches[:limit]
+    
+    def __len__(self) -> int:
+        return len(self._names)
+
+
 class DimensionalUniverse:
     """
     The Universe - a navigable dimensional space.
@@ -131,6 +210,13 @@ class DimensionalUniverse:
         0: "Atom"
     }
     
+    # Inner points per page in visualization data
+    PAGE_SIZE = 200
+    
+    # Incremental save layout: manifest plus one file per inner universe
+    MANIFEST = "manifest.json"
+    UNIVERSES_DIR = "universes"
+    
     def __init__(self, name: str = "ButterflyFX"):
         self.name = name
         self.created_at = time.time()
@@ -146,6 +232,13 @@ class DimensionalUniverse:
         
         # O(1) address index - every point ever created
         self._index: Dict[str, DimensionalPoint] = {"omniverse": self.root}
+        self._names = TrigramIndex()
+        self._names.add(self.root.id, self.root.name)
+        
+        # Incremental persistence: ids whose inner universe changed since
+        # the last save to _saved_to
+        self._dirty: Set[str] = set()
+        self._saved_to: Optional[Path] = None
         
         # Current navigation position
         self._current_point: DimensionalPoint = self.root
@@ -211,10 +304,27 @@ class DimensionalUniverse:
         )
         
         parent.add_inner(point)
-        self._index[point_id] = point
+        self._register(point)
+        self._dirty.add(parent.id)
         
         return point
     
+    def _register(self, point: DimensionalPoint):
+        """Add a point to the address and name indexes"""
+        self._index[point.id] = point
+        self._names.add(point.id, point.name)
+    
+    def mark_dirty(self, point_id: str):
+        """
+        Flag a point as changed after editing it in place (name,
+        properties, coordinates) so the next incremental save rewrites it.
+        """
+        point = self._index.get(point_id)
+        if point is None:
+            return
+        self._names.add(point_id, point.name)
+        self._dirty.add(point._parent_id or point.id)
+    
     # =========== NAVIGATION ===========
     
     def current(self) -> DimensionalPoint:
@@ -408,28 +518,25 @@ class DimensionalUniverse:
             for p in self._current_point.list_inner()
         ]
     
-    def search(self, query: str) -> List[Dict]:
-        """Search all points by name"""
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """Search all points by name (trigram index, not a full scan)"""
         results = []
-        query_lower = query.lower()
-        
-        for point_id, point in self._index.items():
-            if query_lower in point.name.lower():
-                results.append({
-                    "id": point.id,
-                    "name": point.name,
-                    "dimension": point.dimension,
-                    "address": point.address
-                })
-        
-        return results[:20]  # Limit results
+        for point_id in self._names.search(query, limit):
+            point = self._index[point_id]
+            results.append({
+                "id": point.id,
+                "name": point.name,
+                "dimension": point.dimension,
+                "address": point.address
+            })
+        return results
     
     def stats(self) -> Dict:
         """Get universe statistics"""
         return {
             "name": self.name,
             "total_points": len(self._index),
-            "total_nested": self.root.total_points(),
+            "total_nested": len(self._index),  # every indexed point is in the tree
             "current_dimension": self._current_point.dimension,
             "current_dimension_name": self.dimension_name(),
             "current_point": self._current_point.name,
@@ -673,23 +780,82 @@ The dimension IS the lookup table. Each level is a hash map, not a list to searc
     
     # =========== VISUALIZATION DATA ===========
     
-    def get_visualization_data(self) -> Dict:
-        """Get data for 3D visualization"""
-        current = self._current_point
+    def _visual_point(self, p: DimensionalPoint) -> Dict:
+        """One point as rendered by the visualizer"""
+        return {
+            "id": p.id,
+            "name": p.name,
+            "position": list(p.coordinates),
+            "dimension": p.dimension,
+            "address": p.address,
+            "has_inner": p.inner_count() > 0,
+            "inner_count": p.inner_count(),
+            "properties": p.properties
+        }
+    
+    def _visual_page(
+        self,
+        point: DimensionalPoint,
+        depth: int,
+        offset: int,
+        limit: Optional[int]
+    ) -> List[Dict]:
+        """
+        A page of a point's inner universe, with `depth` further levels
+        of first pages nested under "inner_points"
+        """
+        inner = point._inner_universe.values()
+        stop = None if limit is None else offset + limit
+        page = []
+        for p in itertools.islice(inner, offset, stop):
+            entry = self._visual_point(p)
+            if depth > 0 and p._inner_universe:
+                entry["inner_points"] = self._visual_page(p, depth - 1, 0, limit)
+                entry["inner_truncated"] = limit is not None and p.inner_count() > limit
+            page.append(entry)
+        return page
+    
+    def get_subtree(
+        self,
+        point_id: str,
+        depth: int = 0,
+        offset: int = 0,
+        limit: Optional[int] = PAGE_SIZE
+    ) -> Optional[Dict]:
+        """
+        Lazily load part of any point's inner universe for the visualizer:
+        `limit` inner points starting at `offset`, each expanded `depth`
+        more levels. Only the requested slice is walked.
+        """
+        point = self._index.get(point_id)
+        if point is None:
+            return None
+        total = point.inner_count()
+        page = self._visual_page(point, depth, offset, limit)
+        return {
+            "id": point.id,
+            "inner_points": page,
+            "inner_total": total,
+            "offset": offset,
+            "limit": limit,
+            "has_more": offset + len(page) < total
+        }
+    
+    def get_visualization_data(
+        self,
+        depth: int = 0,
+        offset: int = 0,
+        limit: Optional[int] = PAGE_SIZE
+    ) -> Dict:
+        """
+        Get data for 3D visualization.
         
-        # Get inner points for rendering
-        inner_points = []
-        for p in current.list_inner():
-            inner_points.append({
-                "id": p.id,
-                "name": p.name,
-                "position": list(p.coordinates),
-                "dimension": p.dimension,
-                "address": p.address,
-                "has_inner": p.inner_count() > 0,
-                "inner_count": p.inner_count(),
-                "properties": p.properties
-            })
+        Inner points are paginated (`offset`/`limit`, None for all) and
+        may be expanded `depth` levels; deeper levels are fetched on
+        demand with get_subtree().
+        """
+        current = self._current_point
+        subtree = self.get_subtree(current.id, depth, offset, limit)
         
         return {
             "current": {
@@ -701,7 +867,10 @@ The dimension IS the lookup table. Each level is a hash map, not a list to searc
                 "properties": current.properties
             },
             "path": self.path(),
-            "inner_points": inner_points,
+            "inner_points": subtree["inner_points"],
+            "inner_total": subtree["inner_total"],
+            "offset": offset,
+            "has_more": subtree["has_more"],
             "can_drill_up": len(self._navigation_stack) > 1,
             "stats": self.stats()
         }
@@ -709,7 +878,7 @@ The dimension IS the lookup table. Each level is a hash map, not a list to searc
     # =========== PERSISTENCE ===========
     
     def save(self, path: str):
-        """Save universe to file"""
+        """Save universe to a single file (full rewrite, see save_incremental)"""
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         
         def serialize_point(p: DimensionalPoint) -> dict:
@@ -736,27 +905,111 @@ The dimension IS the lookup table. Each level is a hash map, not a list to searc
         with open(path, 'w') as f:
             json.dump(data, f, indent=2)
     
+    @staticmethod
+    def _point_record(p: DimensionalPoint) -> dict:
+        """A point without its inner universe"""
+        return {
+            "id": p.id,
+            "dimension": p.dimension,
+            "coordinates": list(p.coordinates),
+            "name": p.name,
+            "properties": p.properties
+        }
+    
+    @staticmethod
+    def _write_atomic(path: Path, data: dict):
+        """Write JSON via a temp file so a crash never leaves half a file"""
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    
+    def save_incremental(self, directory: str) -> Dict[str, int]:
+        """
+        Save universe to a directory, rewriting only what changed.
+        
+        Layout: manifest.json (universe metadata, root point, navigation)
+        plus universes/<point_id>.json holding the records of that point's
+        inner universe. Creating or editing a point dirties only its
+        parent's file, so repeated saves cost O(changed subtrees) rather
+        than O(universe). The first save to a directory writes everything.
+        """
+        directory = Path(directory)
+        universes_dir = directory / self.UNIVERSES_DIR
+        universes_dir.mkdir(parents=True, exist_ok=True)
+        
+        full = (
+            self._saved_to != directory.resolve()
+            or not (directory / self.MANIFEST).exists()
+        )
+        populated = [pid for pid, p in self._index.items() if p._inner_universe]
+        targets = populated if full else [
+            pid for pid in self._dirty
+            if pid in self._index and self._index[pid]._inner_universe
+        ]
+        
+        for pid in targets:
+            point = self._index[pid]
+            self._write_atomic(universes_dir / f"{pid}.json", {
+                "parent": pid,
+                "points": [self._point_record(p) for p in point._inner_universe.values()]
+            })
+        
+        # Manifest last: it only ever lists universe files already on disk
+        self._write_atomic(directory / self.MANIFEST, {
+            "format": "incremental",
+            "version": 1,
+            "name": self.name,
+            "created_at": self.created_at,
+            "root": self._point_record(self.root),
+            "current_id": self._current_point.id,
+            "navigation_stack": self._navigation_stack,
+            "universes": populated
+        })
+        
+        self._dirty.clear()
+        self._saved_to = directory.resolve()
+        return {"written": len(targets), "universes": len(populated)}
+    
+    @classmethod
+    def _empty(cls, name: str, created_at: float) -> 'DimensionalUniverse':
+        """Bare instance for loaders to populate"""
+        universe = cls.__new__(cls)
+        universe.name = name
+        universe.created_at = created_at
+        universe._index = {}
+        universe._names = TrigramIndex()
+        universe._dirty = set()
+        universe._saved_to = None
+        return universe
+    
+    @staticmethod
+    def _point_from_record(d: dict, parent_id: str = None) -> DimensionalPoint:
+        """Inverse of _point_record"""
+        point = DimensionalPoint(
+            id=d["id"],
+            dimension=d["dimension"],
+            coordinates=tuple(d["coordinates"]),
+            name=d["name"],
+            properties=d["properties"]
+        )
+        point._parent_id = parent_id
+        return point
+    
     @classmethod
     def load(cls, path: str) -> 'DimensionalUniverse':
-        """Load universe from file"""
+        """Load universe from a save() file or a save_incremental() directory"""
+        if Path(path).is_dir():
+            return cls._load_incremental(Path(path))
+        
         with open(path, 'r') as f:
             data = json.load(f)
         
-        universe = cls.__new__(cls)
-        universe.name = data["name"]
-        universe.created_at = data["created_at"]
-        universe._index = {}
+        universe = cls._empty(data["name"], data["created_at"])
         
         def deserialize_point(d: dict, parent_id: str = None) -> DimensionalPoint:
-            point = DimensionalPoint(
-                id=d["id"],
-                dimension=d["dimension"],
-                coordinates=tuple(d["coordinates"]),
-                name=d["name"],
-                properties=d["properties"]
-            )
-            point._parent_id = parent_id
-            universe._index[point.id] = point
+            point = cls._point_from_record(d, parent_id)
+            universe._register(point)
             
             for pid, inner_data in d.get("inner_universe", {}).items():
                 inner = deserialize_point(inner_data, point.id)
@@ -769,6 +1022,36 @@ The dimension IS the lookup table. Each level is a hash map, not a list to searc
         universe._current_point = universe._index[data["current_id"]]
         
         return universe
+    
+    @classmethod
+    def _load_incremental(cls, directory: Path) -> 'DimensionalUniverse':
+        """Rebuild a universe from a save_incremental() directory"""
+        with open(directory / cls.MANIFEST, 'r') as f:
+            manifest = json.load(f)
+        
+        records: Dict[str, List[dict]] = {}
+        for pid in manifest["universes"]:
+            with open(directory / cls.UNIVERSES_DIR / f"{pid}.json", 'r') as f:
+                records[pid] = json.load(f)["points"]
+        
+        universe = cls._empty(manifest["name"], manifest["created_at"])
+        universe.root = cls._point_from_record(manifest["root"])
+        universe._register(universe.root)
+        
+        # Walk down from the root so parents exist before their inner universes
+        pending = [universe.root]
+        while pending:
+            parent = pending.pop()
+            for d in records.get(parent.id, ()):
+                point = cls._point_from_record(d, parent.id)
+                parent._inner_universe[point.id] = point
+                universe._register(point)
+                pending.append(point)
+        
+        universe._navigation_stack = manifest["navigation_stack"]
+        universe._current_point = universe._index[manifest["current_id"]]
+        universe._saved_to = directory.resolve()
+        return universe
 
 
 # =========== DEMO ===========
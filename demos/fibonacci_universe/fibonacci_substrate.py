@@ -31,6 +31,10 @@ The Fibonacci structure explains WHY:
 
 import time
 import math
+import itertools
+import random
+import re
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import IntEnum
@@ -39,6 +43,17 @@ from enum import IntEnum
 # Fibonacci sequence
 FIBONACCI = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233]
 
+# Resolved path prefixes kept by FibonacciUniverse.invoke
+PATH_CACHE_SIZE = 10_000
+
+# Points materialized on demand by invoke() before the least recently
+# used leaves return to the void
+MAX_MATERIALIZED = 50_000
+
+# Global mutation clock: every change to a point takes the next tick, so
+# the largest tick in a subtree identifies that subtree's state
+_versions = itertools.count(1)
+
 
 class FibonacciLevel(IntEnum):
     """
@@ -98,6 +113,22 @@ class FibonacciPoint:
     _inner: Dict[str, 'FibonacciPoint'] = field(default_factory=dict)
     _inner_invoked: Set[str] = field(default_factory=set)  # Which inner points are real
     
+    # Mutation tick and to_dict() results per (depth, max_depth)
+    _version: int = field(default=0, repr=False, compare=False)
+    _dict_cache: Dict[Tuple[int, int], Tuple[int, dict]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._version = next(_versions)
+    
+    def touch(self):
+        """
+        Record a change to this point. Call after editing name, value or
+        properties in place so cached to_dict() results are rebuilt.
+        """
+        self._version = next(_versions)
+    
     @property
     def address(self) -> str:
         """
@@ -131,6 +162,7 @@ class FibonacciPoint:
         if not self.invoked:
             self.invoked = True
             self.invoked_at = time.time()
+            self.touch()
         return self
     
     def get_inner(self, point_id: str) -> Optional['FibonacciPoint']:
@@ -150,10 +182,27 @@ class FibonacciPoint:
         if point_id in self._inner:
             point = self._inner[point_id]
             point.invoke()
-            self._inner_invoked.add(point_id)
+            if point_id not in self._inner_invoked:
+                self._inner_invoked.add(point_id)
+                self.touch()
             return point
         return None
     
+    def describe_inner(self, point: 'FibonacciPoint'):
+        """Add a potential (uninvoked) point to the inner universe"""
+        self._inner[point.id] = point
+        self.touch()
+    
+    def release_inner(self, point_id: str) -> Optional['FibonacciPoint']:
+        """Return an inner point to the void - it is forgotten entirely"""
+        point = self._inner.pop(point_id, None)
+        if point is not None:
+            self._inner_invoked.discard(point_id)
+            point.invoked = False
+            point.touch()
+            self.touch()
+        return point
+    
     def create_inner(self, point_id: str, name: str = "", 
                      coordinates: Tuple[float, ...] = None,
                      value: Any = None) -> Optional['FibonacciPoint']:
@@ -184,8 +233,13 @@ class FibonacciPoint:
             invoked_at=time.time()
         )
         
+        replaced = self._inner.get(point_id)
+        if replaced is not None:
+            replaced.invoked = False  # Superseded - back to the void
+        
         self._inner[point_id] = point
         self._inner_invoked.add(point_id)
+        self.touch()
         return point
     
     def list_invoked_inner(self) -> List['FibonacciPoint']:
@@ -201,7 +255,34 @@ class FibonacciPoint:
         return len(self._inner) - len(self._inner_invoked)
     
     def to_dict(self, depth: int = 0, max_depth: int = 2) -> dict:
-        """Serialize to dict"""
+        """
+        Serialize to dict.
+        
+        Results are cached per (depth, max_depth) and reused until this
+        point or a serialized inner point changes; treat them as read-only.
+        """
+        return self._serialize(depth, max_depth)[1]
+    
+    def _serialize(self, depth: int, max_depth: int,
+                   use_cache: bool = True) -> Tuple[int, dict]:
+        """
+        (version, dict) where version is the latest mutation tick among
+        the points included. Inner points are resolved first, so a node's
+        dict is only rebuilt when something it includes has changed.
+        """
+        inner = []
+        version = self._version
+        if depth < max_depth and self._inner_invoked:
+            for pid in list(self._inner_invoked)[:10]:
+                inner_version, inner_dict = self._inner[pid]._serialize(depth + 1, max_depth, use_cache)
+                inner.append((pid, inner_dict))
+                version = max(version, inner_version)
+        
+        key = (depth, max_depth)
+        cached = self._dict_cache.get(key) if use_cache else None
+        if cached is not None and cached[0] == version:
+            return cached
+        
         level_enum = FibonacciLevel(self.level)
         
         result = {
@@ -223,13 +304,12 @@ class FibonacciPoint:
             "is_whole": self.is_whole
         }
         
-        if depth < max_depth and self._inner_invoked:
-            result["inner"] = {
-                pid: self._inner[pid].to_dict(depth + 1, max_depth)
-                for pid in list(self._inner_invoked)[:10]
-            }
+        if inner:
+            result["inner"] = dict(inner)
         
-        return result
+        if use_cache:
+            self._dict_cache[key] = (version, result)
+        return version, result
 
 
 class FibonacciUniverse:
@@ -253,7 +333,9 @@ class FibonacciUniverse:
         FibonacciLevel.WHOLE: "Completion - becomes a POINT in next scale"
     }
     
-    def __init__(self, name: str = "Fibonacci Universe"):
+    def __init__(self, name: str = "Fibonacci Universe",
+                 path_cache_size: int = PATH_CACHE_SIZE,
+                 max_materialized: int = MAX_MATERIALIZED):
         self.name = name
         self.created_at = time.time()
         
@@ -279,6 +361,16 @@ class FibonacciUniverse:
         self._current: FibonacciPoint = self.root
         self._path: List[str] = ["whole"]
         
+        # Normalized path -> chain of points it resolved to (LRU). A path
+        # resumes from its longest cached prefix.
+        self.path_cache_size = path_cache_size
+        self._path_cache: "OrderedDict[Tuple[str, ...], Tuple[Tuple[FibonacciPoint, ...], Tuple[dict, ...]]]" = OrderedDict()
+        
+        # Points invoke() created from nothing, by path (LRU) with their
+        # parent. Over budget, unused leaves are released back to the void.
+        self.max_materialized = max_materialized
+        self._materialized: "OrderedDict[Tuple[str, ...], Tuple[FibonacciPoint, FibonacciPoint]]" = OrderedDict()
+        
         # Create initial structure
         self._initialize()
     
@@ -355,21 +447,44 @@ class FibonacciUniverse:
     
     # ========== INVOCATION (Creation from Void) ==========
     
+    @staticmethod
+    def normalize_path(path: str) -> Tuple[str, ...]:
+        """Path parts, accepting "." or "/" separators and stray separators"""
+        return tuple(part for part in re.split(r"[./]", path.strip()) if part)
+    
     def invoke(self, path: str) -> Tuple[Optional[FibonacciPoint], float, List[str]]:
         """
         Invoke a path of points, manifesting them from the void.
         
         path: "cosmos.galaxy_plane.local_region" etc.
         
+        The longest previously resolved prefix is taken from the path
+        cache, so "a.b.c" only walks "c" once "a.b" has been invoked.
+        
         Returns: (point, time_ns, steps) for O(d) complexity proof
         """
         start = time.perf_counter_ns()
         steps = []
         
-        parts = path.split(".")
-        current = self.root
+        parts = self.normalize_path(path)
+        chain: List[FibonacciPoint] = []
+        
+        for n in range(len(parts), 0, -1):
+            cached = self._path_cache.get(parts[:n])
+            if cached is None:
+                continue
+            if all(point.invoked for point in cached[0]):
+                self._path_cache.move_to_end(parts[:n])
+                chain = list(cached[0])
+                steps = list(cached[1])
+                break
+            # Something on the chain was released or replaced since
+            del self._path_cache[parts[:n]]
+        
+        current = chain[-1] if chain else self.root
         
-        for part in parts:
+        for i in range(len(chain), len(parts)):
+            part = parts[i]
             step_start = time.perf_counter_ns()
             
             # Check if we've hit an irreducible point
@@ -396,6 +511,7 @@ class FibonacciUniverse:
                 next_point = current.create_inner(part, name=part)
                 if next_point:
                     self._index[part] = next_point
+                    self._materialized[parts[:i + 1]] = (current, next_point)
             
             if next_point is None:
                 # Creation failed (at POINT level)
@@ -417,11 +533,63 @@ class FibonacciUniverse:
             })
             
             current = next_point
+            chain.append(next_point)
+            self._cache_path(parts[:i + 1], chain, steps)
+        
+        self._touch_materialized(parts[:len(chain)])
+        self._release_over_budget()
         
         total_time = time.perf_counter_ns() - start
         
         return current, total_time, steps
     
+    def _cache_path(self, parts: Tuple[str, ...], chain: List[FibonacciPoint],
+                    steps: List[dict]):
+        """Remember what a path prefix resolved to, and its steps as cache hits"""
+        if self.path_cache_size <= 0:
+            return
+        prefix = self._path_cache.get(parts[:-1])
+        if prefix is not None and prefix[0][-1] is chain[-2]:
+            cached_steps = prefix[1]
+        else:
+            cached_steps = tuple(
+                dict(step, time_ns=0, cached=True) for step in steps[:-1]
+            )
+        cached_steps += (dict(steps[-1], time_ns=0, cached=True),)
+        self._path_cache[parts] = (tuple(chain), cached_steps)
+        self._path_cache.move_to_end(parts)
+        while len(self._path_cache) > self.path_cache_size:
+            self._path_cache.popitem(last=False)
+    
+    def _touch_materialized(self, parts: Tuple[str, ...]):
+        """
+        Mark the materialized points on a path as recently used, deepest
+        first, so ancestors stay more recent than their inner points and
+        eviction reaches leaves first.
+        """
+        for n in range(len(parts), 0, -1):
+            if parts[:n] in self._materialized:
+                self._materialized.move_to_end(parts[:n])
+    
+    def _release_over_budget(self):
+        """
+        Return least recently used materialized leaves to the void until
+        the budget holds. Points with invoked inner points, and the current
+        position, are kept.
+        """
+        attempts = len(self._materialized)
+        while len(self._materialized) > self.max_materialized and attempts > 0:
+            attempts -= 1
+            parts, (parent, point) = self._materialized.popitem(last=False)
+            if point._inner_invoked or point is self._current:
+                self._materialized[parts] = (parent, point)
+                continue
+            if parent._inner.get(point.id) is point:
+                parent.release_inner(point.id)
+            if self._index.get(point.id) is point:
+                del self._index[point.id]
+            self._path_cache.pop(parts, None)
+    
     def invoke_at(self, point_id: str) -> Optional[FibonacciPoint]:
         """
         Direct O(1) invocation by ID if already in index.
@@ -507,7 +675,9 @@ class FibonacciUniverse:
             "current_level": FibonacciLevel(self._current.level).name,
             "current_scale": self._current.scale,
             "path": self._path,
-            "path_string": self.path_string()
+            "path_string": self.path_string(),
+            "materialized": len(self._materialized),
+            "cached_paths": len(self._path_cache)
         }
     
     def demonstrate_o_d(self) -> dict:
@@ -653,6 +823,59 @@ class FibonacciUniverse:
         }
 
 
+# ========== BENCHMARK ==========
+
+def benchmark_navigation(moves: int = 20_000, fanout: int = 8, depth: int = 6,
+                         max_materialized: int = 5_000, seed: int = 0) -> dict:
+    """
+    Deep random navigation: a random walk that drills down or climbs back
+    up and resolves the full path from the root at every move, as the
+    server does. Compares path and to_dict() caching under a
+    materialization budget against uncached, unbounded resolution.
+    """
+    import contextlib
+    import io
+    
+    rng = random.Random(seed)
+    walk, paths = [], []
+    for _ in range(moves):
+        if walk and (len(walk) == depth or rng.random() < 0.4):
+            del walk[rng.randint(1, len(walk)) - 1:]
+        else:
+            walk.append(f"n{rng.randrange(fanout)}")
+        paths.append(".".join(["cosmos"] + walk))
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        plain = FibonacciUniverse("plain", path_cache_size=0,
+                                  max_materialized=float("inf"))
+        cached = FibonacciUniverse("cached", max_materialized=max_materialized)
+    
+    def count_points(point):
+        return 1 + sum(count_points(p) for p in point.list_invoked_inner())
+    
+    def run(universe, serialize):
+        start = time.perf_counter()
+        finals = []
+        for path in paths:
+            point, _, _ = universe.invoke(path)
+            serialize(point)
+            finals.append((point.id, point.level))
+        return time.perf_counter() - start, finals
+    
+    plain_s, plain_finals = run(plain, lambda p: p._serialize(0, 2, use_cache=False))
+    cached_s, cached_finals = run(cached, lambda p: p.to_dict())
+    
+    return {
+        "moves": moves,
+        "uncached_moves_per_sec": round(moves / plain_s),
+        "cached_moves_per_sec": round(moves / cached_s),
+        "speedup": round(plain_s / cached_s, 2),
+        "uncached_points": count_points(plain.root),
+        "cached_points": count_points(cached.root),
+        "identical": plain_finals == cached_finals,
+    }
+
+
 # ========== DEMO ==========
 
 if __name__ == "__main__":
@@ -182,7 +182,7 @@ def demo_void():
     potential_ids = ["potential_1", "potential_2", "potential_3"]
     for pid in potential_ids:
         if pid not in current._inner:
-            current._inner[pid] = FibonacciUniverse._create_potential_point(pid, current.level)
+            current.describe_inner(FibonacciUniverse._create_potential_point(pid, current.level))
     
     return jsonify({
         "current": current.to_dict(max_depth=0),
@@ -17,12 +17,16 @@ Pure Python with PIL - fast rendering!
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
-import subprocess
+import sys
 import tempfile
 import math
 import wave
 import struct
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helix.packages.media_pkg import RenderPipeline, add_pipeline_arguments
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
@@ -610,58 +614,48 @@ def generate_audio(output_path):
 # MAIN RENDER
 # ============================================================================
 
-def render_video():
+def scene_label(frame_num):
+    """Progress label for a frame"""
+    return get_scene(frame_num / FPS)[0]
+
+def render_video(workers=None, start=0, stop=None, segment_frames=None,
+                 null_sink=False):
     print("=" * 60)
     print("ButterflyFX 7 LEVELS PROMO VIDEO")
     print("=" * 60)
     print()
     
     temp_dir = tempfile.mkdtemp(prefix='butterflyfx_7levels_')
-    frames_dir = os.path.join(temp_dir, 'frames')
-    os.makedirs(frames_dir)
     
     print(f"Temp: {temp_dir}")
     print(f"Target: {WIDTH}x{HEIGHT} @ {FPS}fps, {DURATION}s")
     print()
     
-    print("STEP 1: Generating frames...")
-    for frame_num in range(TOTAL_FRAMES):
-        if frame_num % 90 == 0:
-            pct = frame_num / TOTAL_FRAMES * 100
-            scene_name, _ = get_scene(frame_num / FPS)
-            print(f"  Frame {frame_num}/{TOTAL_FRAMES} ({pct:.1f}%) - {scene_name}")
-        
-        img = create_frame(frame_num)
-        img.save(os.path.join(frames_dir, f'frame_{frame_num:05d}.png'), 'PNG')
-    
-    print(f"  Generated {TOTAL_FRAMES} frames")
-    
-    print("\nSTEP 2: Generating audio...")
-    audio_path = os.path.join(temp_dir, 'ambient.wav')
-    generate_audio(audio_path)
-    print(f"  Audio: {audio_path}")
+    print("STEP 1: Generating audio...")
+    audio_path = None
+    if null_sink:
+        print("  Skipped (null sink)")
+    else:
+        audio_path = os.path.join(temp_dir, 'ambient.wav')
+        generate_audio(audio_path)
+        print(f"  Audio: {audio_path}")
     
-    print("\nSTEP 3: Encoding video...")
+    print("\nSTEP 2: Rendering and encoding frames...")
     output_path = '/opt/butterflyfx/dimensionsos/demos/dimensional_7levels.mp4'
     
-    result = subprocess.run([
-        'ffmpeg', '-y',
-        '-framerate', str(FPS),
-        '-i', os.path.join(frames_dir, 'frame_%05d.png'),
-        '-i', audio_path,
-        '-c:v', 'libx264', '-preset', 'medium', '-crf', '20',
-        '-c:a', 'aac', '-b:a', '192k',
-        '-pix_fmt', 'yuv420p',
-        '-shortest',
-        output_path
-    ], capture_output=True, text=True)
-    
-    if result.returncode == 0:
-        size = os.path.getsize(output_path)
-        print(f"\n✓ SUCCESS: {output_path}")
-        print(f"  Size: {size / 1024 / 1024:.2f} MB")
+    pipeline = RenderPipeline(create_frame, WIDTH, HEIGHT, FPS, TOTAL_FRAMES,
+                              workers=workers, progress_every=90,
+                              label_fn=scene_label)
+    try:
+        pipeline.run(output_path, audio_path, start, stop, segment_frames,
+                     null_sink, crf=20, preset='medium')
+    except RuntimeError as e:
+        print(f"\nError: {e}")
     else:
-        print(f"\nError: {result.stderr}")
+        if not null_sink:
+            size = os.path.getsize(output_path)
+            print(f"\n✓ SUCCESS: {output_path}")
+            print(f"  Size: {size / 1024 / 1024:.2f} MB")
     
     import shutil
     shutil.rmtree(temp_dir)
@@ -674,4 +668,7 @@ def render_video():
     print("=" * 60)
 
 if __name__ == "__main__":
-    render_video()
+    import argparse
+    parser = argparse.ArgumentParser(description="Render the 7 Levels promo video")
+    add_pipeline_arguments(parser)
+    render_video(**vars(parser.parse_args()))
@@ -18,7 +18,6 @@ import sys
 import math
 import struct
 import wave
-import subprocess
 import tempfile
 from pathlib import Path
 
@@ -30,7 +29,10 @@ from helix.kernel_primitives import (
     RGB, RGBA, Vector2D, Vector3D, Matrix4x4,
     Frequency, Duration
 )
-from helix.packages.media_pkg import FrameSubstrate, AudioSubstrate, VideoSubstrate
+from helix.packages.media_pkg import (
+    FrameSubstrate, AudioSubstrate,
+    RenderPipeline, add_pipeline_arguments,
+)
 from helix.packages.ai_substrate import get_ai
 
 
@@ -336,7 +338,55 @@ def samples_to_wav(samples, filepath, sample_rate=44100):
             wav.writeframes(struct.pack('<h', value))
 
 
-def render_video():
+def get_narration_text(t):
+    """Current narration line at time t"""
+    current_text = ""
+    for start, text in NARRATION_SCRIPT:
+        if t >= start:
+            current_text = text
+        else:
+            break
+    return current_text
+
+
+_frame_sub = None
+
+
+def render_frame(frame_num):
+    """Render one frame (pipeline worker entry point)"""
+    global _frame_sub
+    if _frame_sub is None:
+        # One substrate per worker process
+        _frame_sub = FrameSubstrate(WIDTH, HEIGHT)
+    
+    t = frame_num / FPS
+    
+    # Create frame
+    frame = _frame_sub.create_frame(t)
+    
+    # Layer 1: Animated gradient background
+    create_gradient_frame(_frame_sub, frame, t)
+    
+    # Layer 2: Spectral ring (showing wavelength derivation)
+    ring_radius = 150 + 30 * math.sin(t * 0.5)
+    draw_spectral_ring(_frame_sub, frame, t, WIDTH//2, HEIGHT//2, ring_radius)
+    
+    # Layer 3: 3D Helix
+    helix_radius = 100 + 20 * math.sin(t * 0.3)
+    draw_helix_3d(_frame_sub, frame, t, WIDTH//2, HEIGHT//2, helix_radius)
+    
+    # Layer 4: Particles
+    draw_particles(_frame_sub, frame, t)
+    
+    # Layer 5: Text glow
+    text = get_narration_text(t)
+    draw_text_glow(_frame_sub, frame, text, WIDTH//2, HEIGHT - 100, t)
+    
+    return frame
+
+
+def render_video(workers=None, start=0, stop=None, segment_frames=None,
+                 null_sink=False):
     """Main video rendering function"""
     print("=" * 60)
     print("ButterflyFX PROMOTIONAL VIDEO GENERATOR")
@@ -351,152 +401,57 @@ def render_video():
     print()
     
     # Initialize substrates
-    frame_sub = FrameSubstrate(WIDTH, HEIGHT)
     audio_sub = AudioSubstrate()
-    video_sub = VideoSubstrate()
     
-    # Create temp directory
+    # Temp directory holds the audio track only - frames stream to ffmpeg
     temp_dir = tempfile.mkdtemp(prefix="butterflyfx_")
-    frames_dir = os.path.join(temp_dir, "frames")
-    os.makedirs(frames_dir)
     
     print(f"Temp directory: {temp_dir}")
     print(f"Target: {WIDTH}x{HEIGHT} @ {FPS}fps, {DURATION}s")
     print()
     
-    # Step 1: Generate frames
-    print("STEP 1: Generating video frames...")
+    output_path = "/opt/butterflyfx/dimensionsos/demos/butterflyfx_promo.mp4"
     total_frames = FPS * DURATION
+    audio_path = None
     
-    # Find current narration text for each frame
-    def get_narration_text(t):
-        current_text = ""
-        for start, text in NARRATION_SCRIPT:
-            if t >= start:
-                current_text = text
-            else:
-                break
-        return current_text
-    
-    try:
-        from PIL import Image
-        has_pil = True
-    except:
-        has_pil = False
-    
-    for frame_num in range(total_frames):
-        t = frame_num / FPS
-        
-        # Create frame
-        frame = frame_sub.create_frame(t)
-        
-        # Layer 1: Animated gradient background
-        create_gradient_frame(frame_sub, frame, t)
-        
-        # Layer 2: Spectral ring (showing wavelength derivation)
-        ring_radius = 150 + 30 * math.sin(t * 0.5)
-        draw_spectral_ring(frame_sub, frame, t, WIDTH//2, HEIGHT//2, ring_radius)
-        
-        # Layer 3: 3D Helix
-        helix_radius = 100 + 20 * math.sin(t * 0.3)
-        draw_helix_3d(frame_sub, frame, t, WIDTH//2, HEIGHT//2, helix_radius)
-        
-        # Layer 4: Particles
-        draw_particles(frame_sub, frame, t)
-        
-        # Layer 5: Text glow
-        text = get_narration_text(t)
-        draw_text_glow(frame_sub, frame, text, WIDTH//2, HEIGHT - 100, t)
-        
-        # Save frame
-        frame_path = os.path.join(frames_dir, f"frame_{frame_num:05d}.png")
+    # Step 1: Generate audio (ffmpeg needs it before frames start streaming)
+    print("STEP 1: Generating audio...")
+    if null_sink:
+        print("  Skipped (null sink)")
+    else:
+        music = generate_ambient_music(audio_sub, DURATION)
+        voice = generate_voice_narration(DURATION)
+        mixed = mix_audio(music, voice)
         
-        if has_pil:
-            img = frame.to_pil()
-            img.save(frame_path)
-        else:
-            # Fallback: just save as raw
-            frame_path = frame_path.replace('.png', '.raw')
-            with open(frame_path, 'wb') as f:
-                for y in range(HEIGHT):
-                    for x in range(WIDTH):
-                        c = frame.get_pixel(x, y)
-                        f.write(bytes([c.r, c.g, c.b]))
+        audio_path = os.path.join(temp_dir, "audio.wav")
+        samples_to_wav(mixed, audio_path)
+        print(f"  Audio saved: {audio_path}")
         
-        if frame_num % (FPS * 5) == 0:
-            print(f"  Frame {frame_num}/{total_frames} ({t:.0f}s)")
-    
-    print(f"  Generated {total_frames} frames")
-    
-    # Step 2: Generate audio
-    print("\nSTEP 2: Generating audio...")
-    music = generate_ambient_music(audio_sub, DURATION)
-    voice = generate_voice_narration(DURATION)
-    mixed = mix_audio(music, voice)
+        # Ensure demos directory exists
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    audio_path = os.path.join(temp_dir, "audio.wav")
-    samples_to_wav(mixed, audio_path)
-    print(f"  Audio saved: {audio_path}")
-    
-    # Step 3: Encode video with ffmpeg
-    print("\nSTEP 3: Encoding video with ffmpeg...")
-    output_path = "/opt/butterflyfx/dimensionsos/demos/butterflyfx_promo.mp4"
-    
-    # Ensure demos directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    if has_pil:
-        ffmpeg_cmd = [
-            "ffmpeg", "-y",
-            "-framerate", str(FPS),
-            "-i", os.path.join(frames_dir, "frame_%05d.png"),
-            "-i", audio_path,
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "23",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-shortest",
-            output_path
-        ]
-    else:
-        # For raw frames, need different approach
-        ffmpeg_cmd = [
-            "ffmpeg", "-y",
-            "-f", "rawvideo",
-            "-pixel_format", "rgb24",
-            "-video_size", f"{WIDTH}x{HEIGHT}",
-            "-framerate", str(FPS),
-            "-i", os.path.join(frames_dir, "frame_%05d.raw"),
-            "-i", audio_path,
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "23",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-shortest",
-            output_path
-        ]
-    
-    print(f"  Running: {' '.join(ffmpeg_cmd[:5])}...")
-    result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-    
-    if result.returncode == 0:
-        print(f"\n{'=' * 60}")
-        print("VIDEO GENERATION COMPLETE!")
-        print(f"{'=' * 60}")
-        print(f"Output: {output_path}")
-        
-        # Get file size
-        size = os.path.getsize(output_path)
-        print(f"Size: {size / (1024*1024):.1f} MB")
-        print(f"Duration: {DURATION}s")
-        print(f"Resolution: {WIDTH}x{HEIGHT}")
-        print(f"FPS: {FPS}")
+    # Step 2: Render frames and pipe them into ffmpeg
+    print("\nSTEP 2: Rendering and encoding video frames...")
+    pipeline = RenderPipeline(render_frame, WIDTH, HEIGHT, FPS, total_frames,
+                              workers=workers, progress_every=FPS * 5)
+    try:
+        pipeline.run(output_path, audio_path, start, stop, segment_frames,
+                     null_sink, crf=23, preset="medium")
+    except RuntimeError as e:
+        print(f"  ffmpeg error: {str(e)[:500]}")
     else:
-        print(f"  ffmpeg error: {result.stderr[:500]}")
+        if not null_sink:
+            print(f"\n{'=' * 60}")
+            print("VIDEO GENERATION COMPLETE!")
+            print(f"{'=' * 60}")
+            print(f"Output: {output_path}")
+            
+            # Get file size
+            size = os.path.getsize(output_path)
+            print(f"Size: {size / (1024*1024):.1f} MB")
+            print(f"Duration: {DURATION}s")
+            print(f"Resolution: {WIDTH}x{HEIGHT}")
+            print(f"FPS: {FPS}")
     
     # Cleanup
     print("\nCleaning up temp files...")
@@ -508,4 +463,7 @@ def render_video():
 
 
 if __name__ == "__main__":
-    render_video()
+    import argparse
+    parser = argparse.ArgumentParser(description="Render the ButterflyFX promo video")
+    add_pipeline_arguments(parser)
+    render_video(**vars(parser.parse_args()))
@@ -109,6 +109,7 @@ _MANIFOLD_MAP = {
     # ═══════════════════════════════════════════════════════════════════════
     'HelixKernel':          '.kernel',
     'HelixState':           '.kernel',
+    'on_collapse':          '.kernel',
     'LEVEL_NAMES':          '.kernel',
     'LEVEL_ICONS':          '.kernel',
 
@@ -251,6 +252,7 @@ _MANIFOLD_MAP = {
     'dimensional':          '.decorators',
     'at_level':             '.decorators',
     'cached_by_level':      '.decorators',
+    'cached_by_spiral':     '.decorators',
     'spiral_scoped':        '.decorators',
     'timed':                '.decorators',
     'trace_helix':          '.decorators',
@@ -484,6 +486,10 @@ _MANIFOLD_MAP = {
     'DimensionalLogger':    '.dev_utils',
     'Profiler':             '.dev_utils',
     'benchmark':            '.dev_utils',
+    'LatencyHistogram':     '.dev_utils',
+    'SpanRecorder':         '.dev_utils',
+    'SamplingProfiler':     '.dev_utils',
+    'instrument_helix':     '.dev_utils',
     'typecheck':            '.dev_utils',
     'inspect_substrate':    '.dev_utils',
     'inspect_kernel':       '.dev_utils',
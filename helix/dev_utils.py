@@ -11,7 +11,7 @@ Attribution required: Kenneth Bingham - https://butterflyfx.us
 Developer tools for building, debugging, and optimizing dimensional code:
 
 - Decorators for substrate creation
-- Profiling and benchmarking
+- Profiling and benchmarking (latency histograms, spans, sampling profiler)
 - Debugging and introspection
 - Type validation
 - Fluent builders
@@ -32,6 +32,10 @@ from typing import (
 from functools import wraps, lru_cache
 from contextlib import contextmanager
 from enum import Enum, auto
+import inspect
+import math
+import os
+import threading
 import time
 import traceback
 import sys
@@ -110,6 +114,9 @@ class ProfileResult:
     min_time_ns: int
     max_time_ns: int
     avg_time_ns: float
+    p50_time_ns: int = 0
+    p99_time_ns: int = 0
+    p999_time_ns: int = 0
     
     @property
     def total_ms(self) -> float:
@@ -123,7 +130,8 @@ class ProfileResult:
         return (f"Profile({self.function_name}: "
                 f"calls={self.call_count}, "
                 f"total={self.total_ms:.2f}ms, "
-                f"avg={self.avg_ms:.3f}ms)")
+                f"avg={self.avg_ms:.3f}ms, "
+                f"p99={self.p99_time_ns / 1_000_000:.3f}ms)")
 
 
 class Profiler:
@@ -142,7 +150,7 @@ class Profiler:
     """
     
     def __init__(self):
-        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._stats: Dict[str, LatencyHistogram] = {}
         self._enabled = True
     
     def enable(self) -> None:
@@ -152,19 +160,14 @@ class Profiler:
         self._enabled = False
     
     def reset(self) -> None:
-        self._stats.clear()
+        # Zero in place - profiled wrappers keep their histogram
+        for hist in self._stats.values():
+            hist.reset()
     
     def profile(self, fn: F) -> F:
         """Decorator to profile a function"""
         name = fn.__qualname__
-        
-        if name not in self._stats:
-            self._stats[name] = {
-                'count': 0,
-                'total_ns': 0,
-                'min_ns': float('inf'),
-                'max_ns': 0,
-            }
+        hist = self._stats.setdefault(name, LatencyHistogram())
         
         @wraps(fn)
         def wrapper(*args, **kwargs):
@@ -175,27 +178,26 @@ class Profiler:
             try:
                 return fn(*args, **kwargs)
             finally:
-                elapsed = time.perf_counter_ns() - start
-                stats = self._stats[name]
-                stats['count'] += 1
-                stats['total_ns'] += elapsed
-                stats['min_ns'] = min(stats['min_ns'], elapsed)
-                stats['max_ns'] = max(stats['max_ns'], elapsed)
+                hist.record(time.perf_counter_ns() - start)
         
         return wrapper
     
     def results(self) -> List[ProfileResult]:
         """Get all profiling results"""
         results = []
-        for name, stats in self._stats.items():
-            if stats['count'] > 0:
+        for name, hist in self._stats.items():
+            if hist.count > 0:
+                p = hist.percentiles((50, 99, 99.9))
                 results.append(ProfileResult(
                     function_name=name,
-                    call_count=stats['count'],
-                    total_time_ns=stats['total_ns'],
-                    min_time_ns=stats['min_ns'],
-                    max_time_ns=stats['max_ns'],
-                    avg_time_ns=stats['total_ns'] / stats['count']
+                    call_count=hist.count,
+                    total_time_ns=hist.total,
+                    min_time_ns=hist.min,
+                    max_time_ns=hist.max,
+                    avg_time_ns=hist.mean,
+                    p50_time_ns=p[50],
+                    p99_time_ns=p[99],
+                    p999_time_ns=p[99.9],
                 ))
         return sorted(results, key=lambda r: r.total_time_ns, reverse=True)
     
@@ -206,15 +208,16 @@ class Profiler:
             return "No profiling data collected."
         
         lines = ["=== PROFILING REPORT ==="]
-        lines.append(f"{'Function':<40} {'Calls':>10} {'Total':>12} {'Avg':>12}")
-        lines.append("-" * 76)
+        lines.append(f"{'Function':<40} {'Calls':>10} {'Total':>12} {'Avg':>12} {'p99':>12}")
+        lines.append("-" * 89)
         
         for r in results:
             lines.append(
                 f"{r.function_name:<40} "
                 f"{r.call_count:>10} "
                 f"{r.total_ms:>10.2f}ms "
-                f"{r.avg_ms:>10.3f}ms"
+                f"{r.avg_ms:>10.3f}ms "
+                f"{r.p99_time_ns / 1_000_000:>10.3f}ms"
             )
         
         return "\n".join(lines)
@@ -266,6 +269,501 @@ def benchmark(iterations: int = 1000, warmup: int = 100):
     return decorator
 
 
+# =============================================================================
+# LATENCY HISTOGRAMS AND SPANS
+# =============================================================================
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram over nanosecond values.
+    
+    Buckets are log-linear: exact below 64 ns, then 32 sub-buckets per
+    power of two, so every value is reported to within ~3% from a fixed
+    1920-slot array no matter how many samples are recorded. Recording is
+    a few integer ops; percentiles walk the array.
+    
+    Counters are plain ints - under heavy multi-threaded recording a rare
+    increment can be lost, which is acceptable for latency statistics.
+    """
+    
+    SUB_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BITS
+    SLOTS = (65 - SUB_BITS) << SUB_BITS
+    
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+    
+    def __init__(self):
+        self.counts = [0] * self.SLOTS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+    
+    def record(self, value: int) -> None:
+        if value < 64:
+            index = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - 6
+            index = (shift << 5) + (value >> shift)
+        self.counts[index] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+    
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        """Highest value that lands in bucket `index`"""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        shift = (index >> cls.SUB_BITS) - 1
+        mantissa = index - (shift << cls.SUB_BITS)
+        return ((mantissa + 1) << shift) - 1
+    
+    def percentile(self, q: float) -> int:
+        """Value at percentile q (0-100), to bucket precision"""
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(self._upper_bound(index), self.max)
+        return self.max
+    
+    def percentiles(self, qs: Tuple[float, ...] = (50, 90, 99, 99.9)) -> Dict[float, int]:
+        """Several percentiles in one pass"""
+        result = {}
+        if not self.count:
+            return {q: 0 for q in qs}
+        targets = sorted((max(1, math.ceil(self.count * q / 100.0)), q) for q in qs)
+        seen = 0
+        pending = iter(targets)
+        target, q = next(pending)
+        for index, n in enumerate(self.counts):
+            if not n:
+                continue
+            seen += n
+            while seen >= target:
+                result[q] = min(self._upper_bound(index), self.max)
+                nxt = next(pending, None)
+                if nxt is None:
+                    return result
+                target, q = nxt
+        return result
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def merge(self, other: 'LatencyHistogram') -> None:
+        if not other.count:
+            return
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+    
+    def reset(self) -> None:
+        self.counts = [0] * self.SLOTS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+    
+    def summary(self) -> Dict[str, Any]:
+        p = self.percentiles((50, 90, 99, 99.9))
+        return {
+            'count': self.count,
+            'mean_ns': round(self.mean, 1),
+            'min_ns': self.min,
+            'max_ns': self.max,
+            'p50_ns': p[50],
+            'p90_ns': p[90],
+            'p99_ns': p[99],
+            'p999_ns': p[99.9],
+        }
+
+
+class _Span:
+    __slots__ = ('_hist', '_start')
+    
+    def __init__(self, hist: LatencyHistogram):
+        self._hist = hist
+    
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc):
+        self._hist.record(time.perf_counter_ns() - self._start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _prometheus_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class SpanRecorder:
+    """
+    Latency of named spans, recorded into LatencyHistograms.
+    
+    Usage:
+        with spans.span('substrate.lookup'):
+            ...
+        
+        @spans.timed('serializer.to_json')
+        def to_json(...):
+            ...
+        
+        spans.enable()
+        print(spans.report())
+        print(spans.to_prometheus())
+    
+    An enabled span costs two perf_counter_ns() calls and a histogram
+    record (~1 µs); a disabled one is a shared no-op context manager /
+    a single flag check in the decorator.
+    """
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+    
+    def enable(self) -> None:
+        self.enabled = True
+    
+    def disable(self) -> None:
+        self.enabled = False
+    
+    def reset(self) -> None:
+        # Zero in place - decorated functions hold on to their histograms
+        for hist in self._histograms.values():
+            hist.reset()
+    
+    def histogram(self, name: str) -> LatencyHistogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            hist = self._histograms.setdefault(name, LatencyHistogram())
+        return hist
+    
+    def record(self, name: str, elapsed_ns: int) -> None:
+        if self.enabled:
+            self.histogram(name).record(elapsed_ns)
+    
+    def span(self, name: str):
+        """Context manager timing its block into histogram `name`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self.histogram(name))
+    
+    def timed(self, name: str = None) -> Callable[[F], F]:
+        """Decorator timing every call into histogram `name` (default: qualname)"""
+        def decorator(fn: F) -> F:
+            hist = self.histogram(name or f"{fn.__module__}.{fn.__qualname__}")
+            perf_counter_ns = time.perf_counter_ns
+            
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = perf_counter_ns()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    hist.record(perf_counter_ns() - start)
+            
+            wrapper.__wrapped_span__ = fn
+            return wrapper
+        return decorator
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: hist.summary()
+                for name, hist in sorted(self._histograms.items()) if hist.count}
+    
+    def report(self) -> str:
+        snap = self.snapshot()
+        if not snap:
+            return "No span data collected."
+        
+        lines = ["=== SPAN LATENCY ==="]
+        lines.append(f"{'Span':<40} {'Count':>9} {'p50':>10} {'p99':>10} {'p999':>10} {'Max':>10}")
+        lines.append("-" * 94)
+        for name, s in sorted(snap.items(), key=lambda kv: -kv[1]['count'] * kv[1]['mean_ns']):
+            lines.append(
+                f"{name:<40} {s['count']:>9} "
+                f"{s['p50_ns'] / 1000:>8.2f}µs {s['p99_ns'] / 1000:>8.2f}µs "
+                f"{s['p999_ns'] / 1000:>8.2f}µs {s['max_ns'] / 1000:>8.2f}µs"
+            )
+        return "\n".join(lines)
+    
+    def to_prometheus(self, metric: str = 'helix_span_seconds') -> str:
+        """Prometheus text exposition: one summary with quantiles per span"""
+        lines = [
+            f"# HELP {metric} Latency of named helix spans",
+            f"# TYPE {metric} summary",
+        ]
+        for name, hist in sorted(self._histograms.items()):
+            if not hist.count:
+                continue
+            label = _prometheus_label(name)
+            quantiles = hist.percentiles((50, 90, 99, 99.9))
+            for q in (50, 90, 99, 99.9):
+                lines.append(f'{metric}{{span="{label}",quantile="{q / 100:g}"}} '
+                             f'{quantiles[q] / 1e9:.9g}')
+            lines.append(f'{metric}_sum{{span="{label}"}} {hist.total / 1e9:.9g}')
+            lines.append(f'{metric}_count{{span="{label}"}} {hist.count}')
+        return "\n".join(lines) + "\n"
+
+
+# Global span recorder - off unless HELIX_SPANS=1
+spans = SpanRecorder(enabled=os.environ.get('HELIX_SPANS') == '1')
+
+
+def instrument(target: Any, *names: str, recorder: SpanRecorder = None,
+               prefix: str = None) -> Callable[[], None]:
+    """
+    Wrap existing functions/methods of a class or module in spans, without
+    editing their source. Returns a callable that restores the originals.
+    
+    Usage:
+        undo = instrument(HelixKernel, 'invoke', 'lift', prefix='kernel')
+    """
+    recorder = recorder or spans
+    prefix = prefix or getattr(target, '__name__', type(target).__name__)
+    originals = []
+    
+    for name in names:
+        raw = inspect.getattr_static(target, name, None)
+        if raw is None:
+            continue
+        label = f"{prefix}.{name}"
+        if isinstance(raw, staticmethod):
+            wrapped = staticmethod(recorder.timed(label)(raw.__func__))
+        elif isinstance(raw, classmethod):
+            wrapped = classmethod(recorder.timed(label)(raw.__func__))
+        elif callable(raw):
+            wrapped = recorder.timed(label)(raw)
+        else:
+            continue
+        originals.append((name, raw))
+        setattr(target, name, wrapped)
+    
+    def undo() -> None:
+        for name, raw in originals:
+            setattr(target, name, raw)
+    
+    return undo
+
+
+def instrument_helix(recorder: SpanRecorder = None) -> Callable[[], None]:
+    """
+    Span the hot paths: kernel operators, substrate lookups, serialization.
+    Returns a callable that removes the instrumentation.
+    """
+    from .kernel import HelixKernel
+    from .substrate import ManifoldSubstrate
+    from .utilities import HelixSerializer
+    
+    undos = [
+        instrument(HelixKernel, 'invoke', 'lift', 'project', 'collapse',
+                   'spiral_up', 'spiral_down', recorder=recorder, prefix='kernel'),
+        instrument(ManifoldSubstrate, 'tokens_for_state', 'release_materialized',
+                   'ingest', 'ingest_keyed', 'extract', 'extract_keyed',
+                   recorder=recorder, prefix='substrate'),
+        instrument(HelixSerializer, 'to_json', 'from_json', 'token_to_dict',
+                   'dict_to_token', recorder=recorder, prefix='serializer'),
+    ]
+    
+    def undo() -> None:
+        for u in undos:
+            u()
+    
+    return undo
+
+
+def benchmark_span_overhead(iterations: int = 200_000) -> Dict[str, float]:
+    """Per-call cost (ns) of a bare call vs a disabled and an enabled span"""
+    recorder = SpanRecorder(enabled=True)
+    
+    def bare():
+        return None
+    
+    timed = recorder.timed('bench.timed')(bare)
+    
+    def run(fn) -> float:
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter_ns() - start) / iterations
+    
+    def with_span():
+        with recorder.span('bench.span'):
+            pass
+    
+    base = run(bare)
+    result = {'bare_ns': round(base, 1)}
+    for state in ('enabled', 'disabled'):
+        recorder.enabled = state == 'enabled'
+        result[f'timed_{state}_ns'] = round(run(timed) - base, 1)
+        result[f'span_{state}_ns'] = round(run(with_span) - base, 1)
+    return result
+
+
+# =============================================================================
+# SAMPLING PROFILER
+# =============================================================================
+
+class SamplingProfiler:
+    """
+    Statistical profiler - no decorators needed.
+    
+    A daemon thread snapshots every other thread's Python stack via
+    sys._current_frames() `hz` times a second and counts identical
+    stacks. The profiled code pays nothing directly; the cost is the
+    sampler's share of the GIL, proportional to hz.
+    
+    Usage:
+        with SamplingProfiler(hz=200) as prof:
+            run_workload()
+        print(prof.report())
+        open('out.folded', 'w').write(prof.collapsed())   # flamegraph.pl
+    """
+    
+    def __init__(self, hz: float = 100.0, max_depth: int = 64,
+                 include_threads: bool = False):
+        self.interval = 1.0 / hz
+        self.max_depth = max_depth
+        self.include_threads = include_threads
+        self.samples = 0
+        self._stacks: Dict[Tuple[str, ...], int] = {}
+        self._labels: Dict[Any, str] = {}
+        self._thread = None
+        self._stop = threading.Event()
+    
+    def start(self) -> 'SamplingProfiler':
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='helix-sampler',
+                                            daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self) -> 'SamplingProfiler':
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        return self
+    
+    def __enter__(self) -> 'SamplingProfiler':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+    
+    def reset(self) -> None:
+        self._stacks.clear()
+        self.samples = 0
+    
+    def _run(self) -> None:
+        next_at = time.perf_counter()
+        while True:
+            next_at += self.interval
+            if self._stop.wait(max(0.0, next_at - time.perf_counter())):
+                return
+            self.sample()
+    
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            module = inspect.getmodulename(code.co_filename) or code.co_filename
+            label = f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+            self._labels[code] = label
+        return label
+    
+    def sample(self) -> None:
+        """Take one snapshot of all other threads (called by the sampler thread)"""
+        me = threading.get_ident()
+        names = ({t.ident: t.name for t in threading.enumerate()}
+                 if self.include_threads else None)
+        stacks = self._stacks
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            labels = []
+            depth = 0
+            while frame is not None and depth < self.max_depth:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+                depth += 1
+            if names is not None:
+                labels.append(f"thread:{names.get(ident, ident)}")
+            key = tuple(reversed(labels))
+            stacks[key] = stacks.get(key, 0) + 1
+            self.samples += 1
+    
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded-stack format ("a;b;c count" per line)"""
+        return "".join(f"{';'.join(stack)} {count}\n"
+                       for stack, count in sorted(self._stacks.items()))
+    
+    def top(self, n: int = 20) -> List[Tuple[str, int, int]]:
+        """(function, self samples, total samples), hottest self time first"""
+        own: Dict[str, int] = {}
+        total: Dict[str, int] = {}
+        for stack, count in self._stacks.items():
+            if not stack:
+                continue
+            own[stack[-1]] = own.get(stack[-1], 0) + count
+            for label in set(stack):
+                total[label] = total.get(label, 0) + count
+        ranked = sorted(own.items(), key=lambda kv: kv[1], reverse=True)[:n]
+        return [(label, count, total[label]) for label, count in ranked]
+    
+    def report(self, n: int = 20) -> str:
+        if not self.samples:
+            return "No samples collected."
+        lines = [f"=== SAMPLING PROFILE ({self.samples} samples) ==="]
+        lines.append(f"{'Function':<50} {'Self':>8} {'Total':>8}")
+        lines.append("-" * 68)
+        for label, own, total in self.top(n):
+            lines.append(f"{label:<50} {100 * own / self.samples:>7.1f}% "
+                         f"{100 * total / self.samples:>7.1f}%")
+        return "\n".join(lines)
+    
+    def to_prometheus(self, metric: str = 'helix_profile_samples_total', n: int = 50) -> str:
+        """Self-time sample counts of the hottest functions as a counter"""
+        lines = [
+            f"# HELP {metric} Sampling profiler self-time samples per function",
+            f"# TYPE {metric} counter",
+        ]
+        for label, own, _ in self.top(n):
+            lines.append(f'{metric}{{function="{_prometheus_label(label)}"}} {own}')
+        return "\n".join(lines) + "\n"
+
+
 # =============================================================================
 # TYPE VALIDATION
 # =============================================================================
@@ -775,6 +1273,13 @@ __all__ = [
     'ProfileResult',
     'profiler',
     'benchmark',
+    'LatencyHistogram',
+    'SpanRecorder',
+    'spans',
+    'instrument',
+    'instrument_helix',
+    'benchmark_span_overhead',
+    'SamplingProfiler',
     
     # Type validation
     'validate_level',
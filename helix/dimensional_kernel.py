@@ -36,12 +36,16 @@ Usage:
 from __future__ import annotations
 import numpy as np
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set, Optional, Callable, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Set, Optional, Callable, Tuple, Union
 from enum import Enum, auto
+from collections import OrderedDict, deque
 import hashlib
+import itertools
+import sys
 import time
 import json
 import math
+import weakref
 
 # =============================================================================
 # GENESIS CONSTANTS - The 7 Layers of Creation
@@ -82,6 +86,26 @@ LAYER_DECLARATIONS = {
 # Golden ratio
 PHI = (1 + math.sqrt(5)) / 2
 
+# Process-wide counters for cheap, unique IDs
+_node_ids = itertools.count(1)
+_object_ids = itertools.count(1)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Cheap size hint for an input: len() of strings, bytes and containers,
+    the printed length of small scalars, sys.getsizeof() otherwise.
+    Never stringifies a large object.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if value is None or isinstance(value, (bool, int, float, complex)):
+        return len(str(value))
+    try:
+        return len(value)
+    except TypeError:
+        return sys.getsizeof(value)
+
 # =============================================================================
 # LINEAGE NODE - History tracking
 # =============================================================================
@@ -98,24 +122,59 @@ class LineageNode:
     
     def __post_init__(self):
         if not self.id:
-            self.id = f"node_{hashlib.md5(str(time.time()).encode()).hexdigest()[:8]}"
+            self.id = f"node_{next(_node_ids)}"
+
+
+class _Segment:
+    """
+    One immutable step of a persistent lineage DAG: either a node added
+    on top of `prev`, or a join of `prev` and `other` (a merge), with an
+    optional (child_id, parent_id) link between the two histories.
+    """
+    __slots__ = ("node", "prev", "other", "link")
+    
+    def __init__(self, node: Optional[LineageNode], prev: Optional['_Segment'],
+                 other: Optional['_Segment'] = None, link: Optional[Tuple[str, str]] = None):
+        self.node = node
+        self.prev = prev
+        self.other = other
+        self.link = link
 
 
 class LineageGraph:
     """
     Directed acyclic graph tracking all transformations.
     Provides explainability: trace any output back to origins.
+    
+    The graph is persistent: it is a pointer to the newest of a chain of
+    immutable segments, so merge_with() is O(1) and merged graphs share
+    their history instead of copying it. `nodes` is materialized lazily.
+    With record=False (lineage sampling) IDs are still handed out but no
+    nodes are kept.
     """
     
-    def __init__(self):
-        self.nodes: Dict[str, LineageNode] = {}
+    def __init__(self, record: bool = True):
+        self.record = record
         self.root_id: Optional[str] = None
         self.current_id: Optional[str] = None
+        self._head: Optional[_Segment] = None
+        # Materialized view of the segments up to _view_head
+        self._view_head: Optional[_Segment] = None
+        self._nodes: Dict[str, LineageNode] = {}
+        self._links: Dict[str, List[str]] = {}
     
     def add_node(self, operation: str, parent_ids: List[str] = None, 
                  data_hash: str = "", metadata: Dict[str, Any] = None) -> str:
         """Add a new lineage node."""
-        node_id = f"node_{len(self.nodes)}_{hashlib.md5(str(time.time()).encode()).hexdigest()[:6]}"
+        node_id = f"node_{next(_node_ids)}"
+        
+        if self.root_id is None:
+            self.root_id = node_id
+        self.current_id = node_id
+        
+        if not self.record:
+            return node_id
+        
         node = LineageNode(
             id=node_id,
             operation=operation,
@@ -123,14 +182,57 @@ class LineageGraph:
             parent_ids=parent_ids or [],
             metadata=metadata or {}
         )
-        self.nodes[node_id] = node
-        
-        if self.root_id is None:
-            self.root_id = node_id
-        
-        self.current_id = node_id
+        segment = _Segment(node, self._head)
+        if self._view_head is self._head:
+            # Keep the materialized view current instead of rebuilding it
+            self._nodes[node_id] = node
+            self._view_head = segment
+        self._head = segment
         return node_id
     
+    @property
+    def nodes(self) -> Dict[str, LineageNode]:
+        """All nodes by ID, oldest first (read-only view)."""
+        if self._view_head is not self._head:
+            self._materialize()
+        return self._nodes
+    
+    def _materialize(self):
+        nodes: Dict[str, LineageNode] = {}
+        links: Dict[str, List[str]] = {}
+        seen = set()
+        # Iterative post-order walk: older history first
+        stack = [(self._head, False)]
+        while stack:
+            segment, expanded = stack.pop()
+            if segment is None:
+                continue
+            if expanded:
+                if segment.node is not None:
+                    nodes[segment.node.id] = segment.node
+                elif segment.link is not None:
+                    child, parent = segment.link
+                    links.setdefault(child, []).append(parent)
+                continue
+            if id(segment) in seen:
+                continue
+            seen.add(id(segment))
+            stack.append((segment, True))
+            stack.append((segment.other, False))
+            stack.append((segment.prev, False))
+        
+        self._nodes = nodes
+        self._links = links
+        self._view_head = self._head
+    
+    def parents_of(self, node_id: str) -> List[str]:
+        """Parent IDs of a node, including links made by merges."""
+        node = self.nodes.get(node_id)
+        if node is None:
+            return []
+        extra = self._links.get(node_id)
+        return node.parent_ids + extra if extra else node.parent_ids
+    
     def trace_back(self, node_id: str = None) -> List[LineageNode]:
         """Trace lineage from a node back to root."""
         if node_id is None:
@@ -141,10 +243,10 @@ class LineageGraph:
         
         path = []
         visited = set()
-        queue = [node_id]
+        queue = deque([node_id])
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current in visited:
                 continue
             visited.add(current)
@@ -152,7 +254,7 @@ class LineageGraph:
             node = self.nodes.get(current)
             if node:
                 path.append(node)
-                queue.extend(node.parent_ids)
+                queue.extend(self.parents_of(current))
         
         return path
     
@@ -173,17 +275,16 @@ class LineageGraph:
         return "\n".join(lines)
     
     def merge_with(self, other: 'LineageGraph') -> 'LineageGraph':
-        """Merge another lineage graph into this one."""
-        merged = LineageGraph()
-        merged.nodes.update(self.nodes)
-        merged.nodes.update(other.nodes)
+        """Merge another lineage graph into this one (O(1), shares both)."""
+        merged = LineageGraph(record=self.record or other.record)
         merged.root_id = self.root_id
         
-        # Link the graphs
-        if self.current_id and other.root_id:
-            if other.root_id in merged.nodes:
-                merged.nodes[other.root_id].parent_ids.append(self.current_id)
+        # Link the graphs: other's root continues from our current node
+        link = None
+        if self.current_id and other.root_id and other._head is not None:
+            link = (other.root_id, self.current_id)
         
+        merged._head = _Segment(None, self._head, other._head, link)
         merged.current_id = other.current_id or self.current_id
         return merged
     
@@ -194,7 +295,7 @@ class LineageGraph:
                 "id": v.id,
                 "operation": v.operation,
                 "timestamp": v.timestamp,
-                "parent_ids": v.parent_ids,
+                "parent_ids": self.parents_of(k),
                 "metadata": v.metadata
             } for k, v in self.nodes.items()},
             "root_id": self.root_id,
@@ -381,7 +482,7 @@ class DimensionalObject:
         self.delta_set: Set[str] = set()
         self.coordinate = coordinate or DimensionalCoordinate()
         
-        self._id = hashlib.md5(str(time.time()).encode()).hexdigest()[:12]
+        self._id = f"{next(_object_ids):012x}"
         self._created_at = time.time()
         self._sealed = False
     
@@ -565,6 +666,100 @@ class DimensionalObject:
         return f"<DimensionalObject id={self._id} z={self.compute_z():.3f} layer={self.coordinate.layer.name}>"
 
 
+# =============================================================================
+# OBJECT RETENTION
+# =============================================================================
+
+class LRUObjectStore(OrderedDict):
+    """processed_objects bounded to the most recent max_objects entries."""
+    
+    def __init__(self, max_objects: int = 10_000):
+        super().__init__()
+        self.max_objects = max_objects
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_objects:
+            self.popitem(last=False)
+
+
+def make_object_store(retention: str, max_objects: int):
+    """
+    Storage for DimensionalKernel.processed_objects:
+        "lru"  - keep the newest max_objects (default)
+        "weak" - keep objects only while something else references them
+        "all"  - keep everything (unbounded)
+    """
+    if retention == "lru":
+        return LRUObjectStore(max_objects)
+    if retention == "weak":
+        return weakref.WeakValueDictionary()
+    if retention == "all":
+        return {}
+    raise ValueError(f"Unknown retention policy: {retention}")
+
+
+# =============================================================================
+# DIMENSIONAL BATCH - Many records through the pipeline at once
+# =============================================================================
+
+class DimensionalBatch:
+    """
+    A chunk of records moving through the kernel pipeline together.
+    
+    Column layout instead of one DimensionalObject per record:
+        payloads  - list of semantic payloads
+        identity  - (N, d) identity vectors
+        intention - (N, k) intention vectors
+        lineage   - per-record LineageGraph, or None where not sampled
+        errors    - {row: message} for rows whose transform raised
+    
+    object(i) materializes an equivalent DimensionalObject when needed.
+    """
+    
+    def __init__(self, payloads: List[Any], identity: np.ndarray, intention: np.ndarray,
+                 lineage: List[Optional[LineageGraph]], layer: Layer = Layer.SPARK):
+        self.payloads = payloads
+        self.identity = identity
+        self.intention = intention
+        self.lineage = lineage
+        self.layer = layer
+        self.errors: Dict[int, str] = {}
+        self.deltas: List[Set[str]] = [set() for _ in payloads]
+        # Only needed when rows are materialized (costs a hash per transform)
+        self.track_deltas = True
+    
+    def __len__(self) -> int:
+        return len(self.payloads)
+    
+    def z_values(self) -> np.ndarray:
+        """z = x · y for every record"""
+        return np.prod(self.identity, axis=1)
+    
+    def magnitudes(self) -> np.ndarray:
+        """|v| for every record"""
+        return np.linalg.norm(self.identity, axis=1)
+    
+    def sampled(self) -> List[int]:
+        """Rows that record lineage"""
+        return [i for i, graph in enumerate(self.lineage) if graph is not None]
+    
+    def object(self, i: int) -> DimensionalObject:
+        """Row i as a standalone DimensionalObject"""
+        obj = DimensionalObject(
+            semantic_payload=self.payloads[i],
+            identity_vector=self.identity[i].tolist(),
+            intention_vector=self.intention[i].tolist(),
+            lineage_graph=self.lineage[i] or LineageGraph(record=False)
+        )
+        obj.coordinate.layer = self.layer
+        obj.delta_set = set(self.deltas[i])
+        if i in self.errors:
+            obj.context_map["transform_error"] = self.errors[i]
+        return obj
+
+
 # =============================================================================
 # DIMENSIONAL KERNEL - The 7 Core Operations
 # =============================================================================
@@ -597,12 +792,20 @@ class DimensionalKernel:
         
         # Resolve
         result, lineage = kernel.resolve(obj)
+    
+    For long-running pipelines, processed_objects is bounded by the
+    retention policy (see make_object_store) and lineage_sampling=N
+    records full lineage for only every Nth lifted object.
     """
     
-    def __init__(self):
+    def __init__(self, retention: str = "lru", max_objects: int = 10_000,
+                 lineage_sampling: int = 1):
         self.substate_manager = SubstateManager()
         self.operation_count = 0
-        self.processed_objects: Dict[str, DimensionalObject] = {}
+        self.retention = retention
+        self.processed_objects: Dict[str, DimensionalObject] = make_object_store(retention, max_objects)
+        self.lineage_sampling = max(1, lineage_sampling)
+        self._lift_count = 0
     
     # =========================================================================
     # Operation 1: LIFT (Layer 1 - Spark)
@@ -622,16 +825,21 @@ class DimensionalKernel:
         Returns:
             A new DimensionalObject at Layer 1 (Spark)
         """
+        # Lineage sampling: record the 1st, (N+1)th, ... lifted object
+        record = self._lift_count % self.lineage_sampling == 0
+        self._lift_count += 1
+        
         obj = DimensionalObject(
             semantic_payload=raw_input,
-            intention_vector=intention or [1.0]  # Default: exists
+            intention_vector=intention or [1.0],  # Default: exists
+            lineage_graph=LineageGraph(record=record)
         )
         
         obj.coordinate.layer = Layer.SPARK
         
         obj.lineage_graph.add_node(
             "lift",
-            metadata={"input_type": type(raw_input).__name__, "input_size": len(str(raw_input))}
+            metadata={"input_type": type(raw_input).__name__, "input_size": estimate_size(raw_input)}
         )
         
         self.operation_count += 1
@@ -1032,12 +1240,214 @@ class DimensionalKernel:
         merged = self.merge(objects, strategy=merge_strategy)
         return self.resolve(merged)
     
+    # =========================================================================
+    # Batch Pipeline
+    # =========================================================================
+    
+    def lift_batch(self, raw_inputs: List[Any], intention: List[float] = None) -> DimensionalBatch:
+        """LIFT for many inputs at once (see lift)."""
+        n = len(raw_inputs)
+        intention_row = np.array(intention or [1.0], dtype=float)
+        
+        lineage: List[Optional[LineageGraph]] = []
+        for raw_input in raw_inputs:
+            record = self._lift_count % self.lineage_sampling == 0
+            self._lift_count += 1
+            if record:
+                graph = LineageGraph()
+                graph.add_node(
+                    "lift",
+                    metadata={"input_type": type(raw_input).__name__, "input_size": estimate_size(raw_input)}
+                )
+                lineage.append(graph)
+            else:
+                lineage.append(None)
+        
+        batch = DimensionalBatch(
+            payloads=list(raw_inputs),
+            identity=np.ones((n, 2)),
+            intention=np.tile(intention_row, (n, 1)),
+            lineage=lineage,
+            layer=Layer.SPARK
+        )
+        self.operation_count += n
+        return batch
+    
+    def map_batch(self, batch: DimensionalBatch,
+                  manifold_func: Callable[[Any], List[float]] = None) -> DimensionalBatch:
+        """MAP for a whole batch; identity vectors are computed as one array."""
+        n = len(batch)
+        if manifold_func is None:
+            # Same size-based mapping as map_to_manifold, vectorized
+            sizes = np.fromiter((len(str(p)) for p in batch.payloads), dtype=float, count=n) + 1.0
+            batch.identity = np.column_stack((sizes, 1.0 / sizes))
+        else:
+            batch.identity = np.array([manifold_func(p) for p in batch.payloads], dtype=float).reshape(n, -1)
+        
+        batch.layer = Layer.MIRROR
+        
+        sampled = batch.sampled()
+        if sampled:
+            z_values = batch.z_values()
+            for i in sampled:
+                graph = batch.lineage[i]
+                graph.add_node(
+                    "map",
+                    parent_ids=[graph.current_id],
+                    data_hash=hashlib.md5(str(batch.payloads[i]).encode()).hexdigest(),
+                    metadata={
+                        "identity_vector": batch.identity[i].tolist(),
+                        "z_value": float(z_values[i])
+                    }
+                )
+        
+        for deltas in batch.deltas:
+            deltas.add("mapped")
+        self.operation_count += n
+        return batch
+    
+    def bind_batch(self, left: DimensionalBatch, right: DimensionalBatch) -> DimensionalBatch:
+        """Multiplicative BIND of two equal-length batches, row by row."""
+        if len(left) != len(right):
+            raise ValueError("Batches must have the same length")
+        
+        lineage = []
+        for a, b in zip(left.lineage, right.lineage):
+            if a is None or b is None:
+                lineage.append(None)
+                continue
+            merged = a.merge_with(b)
+            merged.add_node("bind", parent_ids=[a.current_id, b.current_id])
+            lineage.append(merged)
+        
+        bound = DimensionalBatch(
+            payloads=list(zip(left.payloads, right.payloads)),
+            identity=left.identity * right.identity,
+            intention=np.concatenate((left.intention, right.intention), axis=1),
+            lineage=lineage,
+            layer=Layer.RELATION
+        )
+        for deltas in bound.deltas:
+            deltas.add("bound")
+        self.operation_count += len(bound)
+        return bound
+    
+    def transform_batch(self, batch: DimensionalBatch, func: Callable[[Any], Any],
+                        track_delta: bool = True) -> DimensionalBatch:
+        """
+        TRANSFORM every payload. Rows whose transform raises keep their
+        payload and record the error, as transform() does.
+        """
+        name = func.__name__ if hasattr(func, '__name__') else "lambda"
+        payloads = batch.payloads
+        # Hashes are only needed for lineage and delta tracking
+        need_hash = track_delta and batch.track_deltas
+        sampled = set(batch.sampled())
+        applied = 0
+        
+        for i, payload in enumerate(payloads):
+            try:
+                new_payload = func(payload)
+            except Exception as e:
+                batch.errors[i] = str(e)
+                continue
+            payloads[i] = new_payload
+            applied += 1
+            
+            if need_hash or i in sampled:
+                old_hash = hashlib.md5(str(payload).encode()).hexdigest()
+                new_hash = hashlib.md5(str(new_payload).encode()).hexdigest()
+                if track_delta and old_hash != new_hash:
+                    batch.deltas[i].add("transformed")
+                if i in sampled:
+                    graph = batch.lineage[i]
+                    graph.add_node(
+                        "transform",
+                        parent_ids=[graph.current_id],
+                        data_hash=new_hash,
+                        metadata={"function": name, "old_hash": old_hash, "changed": old_hash != new_hash}
+                    )
+        
+        batch.layer = Layer.LIFE
+        self.operation_count += applied
+        return batch
+    
+    def resolve_batch(self, batch: DimensionalBatch,
+                      output_format: str = "raw") -> List[Tuple[Any, str]]:
+        """RESOLVE every row; returns the same (output, explanation) pairs as resolve()."""
+        batch.layer = Layer.COMPLETION
+        z_values = batch.z_values()
+        apply_all = self.substate_manager.apply_all
+        results = []
+        
+        for i, payload in enumerate(batch.payloads):
+            result, applied_rules = apply_all(payload)
+            graph = batch.lineage[i]
+            if graph is not None:
+                graph.add_node(
+                    "resolve",
+                    parent_ids=[graph.current_id],
+                    data_hash=hashlib.md5(str(payload).encode()).hexdigest(),
+                    metadata={
+                        "output_format": output_format,
+                        "applied_substates": applied_rules,
+                        "final_z": float(z_values[i])
+                    }
+                )
+                explanation = graph.explain()
+            else:
+                explanation = "No lineage recorded."
+            
+            if output_format in ("dict", "json"):
+                state = batch.object(i).to_dict()
+                if output_format == "dict":
+                    state["resolved_payload"] = result
+                    output = state
+                else:
+                    output = json.dumps(state, indent=2, default=str)
+            else:
+                output = result
+            results.append((output, explanation))
+        
+        self.operation_count += len(batch)
+        return results
+    
+    def process_batch(
+        self,
+        raw_inputs: Iterable[Any],
+        transforms: List[Callable] = None,
+        intention: List[float] = None,
+        chunk_size: int = 4096,
+        output_format: str = "raw"
+    ) -> Iterator[Tuple[Any, str]]:
+        """
+        Batch pipeline: lift → map → transform... → resolve over chunks
+        of `chunk_size` inputs, yielding the same (output, explanation)
+        pairs as process() for each input, in order. Inputs are consumed
+        lazily, so this works on unbounded streams.
+        
+        Batch records are not kept in processed_objects. Combine with
+        lineage_sampling to skip per-record lineage for most rows.
+        """
+        iterator = iter(raw_inputs)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            batch = self.lift_batch(chunk, intention=intention)
+            batch.track_deltas = output_format != "raw"
+            batch = self.map_batch(batch)
+            for func in transforms or ():
+                batch = self.transform_batch(batch, func)
+            yield from self.resolve_batch(batch, output_format=output_format)
+    
     @property
     def stats(self) -> Dict[str, Any]:
         """Get kernel statistics."""
         return {
             "operation_count": self.operation_count,
             "processed_objects": len(self.processed_objects),
+            "retention": self.retention,
             "active_substates": len(self.substate_manager.stack)
         }
 
@@ -1085,6 +1495,36 @@ def bind_objects(*objects: DimensionalObject) -> DimensionalObject:
     return result
 
 
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_batch(records: int = 100_000, chunk_size: int = 4096,
+                    lineage_sampling: int = 1000) -> Dict[str, Any]:
+    """Records/sec for process() per record versus process_batch()."""
+    payloads = [{"id": i, "value": i * 0.5} for i in range(records)]
+    transforms = [lambda p: p["value"]]
+    
+    kernel = DimensionalKernel(lineage_sampling=lineage_sampling)
+    start = time.perf_counter()
+    scalar = [kernel.process(p, transforms=transforms)[0] for p in payloads]
+    scalar_s = time.perf_counter() - start
+    
+    kernel = DimensionalKernel(lineage_sampling=lineage_sampling)
+    start = time.perf_counter()
+    batched = [out for out, _ in kernel.process_batch(payloads, transforms=transforms,
+                                                      chunk_size=chunk_size)]
+    batch_s = time.perf_counter() - start
+    
+    return {
+        "records": records,
+        "scalar_records_per_second": round(records / scalar_s),
+        "batch_records_per_second": round(records / batch_s),
+        "speedup": round(scalar_s / batch_s, 2),
+        "identical": scalar == batched,
+    }
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
@@ -1105,6 +1545,13 @@ __all__ = [
     'DimensionalCoordinate',
     'DimensionalObject',
     'DimensionalKernel',
+    'DimensionalBatch',
+    'LRUObjectStore',
+    
+    # Functions
+    'estimate_size',
+    'make_object_store',
+    'benchmark_batch',
     
     # Factory functions
     'create_dimensional_object',
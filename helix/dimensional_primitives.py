@@ -38,9 +38,13 @@ from typing import (
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import reduce
+from collections import deque
+from array import array
+import itertools
 import threading
 import asyncio
 import math
+import os
 import time
 
 
@@ -605,7 +609,12 @@ class DStream(Generic[T]):
     """
     Dimensional Stream - Lazy sequence of values.
     
-    Operations are deferred until terminal operation.
+    Operations are deferred until a terminal operation and then run as a
+    single chain of generators: each element flows through the whole
+    pipeline before the next one is pulled, so memory stays constant for
+    arbitrarily long (or infinite) sources, and take()/first() stop
+    pulling as soon as they are satisfied. Adjacent map/filter steps are
+    fused into one stage.
     """
     
     def __init__(self, source: Callable[[], Iterator[T]], operations: List[Tuple] = None):
@@ -622,43 +631,71 @@ class DStream(Generic[T]):
         """Create stream from DList."""
         return cls(source=lambda: (lst.get(i) for i in range(lst.size)))
     
+    @classmethod
+    def from_iterable(cls, iterable) -> 'DStream[T]':
+        """Create stream from any re-iterable (list, range, file...)."""
+        return cls(source=lambda: iter(iterable))
+    
     @classmethod
     def generate(cls, fn: Callable[[int], T], count: int) -> 'DStream[T]':
         """Generate stream from function."""
-        return cls(source=lambda: (fn(i) for i in range(count)))
+        return cls(source=lambda: map(fn, range(count)))
     
     @classmethod
     def infinite(cls, fn: Callable[[int], T]) -> 'DStream[T]':
         """Create infinite stream (use .take() to limit)."""
-        def gen():
-            i = 0
-            while True:
-                yield fn(i)
-                i += 1
-        return cls(source=gen)
+        return cls(source=lambda: map(fn, itertools.count()))
+    
+    def _then(self, op: Tuple) -> 'DStream':
+        return DStream(source=self.source, operations=self.operations + [op])
     
     def map(self, fn: Callable[[T], A]) -> 'DStream[A]':
         """Map values (lazy)."""
-        new_ops = list(self.operations) + [('map', fn)]
-        return DStream[A](source=self.source, operations=new_ops)
+        return self._then(('map', fn))
     
     def filter(self, pred: Callable[[T], bool]) -> 'DStream[T]':
         """Filter values (lazy)."""
-        new_ops = list(self.operations) + [('filter', pred)]
-        return DStream[T](source=self.source, operations=new_ops)
+        return self._then(('filter', pred))
+    
+    def flat_map(self, fn: Callable[[T], Any]) -> 'DStream[A]':
+        """Map each value to an iterable and flatten (lazy)."""
+        return self._then(('flat_map', fn))
     
     def take(self, n: int) -> 'DStream[T]':
         """Take first n values (lazy)."""
-        new_ops = list(self.operations) + [('take', n)]
-        return DStream[T](source=self.source, operations=new_ops)
+        return self._then(('take', n))
     
     def skip(self, n: int) -> 'DStream[T]':
         """Skip first n values (lazy)."""
-        new_ops = list(self.operations) + [('skip', n)]
-        return DStream[T](source=self.source, operations=new_ops)
+        return self._then(('skip', n))
+    
+    def batch(self, n: int) -> 'DStream[List[T]]':
+        """Group into lists of n values; the last batch may be short (lazy)."""
+        if n < 1:
+            raise ValueError("batch size must be >= 1")
+        return self._then(('batch', n))
+    
+    def window(self, size: int, step: int = 1) -> 'DStream[Tuple[T, ...]]':
+        """Sliding windows of `size` values, advancing by `step` (lazy)."""
+        if size < 1 or step < 1:
+            raise ValueError("window size and step must be >= 1")
+        return self._then(('window', (size, step)))
+    
+    def parallel_map(self, fn: Callable[[T], A], workers: int = None,
+                     processes: bool = False, chunksize: int = 1) -> 'DStream[A]':
+        """
+        Map values on a thread (or process) pool, preserving order (lazy).
+        
+        At most workers * 2 chunks are in flight, so the stream stays
+        bounded; with processes=True `fn` and the values must pickle.
+        """
+        return self._then(('parallel_map', (fn, workers, processes, max(1, chunksize))))
     
     # Terminal Operations
     
+    def __iter__(self) -> Iterator[T]:
+        return self._execute()
+    
     def collect(self) -> DList[T]:
         """Collect to DList (terminal)."""
         result = DList[T]()
@@ -666,12 +703,17 @@ class DStream(Generic[T]):
             result.append(item)
         return result
     
+    def to_list(self) -> List[T]:
+        """Collect to a Python list (terminal)."""
+        return list(self._execute())
+    
+    def to_array(self, typecode: str = 'd') -> array:
+        """Collect a numeric stream into a compact array.array (terminal)."""
+        return array(typecode, self._execute())
+    
     def reduce(self, fn: Callable[[A, T], A], initial: A) -> A:
         """Reduce to single value (terminal)."""
-        acc = initial
-        for item in self._execute():
-            acc = fn(acc, item)
-        return acc
+        return reduce(fn, self._execute(), initial)
     
     def count(self) -> int:
         """Count elements (terminal)."""
@@ -679,26 +721,115 @@ class DStream(Generic[T]):
     
     def first(self) -> Optional[T]:
         """Get first element (terminal)."""
-        for item in self._execute():
-            return item
-        return None
+        return next(self._execute(), None)
     
     def _execute(self) -> Iterator:
-        """Execute the stream pipeline."""
-        # Convert to list first to avoid generator exhaustion issues
-        current = list(self.source())
+        """Build the fused generator chain for the pipeline."""
+        current = iter(self.source())
+        fused: List[Tuple] = []
         
-        for op_type, op_arg in self.operations:
-            if op_type == 'map':
-                current = [op_arg(x) for x in current]
-            elif op_type == 'filter':
-                current = [x for x in current if op_arg(x)]
-            elif op_type == 'take':
-                current = current[:op_arg]
+        for op in self.operations:
+            if op[0] in ('map', 'filter'):
+                fused.append(op)
+                continue
+            if fused:
+                current = _fuse_stage(current, fused)
+                fused = []
+            op_type, op_arg = op
+            if op_type == 'take':
+                current = itertools.islice(current, op_arg)
             elif op_type == 'skip':
-                current = current[op_arg:]
+                current = itertools.islice(current, op_arg, None)
+            elif op_type == 'flat_map':
+                current = itertools.chain.from_iterable(map(op_arg, current))
+            elif op_type == 'batch':
+                current = _batched(current, op_arg)
+            elif op_type == 'window':
+                current = _windowed(current, *op_arg)
+            elif op_type == 'parallel_map':
+                current = _parallel_mapped(current, *op_arg)
         
-        return iter(current)
+        if fused:
+            current = _fuse_stage(current, fused)
+        return current
+
+
+def _fuse_stage(it: Iterator, steps: List[Tuple]) -> Iterator:
+    """One generator stage for a run of map/filter steps."""
+    if len(steps) == 1:
+        kind, fn = steps[0]
+        return map(fn, it) if kind == 'map' else filter(fn, it)
+    if all(kind == 'map' for kind, _ in steps):
+        fns = [fn for _, fn in steps]
+        
+        def composed(x):
+            for fn in fns:
+                x = fn(x)
+            return x
+        return map(composed, it)
+    return _map_filter(it, steps)
+
+
+def _map_filter(it: Iterator, steps: List[Tuple]) -> Iterator:
+    plan = [(kind == 'map', fn) for kind, fn in steps]
+    for x in it:
+        for is_map, fn in plan:
+            if is_map:
+                x = fn(x)
+            elif not fn(x):
+                break
+        else:
+            yield x
+
+
+def _batched(it: Iterator, n: int) -> Iterator[List]:
+    while True:
+        chunk = list(itertools.islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _windowed(it: Iterator, size: int, step: int) -> Iterator[Tuple]:
+    window = deque(itertools.islice(it, size), maxlen=size)
+    if len(window) < size:
+        return
+    yield tuple(window)
+    while True:
+        chunk = list(itertools.islice(it, step))
+        if len(chunk) < step:
+            return
+        window.extend(chunk)
+        yield tuple(window)
+
+
+def _map_chunk(fn: Callable, chunk: List) -> List:
+    return [fn(x) for x in chunk]
+
+
+def _parallel_mapped(it: Iterator, fn: Callable, workers: Optional[int],
+                     processes: bool, chunksize: int) -> Iterator:
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    
+    workers = workers or os.cpu_count() or 1
+    pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    chunks = _batched(it, chunksize)
+    in_flight: deque = deque()
+    
+    with pool_cls(max_workers=workers) as pool:
+        try:
+            for chunk in itertools.islice(chunks, workers * 2):
+                in_flight.append(pool.submit(_map_chunk, fn, chunk))
+            while in_flight:
+                done = in_flight.popleft().result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    in_flight.append(pool.submit(_map_chunk, fn, chunk))
+                yield from done
+        finally:
+            # Early exit (take/first/close): drop queued work
+            for future in in_flight:
+                future.cancel()
 
 
 # =============================================================================
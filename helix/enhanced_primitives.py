@@ -27,17 +27,27 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import (
     Dict, List, Tuple, Optional, Any, Callable, Union, 
-    TypeVar, Generic, Iterator, Set, Protocol, runtime_checkable
+    TypeVar, Generic, Iterator, Iterable, Sequence, Set, Protocol, runtime_checkable
 )
 from enum import Enum, auto
 from abc import ABC, abstractmethod
 from functools import lru_cache, cached_property
 from weakref import WeakSet
+from collections import abc
+from array import array
+import heapq
 import math
 import hashlib
 import struct
 import time
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 
 T = TypeVar('T')
 V = TypeVar('V')
@@ -264,7 +274,7 @@ class Vector3D:
     Performance Features:
         - __slots__ for memory efficiency
         - frozen for hashability
-        - cached_property for expensive computations
+        - cheap derived properties (slots leave no __dict__ to cache into)
         - SIMD-style batch operations
     """
     x: float
@@ -325,23 +335,23 @@ class Vector3D:
     # Properties (Cached)
     # -------------------------------------------------------------------------
     
-    @cached_property
+    @property
     def magnitude(self) -> float:
         return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
     
-    @cached_property
+    @property
     def magnitude_squared(self) -> float:
         """Faster when you don't need exact distance"""
         return self.x * self.x + self.y * self.y + self.z * self.z
     
-    @cached_property
+    @property
     def normalized(self) -> 'Vector3D':
         m = self.magnitude
         if m < 1e-10:
             return Vector3D.zero()
         return Vector3D(self.x / m, self.y / m, self.z / m)
     
-    @cached_property
+    @property
     def tuple(self) -> Tuple[float, float, float]:
         return (self.x, self.y, self.z)
     
@@ -446,77 +456,359 @@ class VectorBatch:
     """
     Batch operations on multiple vectors.
     
-    SIMD-style processing for performance when working with many vectors.
+    Structure-of-arrays storage: three array('d') columns instead of a
+    list of Vector3D objects, so a transform touches N floats per axis
+    and allocates nothing per vector. When numpy is installed the columns
+    are viewed zero-copy with np.frombuffer and every operation runs
+    vectorized; otherwise the columns are rewritten with C-level array
+    constructors.
+    
+    Every transform takes `inplace=False`; pass True to update this
+    batch instead of returning a new one.
     
     Example:
         points = VectorBatch([v1, v2, v3, v4])
         transformed = points.scale(2.0).translate(Vector3D(1, 0, 0))
+        points.apply_transform(transform, inplace=True)
         center = points.centroid()
     """
-    __slots__ = ('_vectors',)
+    __slots__ = ('_xs', '_ys', '_zs')
     
-    def __init__(self, vectors: List[Vector3D]):
-        self._vectors = vectors
+    def __init__(self, vectors: Iterable[Vector3D] = ()):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        self._xs = array('d', [v.x for v in vectors])
+        self._ys = array('d', [v.y for v in vectors])
+        self._zs = array('d', [v.z for v in vectors])
+    
+    # -------------------------------------------------------------------------
+    # Construction and conversion
+    # -------------------------------------------------------------------------
+    
+    @classmethod
+    def from_columns(cls, xs: Iterable[float], ys: Iterable[float],
+                     zs: Iterable[float]) -> 'VectorBatch':
+        """Build from three equal-length float sequences (copied)"""
+        batch = cls.__new__(cls)
+        batch._set_columns(array('d', xs), array('d', ys), array('d', zs))
+        if not len(batch._xs) == len(batch._ys) == len(batch._zs):
+            raise ValueError("VectorBatch columns must have equal length")
+        return batch
+    
+    @classmethod
+    def from_tuples(cls, points: Iterable[Tuple[float, float, float]]) -> 'VectorBatch':
+        """Build from (x, y, z) tuples"""
+        xs, ys, zs = array('d'), array('d'), array('d')
+        for x, y, z in points:
+            xs.append(x)
+            ys.append(y)
+            zs.append(z)
+        batch = cls.__new__(cls)
+        batch._set_columns(xs, ys, zs)
+        return batch
+    
+    @classmethod
+    def from_numpy(cls, points) -> 'VectorBatch':
+        """Build from an (N, 3) numpy array (copied)"""
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError(f"expected an (N, 3) array, got {points.shape}")
+        batch = cls.__new__(cls)
+        batch._set_columns(*(_column_from_numpy(points[:, i]) for i in range(3)))
+        return batch
+    
+    def _set_columns(self, xs: array, ys: array, zs: array) -> None:
+        self._xs, self._ys, self._zs = xs, ys, zs
+    
+    def _views(self):
+        """Zero-copy numpy views of the columns (numpy path only)"""
+        return (np.frombuffer(self._xs, dtype=np.float64),
+                np.frombuffer(self._ys, dtype=np.float64),
+                np.frombuffer(self._zs, dtype=np.float64))
+    
+    def _target(self, inplace: bool) -> 'VectorBatch':
+        return self if inplace else self.copy()
+    
+    def copy(self) -> 'VectorBatch':
+        batch = VectorBatch.__new__(VectorBatch)
+        batch._set_columns(array('d', self._xs), array('d', self._ys), array('d', self._zs))
+        return batch
     
     @property
-    def vectors(self) -> List[Vector3D]:
-        return self._vectors
+    def vectors(self) -> Sequence[Vector3D]:
+        """Lazy sequence view - Vector3D objects are created on access"""
+        return _VectorView(self)
+    
+    def to_list(self) -> List[Vector3D]:
+        return list(map(Vector3D, self._xs, self._ys, self._zs))
+    
+    def to_tuples(self) -> List[Tuple[float, float, float]]:
+        return list(zip(self._xs, self._ys, self._zs))
+    
+    def to_numpy(self):
+        """(N, 3) float64 numpy array (copied)"""
+        return np.column_stack(self._views())
+    
+    @property
+    def columns(self) -> Tuple[array, array, array]:
+        """The backing x, y, z columns (shared, not copied)"""
+        return self._xs, self._ys, self._zs
     
     @property
     def count(self) -> int:
-        return len(self._vectors)
+        return len(self._xs)
+    
+    def __len__(self) -> int:
+        return len(self._xs)
     
-    def scale(self, factor: float) -> 'VectorBatch':
-        """Scale all vectors by factor"""
-        return VectorBatch([v * factor for v in self._vectors])
+    def __iter__(self) -> Iterator[Vector3D]:
+        return map(Vector3D, self._xs, self._ys, self._zs)
     
-    def translate(self, offset: Vector3D) -> 'VectorBatch':
+    def __getitem__(self, index: int) -> Vector3D:
+        return Vector3D(self._xs[index], self._ys[index], self._zs[index])
+    
+    # -------------------------------------------------------------------------
+    # Transforms
+    # -------------------------------------------------------------------------
+    
+    def scale(self, factor: Union[float, Vector3D], inplace: bool = False) -> 'VectorBatch':
+        """Scale all vectors by a scalar or per-axis factor"""
+        if isinstance(factor, Vector3D):
+            fx, fy, fz = factor.x, factor.y, factor.z
+        else:
+            fx = fy = fz = float(factor)
+        out = self._target(inplace)
+        if HAS_NUMPY:
+            x, y, z = out._views()
+            x *= fx
+            y *= fy
+            z *= fz
+        else:
+            out._set_columns(array('d', [v * fx for v in out._xs]),
+                             array('d', [v * fy for v in out._ys]),
+                             array('d', [v * fz for v in out._zs]))
+        return out
+    
+    def translate(self, offset: Vector3D, inplace: bool = False) -> 'VectorBatch':
         """Translate all vectors by offset"""
-        return VectorBatch([v + offset for v in self._vectors])
+        ox, oy, oz = offset.x, offset.y, offset.z
+        out = self._target(inplace)
+        if HAS_NUMPY:
+            x, y, z = out._views()
+            x += ox
+            y += oy
+            z += oz
+        else:
+            out._set_columns(array('d', [v + ox for v in out._xs]),
+                             array('d', [v + oy for v in out._ys]),
+                             array('d', [v + oz for v in out._zs]))
+        return out
+    
+    def apply_matrix(self, matrix: Sequence[Sequence[float]],
+                     inplace: bool = False) -> 'VectorBatch':
+        """
+        Apply a row-major 3x3 (linear) or 4x4 (affine, w=1) matrix to
+        every vector in one pass.
+        """
+        rows = [tuple(map(float, row)) for row in matrix]
+        if len(rows) == 3:
+            rows = [r + (0.0,) for r in rows]
+        (m00, m01, m02, tx), (m10, m11, m12, ty), (m20, m21, m22, tz) = rows[:3]
+        out = self._target(inplace)
+        if HAS_NUMPY:
+            x, y, z = out._views()
+            m = np.array([r[:3] for r in rows[:3]])
+            result = m @ np.vstack((x, y, z))
+            result += np.array([[tx], [ty], [tz]])
+            x[:], y[:], z[:] = result
+        else:
+            points = list(zip(out._xs, out._ys, out._zs))
+            out._set_columns(
+                array('d', [m00 * a + m01 * b + m02 * c + tx for a, b, c in points]),
+                array('d', [m10 * a + m11 * b + m12 * c + ty for a, b, c in points]),
+                array('d', [m20 * a + m21 * b + m22 * c + tz for a, b, c in points]),
+            )
+        return out
     
-    def rotate_around_axis(self, axis: Vector3D, angle: float) -> 'VectorBatch':
+    def apply_transform(self, transform: 'Transform', inplace: bool = False) -> 'VectorBatch':
+        """Transform every point from local to world space"""
+        return self.apply_matrix(transform.to_matrix(), inplace)
+    
+    def rotate(self, rotation: 'Quaternion', inplace: bool = False) -> 'VectorBatch':
+        """Rotate all vectors by a quaternion"""
+        return self.apply_matrix(rotation.to_matrix(), inplace)
+    
+    def rotate_around_axis(self, axis: Vector3D, angle: float,
+                           inplace: bool = False) -> 'VectorBatch':
         """Rotate all vectors around axis"""
-        return VectorBatch([v.rotate_around_axis(axis, angle) for v in self._vectors])
+        return self.rotate(Quaternion.from_axis_angle(axis, angle), inplace)
+    
+    def normalize_all(self, inplace: bool = False) -> 'VectorBatch':
+        """Normalize all vectors (zero vectors stay zero)"""
+        out = self._target(inplace)
+        if HAS_NUMPY:
+            x, y, z = out._views()
+            mag = np.sqrt(x * x + y * y + z * z)
+            mag[mag < 1e-10] = 1.0
+            x /= mag
+            y /= mag
+            z /= mag
+        else:
+            inv = [1.0 / m if m >= 1e-10 else 1.0
+                   for m in map(math.hypot, out._xs, out._ys, out._zs)]
+            out._set_columns(array('d', map(float.__mul__, out._xs, inv)),
+                             array('d', map(float.__mul__, out._ys, inv)),
+                             array('d', map(float.__mul__, out._zs, inv)))
+        return out
     
-    def normalize_all(self) -> 'VectorBatch':
-        """Normalize all vectors"""
-        return VectorBatch([v.normalized for v in self._vectors])
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
     
     def centroid(self) -> Vector3D:
         """Calculate centroid of all points"""
-        if not self._vectors:
+        n = len(self._xs)
+        if not n:
             return Vector3D.zero()
-        n = len(self._vectors)
-        sx = sum(v.x for v in self._vectors)
-        sy = sum(v.y for v in self._vectors)
-        sz = sum(v.z for v in self._vectors)
-        return Vector3D(sx / n, sy / n, sz / n)
+        return Vector3D(math.fsum(self._xs) / n, math.fsum(self._ys) / n,
+                        math.fsum(self._zs) / n)
     
     def bounding_box(self) -> Tuple[Vector3D, Vector3D]:
         """Calculate axis-aligned bounding box (min, max)"""
-        if not self._vectors:
+        if not self._xs:
             return Vector3D.zero(), Vector3D.zero()
-        
-        min_x = min(v.x for v in self._vectors)
-        min_y = min(v.y for v in self._vectors)
-        min_z = min(v.z for v in self._vectors)
-        max_x = max(v.x for v in self._vectors)
-        max_y = max(v.y for v in self._vectors)
-        max_z = max(v.z for v in self._vectors)
-        
-        return Vector3D(min_x, min_y, min_z), Vector3D(max_x, max_y, max_z)
-    
-    def distances_from(self, point: Vector3D) -> List[float]:
+        if HAS_NUMPY:
+            x, y, z = self._views()
+            return (Vector3D(float(x.min()), float(y.min()), float(z.min())),
+                    Vector3D(float(x.max()), float(y.max()), float(z.max())))
+        xs, ys, zs = self._xs, self._ys, self._zs
+        return (Vector3D(min(xs), min(ys), min(zs)),
+                Vector3D(max(xs), max(ys), max(zs)))
+    
+    def _distances_squared(self, point: Vector3D):
+        px, py, pz = point.x, point.y, point.z
+        if HAS_NUMPY:
+            x, y, z = self._views()
+            return (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+        return [(a - px) ** 2 + (b - py) ** 2 + (c - pz) ** 2
+                for a, b, c in zip(self._xs, self._ys, self._zs)]
+    
+    def distances_from(self, point: Vector3D) -> array:
         """Calculate distance of each vector from a point"""
-        return [v.distance_to(point) for v in self._vectors]
+        if HAS_NUMPY:
+            return _column_from_numpy(np.sqrt(self._distances_squared(point)))
+        return array('d', map(math.sqrt, self._distances_squared(point)))
     
     def filter_by_distance(self, center: Vector3D, max_dist: float) -> 'VectorBatch':
         """Keep only vectors within max distance from center"""
-        max_dist_sq = max_dist * max_dist
-        return VectorBatch([
-            v for v in self._vectors 
-            if v.distance_squared_to(center) <= max_dist_sq
-        ])
+        limit = max_dist * max_dist
+        d2 = self._distances_squared(center)
+        if HAS_NUMPY:
+            keep = d2 <= limit
+            batch = VectorBatch.__new__(VectorBatch)
+            batch._set_columns(*(_column_from_numpy(v[keep]) for v in self._views()))
+            return batch
+        keep = [i for i, d in enumerate(d2) if d <= limit]
+        return VectorBatch.from_columns([self._xs[i] for i in keep],
+                                        [self._ys[i] for i in keep],
+                                        [self._zs[i] for i in keep])
+    
+    def nearest(self, point: Vector3D) -> Tuple[int, float]:
+        """(index, distance) of the vector closest to point; (-1, inf) if empty"""
+        if not self._xs:
+            return -1, math.inf
+        d2 = self._distances_squared(point)
+        if HAS_NUMPY:
+            index = int(np.argmin(d2))
+        else:
+            index = min(range(len(d2)), key=d2.__getitem__)
+        return index, math.sqrt(d2[index])
+    
+    def k_nearest(self, point: Vector3D, k: int) -> List[Tuple[int, float]]:
+        """(index, distance) of the k closest vectors, nearest first"""
+        k = min(k, len(self._xs))
+        if k <= 0:
+            return []
+        d2 = self._distances_squared(point)
+        if HAS_NUMPY:
+            candidates = np.argpartition(d2, k - 1)[:k] if k < len(d2) else np.arange(len(d2))
+            ranked = candidates[np.argsort(d2[candidates], kind='stable')]
+            return [(int(i), math.sqrt(d2[i])) for i in ranked]
+        ranked = heapq.nsmallest(k, range(len(d2)), key=d2.__getitem__)
+        return [(i, math.sqrt(d2[i])) for i in ranked]
+    
+    def __repr__(self) -> str:
+        return f"VectorBatch({len(self._xs)} vectors)"
+
+
+class _VectorView(abc.Sequence):
+    """Read-only lazy Vector3D view over a VectorBatch"""
+    __slots__ = ('_batch',)
+    
+    def __init__(self, batch: VectorBatch):
+        self._batch = batch
+    
+    def __len__(self) -> int:
+        return len(self._batch)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._batch[i] for i in range(*index.indices(len(self._batch)))]
+        return self._batch[index]
+    
+    def __iter__(self) -> Iterator[Vector3D]:
+        return iter(self._batch)
+
+
+def _column_from_numpy(values) -> array:
+    column = array('d')
+    column.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return column
+
+
+def benchmark_vector_batch(n: int = 1_000_000, seed: int = 7) -> Dict[str, Any]:
+    """
+    Time common batch transforms on n vectors: the list-of-Vector3D
+    approach against the column-backed VectorBatch.
+    """
+    import random
+    rng = random.Random(seed)
+    vectors = [Vector3D(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1))
+               for _ in range(n)]
+    offset = Vector3D(1.0, 2.0, 3.0)
+    axis = Vector3D(0.3, 1.0, 0.2)
+    transform = Transform(offset, Quaternion.from_axis_angle(axis, 0.7), Vector3D(2, 2, 2))
+    
+    def timed(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return round(time.perf_counter() - start, 4)
+    
+    baseline = {
+        'scale': timed(lambda: [v * 2.0 for v in vectors]),
+        'translate': timed(lambda: [v + offset for v in vectors]),
+        'rotate': round(10 * timed(lambda: [v.rotate_around_axis(axis, 0.7) for v in vectors[:n // 10]]), 4),
+        'transform': round(10 * timed(lambda: [transform.transform_point(v) for v in vectors[:n // 10]]), 4),
+    }
+    
+    build = timed(lambda: VectorBatch(vectors))
+    batch = VectorBatch(vectors)
+    columnar = {
+        'scale': timed(lambda: batch.scale(2.0, inplace=True)),
+        'translate': timed(lambda: batch.translate(offset, inplace=True)),
+        'rotate': timed(lambda: batch.rotate_around_axis(axis, 0.7, inplace=True)),
+        'transform': timed(lambda: batch.apply_transform(transform, inplace=True)),
+        'bounding_box': timed(batch.bounding_box),
+        'nearest': timed(lambda: batch.nearest(offset)),
+    }
+    return {
+        'vectors': n,
+        'numpy': HAS_NUMPY,
+        'build_seconds': build,
+        'object_list_seconds': baseline,
+        'vector_batch_seconds': columnar,
+        'speedup': {op: round(baseline[op] / max(columnar[op], 1e-9), 1) for op in baseline},
+    }
 
 
 # =============================================================================
@@ -620,22 +912,22 @@ class Quaternion:
                 0.25 * s
             )
     
-    @cached_property
+    @property
     def magnitude(self) -> float:
         return math.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
     
-    @cached_property
+    @property
     def normalized(self) -> 'Quaternion':
         m = self.magnitude
         if m < 1e-10:
             return Quaternion.identity()
         return Quaternion(self.w / m, self.x / m, self.y / m, self.z / m)
     
-    @cached_property
+    @property
     def conjugate(self) -> 'Quaternion':
         return Quaternion(self.w, -self.x, -self.y, -self.z)
     
-    @cached_property
+    @property
     def inverse(self) -> 'Quaternion':
         mag_sq = self.w**2 + self.x**2 + self.y**2 + self.z**2
         if mag_sq < 1e-10:
@@ -644,6 +936,16 @@ class Quaternion:
             self.w / mag_sq, -self.x / mag_sq, -self.y / mag_sq, -self.z / mag_sq
         )
     
+    def to_matrix(self) -> Tuple[Tuple[float, float, float], ...]:
+        """Equivalent row-major 3x3 rotation matrix"""
+        q = self.normalized
+        w, x, y, z = q.w, q.x, q.y, q.z
+        return (
+            (1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)),
+            (2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)),
+            (2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)),
+        )
+    
     def rotate_vector(self, v: Vector3D) -> Vector3D:
         """Rotate a vector by this quaternion"""
         qv = Quaternion(0, v.x, v.y, v.z)
@@ -776,6 +1078,15 @@ class Transform:
         rotated = self.rotation.rotate_vector(scaled)
         return rotated + self.position
     
+    def to_matrix(self) -> Tuple[Tuple[float, float, float, float], ...]:
+        """Row-major 4x4 local-to-world matrix (translate * rotate * scale)"""
+        r = self.rotation.to_matrix()
+        s = (self.scale.x, self.scale.y, self.scale.z)
+        t = (self.position.x, self.position.y, self.position.z)
+        return tuple(
+            (r[i][0] * s[0], r[i][1] * s[1], r[i][2] * s[2], t[i]) for i in range(3)
+        ) + ((0.0, 0.0, 0.0, 1.0),)
+    
     def transform_direction(self, direction: Vector3D) -> Vector3D:
         """Transform a direction (no translation)"""
         return self.rotation.rotate_vector(direction)
@@ -1265,6 +1576,7 @@ __all__ = [
     # Vectors
     'Vector3D',
     'VectorBatch',
+    'benchmark_vector_batch',
     
     # Rotation
     'Quaternion',
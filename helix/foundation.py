@@ -543,6 +543,7 @@ class HelixStore(Generic[T]):
             _, level = self._data[key]
             del self._data[key]
             self._by_level[level].discard(key)
+            self.cache.delete(key)
             return True
         return False
     
@@ -88,7 +88,8 @@ Invariants:
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Set, Any, Protocol, TYPE_CHECKING
+from typing import Set, Any, Callable, List, Protocol, TYPE_CHECKING
+import weakref
 
 if TYPE_CHECKING:
     from .substrate import Token
@@ -963,6 +964,41 @@ class SubstrateProtocol(Protocol):
         ...
 
 
+# =============================================================================
+# COLLAPSE HOOKS
+# =============================================================================
+
+_COLLAPSE_HOOKS: List[weakref.ref] = []
+
+
+def on_collapse(callback: Callable[[int], None]) -> Callable[[int], None]:
+    """
+    Register callback(spiral) to run whenever a HelixKernel collapses.
+    
+    Collapse releases a spiral's materializations, so anything derived
+    from that spiral (e.g. memoized results) can be dropped here. Hooks are
+    held weakly - bound methods and functions stay registered only while
+    something else keeps them alive.
+    """
+    if hasattr(callback, '__self__'):
+        _COLLAPSE_HOOKS.append(weakref.WeakMethod(callback))
+    else:
+        _COLLAPSE_HOOKS.append(weakref.ref(callback))
+    return callback
+
+
+def _run_collapse_hooks(spiral: int) -> None:
+    dead = False
+    for ref in _COLLAPSE_HOOKS:
+        callback = ref()
+        if callback is None:
+            dead = True
+        else:
+            callback(spiral)
+    if dead:
+        _COLLAPSE_HOOKS[:] = [ref for ref in _COLLAPSE_HOOKS if ref() is not None]
+
+
 # =============================================================================
 # HELIX KERNEL (Genesis Model)
 # =============================================================================
@@ -1127,6 +1163,8 @@ class HelixKernel:
         
         if self._substrate:
             self._substrate.release_materialized(self._spiral)
+        if _COLLAPSE_HOOKS:
+            _run_collapse_hooks(self._spiral)
     
     def lift(self, target: int) -> Set['Token']:
         """
@@ -17,12 +17,17 @@ it composes them from fundamental operations.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterator
+from collections import deque
+import hashlib
+import itertools
 import math
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 # Setup path for standalone execution
@@ -41,6 +46,14 @@ from kernel_primitives import (
 # Import licensing
 from licensing import requires_license
 
+# NumPy is optional - frames vectorize with it, fall back to scanlines without
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 
 # =============================================================================
 # FRAME SUBSTRATE - Derives visual frames from geometry + color
@@ -48,36 +61,83 @@ from licensing import requires_license
 
 @dataclass
 class Frame:
-    """A single video frame - derived from kernel primitives"""
+    """
+    A single video frame - derived from kernel primitives.
+    
+    Pixels live in one contiguous RGB24 bytearray (row-major, 3 bytes per
+    pixel) instead of a list of RGB objects, so a 1080p frame is a single
+    6 MB buffer. Drawing operations write whole scanlines into it, NumPy
+    (when installed) gets a zero-copy (h, w, 3) view through `array`, and
+    PIL / raw encoders read the buffer without copying.
+    """
     width: int
     height: int
-    pixels: List[List[RGB]] = field(default_factory=list)
+    buffer: Optional[bytearray] = None
     timestamp: float = 0.0
     
     def __post_init__(self):
-        if not self.pixels:
-            self.pixels = [[RGB(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+        size = self.width * self.height * 3
+        if self.buffer is None:
+            self.buffer = bytearray(size)
+        elif len(self.buffer) != size:
+            raise ValueError(f"Frame buffer has {len(self.buffer)} bytes, expected {size}")
+    
+    @property
+    def stride(self) -> int:
+        """Bytes per row"""
+        return self.width * 3
+    
+    @property
+    def array(self):
+        """Zero-copy NumPy view of shape (height, width, 3), dtype uint8"""
+        if not HAS_NUMPY:
+            raise ImportError("NumPy required for Frame.array. pip install numpy")
+        return np.frombuffer(self.buffer, dtype=np.uint8).reshape(self.height, self.width, 3)
+    
+    @property
+    def pixels(self) -> List[List[RGB]]:
+        """Rows of RGB objects (a copy - for inspection, not for drawing)"""
+        buf = self.buffer
+        stride = self.stride
+        return [
+            [RGB(buf[i], buf[i + 1], buf[i + 2]) for i in range(row, row + stride, 3)]
+            for row in range(0, len(buf), stride)
+        ]
     
     def set_pixel(self, x: int, y: int, color: RGB):
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.pixels[y][x] = color
+            i = (y * self.width + x) * 3
+            self.buffer[i:i + 3] = _rgb_bytes(color)
+    
+    def get_pixel(self, x: int, y: int) -> RGB:
+        i = (y * self.width + x) * 3
+        return RGB(self.buffer[i], self.buffer[i + 1], self.buffer[i + 2])
     
     def fill(self, color: RGB):
-        for y in range(self.height):
-            for x in range(self.width):
-                self.pixels[y][x] = color
+        self.buffer[:] = _rgb_bytes(color) * (self.width * self.height)
+    
+    def fill_span(self, y: int, x0: int, x1: int, rgb: bytes):
+        """Fill pixels x0..x1 (inclusive) of row y - the scanline primitive"""
+        if not 0 <= y < self.height:
+            return
+        x0 = max(0, x0)
+        x1 = min(self.width - 1, x1)
+        if x0 > x1:
+            return
+        start = (y * self.width + x0) * 3
+        self.buffer[start:start + (x1 - x0 + 1) * 3] = rgb * (x1 - x0 + 1)
+    
+    def copy(self) -> 'Frame':
+        return Frame(self.width, self.height, bytearray(self.buffer), self.timestamp)
+    
+    def to_bytes(self) -> memoryview:
+        """Raw RGB24 bytes for encoders (a view, not a copy)"""
+        return memoryview(self.buffer)
     
     def to_pil(self):
-        """Convert to PIL Image for export - optimized with numpy"""
+        """Convert to PIL Image for export (shares the frame buffer)"""
         from PIL import Image
-        import numpy as np
-        # Fast numpy conversion instead of pixel-by-pixel
-        arr = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        for y in range(self.height):
-            for x in range(self.width):
-                c = self.pixels[y][x]
-                arr[y, x] = [c.r, c.g, c.b]
-        return Image.fromarray(arr, 'RGB')
+        return Image.frombuffer('RGB', (self.width, self.height), self.buffer, 'raw', 'RGB', 0, 1)
     
     def to_pil_fast(self, np_array):
         """Fastest conversion from pre-built numpy array"""
@@ -85,6 +145,15 @@ class Frame:
         return Image.fromarray(np_array, 'RGB')
 
 
+def _clamp_channel(v: int) -> int:
+    return 0 if v < 0 else 255 if v > 255 else int(v)
+
+
+def _rgb_bytes(color: RGB) -> bytes:
+    """Packed RGB24 bytes for a color (channels clamped to 0-255)"""
+    return bytes((_clamp_channel(color.r), _clamp_channel(color.g), _clamp_channel(color.b)))
+
+
 @requires_license("media")
 class FrameSubstrate(Substrate):
     """
@@ -119,37 +188,72 @@ class FrameSubstrate(Substrate):
     def gradient_fill(self, frame: Frame, color1: RGB, color2: RGB, 
                       angle: float = 0) -> Frame:
         """Fill frame with gradient - derived from color blending"""
-        for y in range(frame.height):
-            for x in range(frame.width):
-                # Project onto gradient line
-                nx = x / frame.width
-                ny = y / frame.height
-                t = nx * math.cos(angle) + ny * math.sin(angle)
-                t = max(0, min(1, (t + 0.5)))  # Normalize
-                frame.set_pixel(x, y, color1.blend(color2, t))
+        w, h = frame.width, frame.height
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        
+        if HAS_NUMPY:
+            # Project every pixel onto the gradient line at once
+            t = (np.arange(w) / w) * cos_a + ((np.arange(h) / h) * sin_a)[:, None]
+            t = np.clip(t + 0.5, 0, 1)[..., None]
+            c1 = np.array([color1.r, color1.g, color1.b], dtype=np.float64)
+            c2 = np.array([color2.r, color2.g, color2.b], dtype=np.float64)
+            frame.array[:] = np.clip(c1 + (c2 - c1) * t, 0, 255).astype(np.uint8)
+            return frame
+        
+        # Scanline fallback: build each row once, then copy it into place
+        def row_bytes(y_term: float) -> bytes:
+            return b''.join(
+                _rgb_bytes(color1.blend(color2, max(0, min(1, x_term + y_term + 0.5))))
+                for x_term in x_terms
+            )
+        
+        x_terms = [(x / w) * cos_a for x in range(w)]
+        stride = frame.stride
+        if sin_a == 0:
+            frame.buffer[:] = row_bytes(0.0) * h
+        else:
+            for y in range(h):
+                frame.buffer[y * stride:(y + 1) * stride] = row_bytes((y / h) * sin_a)
         return frame
     
     def draw_circle(self, frame: Frame, cx: int, cy: int, radius: int, 
                     color: RGB, filled: bool = True) -> Frame:
-        """Draw circle - derived from Euclidean distance"""
+        """Draw circle - derived from Euclidean distance, one span per row"""
+        rgb = _rgb_bytes(color)
         r2 = radius * radius
         for y in range(max(0, cy - radius), min(frame.height, cy + radius + 1)):
-            for x in range(max(0, cx - radius), min(frame.width, cx + radius + 1)):
-                d2 = (x - cx) ** 2 + (y - cy) ** 2
-                if filled:
-                    if d2 <= r2:
-                        frame.set_pixel(x, y, color)
+            dy2 = (y - cy) ** 2
+            if filled:
+                # x with (x - cx)^2 <= r2 - dy2
+                if dy2 > r2:
+                    continue
+                half = min(radius, math.isqrt(r2 - dy2))
+                frame.fill_span(y, cx - half, cx + half, rgb)
+            else:
+                # Ring: |(x - cx)^2 + dy2 - r2| < 2 * radius
+                hi = r2 + radius * 2 - dy2       # dx^2 < hi
+                lo = r2 - radius * 2 - dy2       # dx^2 > lo
+                if hi <= 0:
+                    continue
+                outer = min(radius, math.isqrt(hi - 1))
+                inner = math.isqrt(lo) + 1 if lo >= 0 else 0
+                if inner > outer:
+                    continue
+                if inner == 0:
+                    frame.fill_span(y, cx - outer, cx + outer, rgb)
                 else:
-                    if abs(d2 - r2) < radius * 2:
-                        frame.set_pixel(x, y, color)
+                    frame.fill_span(y, cx - outer, cx - inner, rgb)
+                    frame.fill_span(y, cx + inner, cx + outer, rgb)
         return frame
     
     def draw_rect(self, frame: Frame, x: int, y: int, w: int, h: int, 
                   color: RGB) -> Frame:
-        """Draw rectangle"""
-        for dy in range(h):
-            for dx in range(w):
-                frame.set_pixel(x + dx, y + dy, color)
+        """Draw rectangle - one span per row"""
+        if w <= 0:
+            return frame
+        rgb = _rgb_bytes(color)
+        for row in range(max(0, y), min(frame.height, y + h)):
+            frame.fill_span(row, x, x + w - 1, rgb)
         return frame
     
     def draw_3d_sphere(self, frame: Frame, cx: int, cy: int, radius: int,
@@ -161,30 +265,49 @@ class FrameSubstrate(Substrate):
         from fundamental primitives (vectors, colors).
         """
         light = light_dir.normalize()
+        y0, y1 = max(0, cy - radius), min(frame.height, cy + radius + 1)
+        x0, x1 = max(0, cx - radius), min(frame.width, cx + radius + 1)
+        if y0 >= y1 or x0 >= x1:
+            return frame
         
-        for y in range(max(0, cy - radius), min(frame.height, cy + radius + 1)):
-            for x in range(max(0, cx - radius), min(frame.width, cx + radius + 1)):
+        if HAS_NUMPY:
+            # Surface normals and Lambertian shading for the whole bounding box
+            dx = ((np.arange(x0, x1) - cx) / radius)[None, :]
+            dy = ((np.arange(y0, y1) - cy) / radius)[:, None]
+            d2 = dx * dx + dy * dy
+            inside = d2 <= 1.0
+            dz = np.sqrt(np.maximum(0.0, 1.0 - d2))
+            diffuse = np.maximum(0, dx * light.x + dy * light.y + dz * light.z)
+            intensity = (0.2 + 0.8 * diffuse)[..., None]
+            base = np.array([base_color.r, base_color.g, base_color.b], dtype=np.float64)
+            shaded = np.clip(base * intensity, 0, 255).astype(np.uint8)
+            region = frame.array[y0:y1, x0:x1]
+            region[inside] = shaded[inside]
+            return frame
+        
+        # Scanline fallback: shade the visible span of each row
+        for y in range(y0, y1):
+            dy = (y - cy) / radius
+            span = []
+            span_start = None
+            for x in range(x0, x1):
                 dx = (x - cx) / radius
-                dy = (y - cy) / radius
                 d2 = dx * dx + dy * dy
-                
-                if d2 <= 1.0:
-                    # Calculate surface normal
-                    dz = math.sqrt(1.0 - d2)
-                    normal = Vector3D(dx, dy, dz)
-                    
-                    # Lambertian shading
-                    diffuse = max(0, normal.x * light.x + normal.y * light.y + normal.z * light.z)
-                    
-                    # Add some ambient
-                    intensity = 0.2 + 0.8 * diffuse
-                    
-                    # Apply to color
-                    r = int(min(255, base_color.r * intensity))
-                    g = int(min(255, base_color.g * intensity))
-                    b = int(min(255, base_color.b * intensity))
-                    
-                    frame.set_pixel(x, y, RGB(r, g, b))
+                if d2 > 1.0:
+                    if span_start is not None:
+                        break
+                    continue
+                if span_start is None:
+                    span_start = x
+                dz = math.sqrt(1.0 - d2)
+                diffuse = max(0, dx * light.x + dy * light.y + dz * light.z)
+                intensity = 0.2 + 0.8 * diffuse
+                span.append(_clamp_channel(base_color.r * intensity))
+                span.append(_clamp_channel(base_color.g * intensity))
+                span.append(_clamp_channel(base_color.b * intensity))
+            if span:
+                start = (y * frame.width + span_start) * 3
+                frame.buffer[start:start + len(span)] = bytes(span)
         
         return frame
     
@@ -465,100 +588,56 @@ class VideoSubstrate(Substrate):
         Render frames + audio to MP4 video.
         
         Uses ffmpeg for encoding but all content is substrate-derived.
+        Frame buffers are piped straight into ffmpeg as raw RGB24 - no
+        intermediate image files.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Save frames as images
-            print(f"  Saving {len(frames)} frames...")
-            for i, frame in enumerate(frames):
-                img = frame.to_pil()
-                img.save(os.path.join(tmpdir, f"frame_{i:05d}.png"))
-            
-            # Build ffmpeg command
-            cmd = [
-                'ffmpeg', '-y',
-                '-framerate', str(self.fps),
-                '-i', os.path.join(tmpdir, 'frame_%05d.png'),
-            ]
-            
-            if audio_path and os.path.exists(audio_path):
-                cmd.extend(['-i', audio_path])
-                cmd.extend(['-c:a', 'aac', '-b:a', '192k'])
-            
-            cmd.extend([
-                '-c:v', 'libx264',
-                '-pix_fmt', 'yuv420p',
-                '-preset', 'fast',
-                output_path
-            ])
-            
-            print(f"  Encoding video...")
-            subprocess.run(cmd, capture_output=True)
+        sink = FFmpegSink(output_path, audio_path, preset='fast')
+        
+        print(f"  Encoding {len(frames)} frames...")
+        sink.open(self.width, self.height, self.fps)
+        try:
+            for frame in frames:
+                sink.write(frame.to_bytes())
+        finally:
+            sink.close()
         
         return output_path
     
-    def compose_scene(self, scene_script: List[dict], duration: float) -> Tuple[List[Frame], str]:
+    def compose_scene(self, scene_script: List[dict], duration: float,
+                      workers: Optional[int] = None) -> List[Frame]:
         """
         Compose a scene from script directives.
         
         Each directive describes what to draw at what time.
+        
+        Args:
+            scene_script: Scene directives
+            duration: Scene length in seconds
+            workers: Render across this many processes (None/1 = serial)
         """
         num_frames = int(duration * self.fps)
-        frames = []
         
+        if workers and workers > 1 and num_frames > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            chunk = max(1, math.ceil(num_frames / (workers * 4)))
+            jobs = [
+                (self.width, self.height, self.fps, scene_script, duration,
+                 start, min(num_frames, start + chunk))
+                for start in range(0, num_frames, chunk)
+            ]
+            frames = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # map() preserves order, so frames reassemble in sequence
+                for rendered in pool.map(_render_scene_chunk, jobs):
+                    frames.extend(rendered)
+                    print(f"    Frame {len(frames)}/{num_frames} ({100*len(frames)//num_frames}%)")
+            return frames
+        
+        frames = []
         for frame_idx in range(num_frames):
-            t = frame_idx / self.fps
-            progress = t / duration
-            
-            frame = self.frame_sub.create_frame(t)
-            
-            # Process each scene element
-            for element in scene_script:
-                elem_type = element.get("type")
-                start = element.get("start", 0)
-                end = element.get("end", duration)
-                
-                if not (start <= t <= end):
-                    continue
-                
-                elem_progress = (t - start) / (end - start) if end > start else 0
-                
-                if elem_type == "gradient":
-                    c1 = RGB.from_hex(element["color1"])
-                    c2 = RGB.from_hex(element["color2"])
-                    angle = element.get("angle", 0) + elem_progress * element.get("rotate", 0)
-                    self.frame_sub.gradient_fill(frame, c1, c2, angle)
-                
-                elif elem_type == "sphere":
-                    cx = int(element.get("x", self.width // 2) + 
-                            elem_progress * element.get("move_x", 0))
-                    cy = int(element.get("y", self.height // 2) +
-                            elem_progress * element.get("move_y", 0))
-                    radius = int(element.get("radius", 100) * 
-                                (element.get("start_scale", 1) + 
-                                 elem_progress * (element.get("end_scale", 1) - element.get("start_scale", 1))))
-                    color = RGB.from_hex(element["color"])
-                    light = Vector3D(
-                        math.cos(t * element.get("light_speed", 1)),
-                        0.5,
-                        math.sin(t * element.get("light_speed", 1))
-                    )
-                    self.frame_sub.draw_3d_sphere(frame, cx, cy, radius, color, light, t)
-                
-                elif elem_type == "helix":
-                    cx = element.get("x", self.width // 2)
-                    cy = element.get("y", self.height // 2)
-                    radius = element.get("radius", 200)
-                    color = RGB.from_hex(element["color"])
-                    self.frame_sub.draw_3d_helix(frame, cx, cy, radius, color, t * 2)
-                
-                elif elem_type == "circle":
-                    cx = element.get("x", self.width // 2)
-                    cy = element.get("y", self.height // 2)
-                    radius = int(element.get("radius", 50) * (1 + elem_progress * element.get("grow", 0)))
-                    color = RGB.from_hex(element["color"])
-                    self.frame_sub.draw_circle(frame, cx, cy, radius, color)
-            
-            frames.append(frame)
+            frames.append(_compose_scene_frame(
+                self.frame_sub, scene_script, frame_idx, self.fps, duration
+            ))
             
             if frame_idx % 30 == 0:
                 print(f"    Frame {frame_idx}/{num_frames} ({100*frame_idx//num_frames}%)")
@@ -566,6 +645,499 @@ class VideoSubstrate(Substrate):
         return frames
 
 
+def _compose_scene_frame(frame_sub: FrameSubstrate, scene_script: List[dict],
+                         frame_idx: int, fps: int, duration: float) -> Frame:
+    """Draw one frame of a scene script"""
+    width, height = frame_sub.width, frame_sub.height
+    t = frame_idx / fps
+    frame = frame_sub.create_frame(t)
+    
+    # Process each scene element
+    for element in scene_script:
+        elem_type = element.get("type")
+        start = element.get("start", 0)
+        end = element.get("end", duration)
+        
+        if not (start <= t <= end):
+            continue
+        
+        elem_progress = (t - start) / (end - start) if end > start else 0
+        
+        if elem_type == "gradient":
+            c1 = RGB.from_hex(element["color1"])
+            c2 = RGB.from_hex(element["color2"])
+            angle = element.get("angle", 0) + elem_progress * element.get("rotate", 0)
+            frame_sub.gradient_fill(frame, c1, c2, angle)
+        
+        elif elem_type == "sphere":
+            cx = int(element.get("x", width // 2) + 
+                    elem_progress * element.get("move_x", 0))
+            cy = int(element.get("y", height // 2) +
+                    elem_progress * element.get("move_y", 0))
+            radius = int(element.get("radius", 100) * 
+                        (element.get("start_scale", 1) + 
+                         elem_progress * (element.get("end_scale", 1) - element.get("start_scale", 1))))
+            color = RGB.from_hex(element["color"])
+            light = Vector3D(
+                math.cos(t * element.get("light_speed", 1)),
+                0.5,
+                math.sin(t * element.get("light_speed", 1))
+            )
+            frame_sub.draw_3d_sphere(frame, cx, cy, radius, color, light, t)
+        
+        elif elem_type == "helix":
+            cx = element.get("x", width // 2)
+            cy = element.get("y", height // 2)
+            radius = element.get("radius", 200)
+            color = RGB.from_hex(element["color"])
+            frame_sub.draw_3d_helix(frame, cx, cy, radius, color, t * 2)
+        
+        elif elem_type == "circle":
+            cx = element.get("x", width // 2)
+            cy = element.get("y", height // 2)
+            radius = int(element.get("radius", 50) * (1 + elem_progress * element.get("grow", 0)))
+            color = RGB.from_hex(element["color"])
+            frame_sub.draw_circle(frame, cx, cy, radius, color)
+    
+    return frame
+
+
+def _render_scene_chunk(job: tuple) -> List[Frame]:
+    """Process-pool worker: render frames [start, stop) of a scene"""
+    width, height, fps, scene_script, duration, start, stop = job
+    frame_sub = FrameSubstrate(width, height)
+    return [
+        _compose_scene_frame(frame_sub, scene_script, i, fps, duration)
+        for i in range(start, stop)
+    ]
+
+
+# =============================================================================
+# RENDER PIPELINE - Parallel frame rendering streamed into an encoder
+# =============================================================================
+
+def _frame_bytes(frame) -> Any:
+    """Raw RGB24 bytes of a rendered frame (Frame, PIL Image, ndarray or bytes)"""
+    if hasattr(frame, 'to_bytes'):
+        return frame.to_bytes()
+    if hasattr(frame, 'tobytes'):
+        if getattr(frame, 'mode', 'RGB') != 'RGB':
+            frame = frame.convert('RGB')
+        return frame.tobytes()
+    return frame
+
+
+def _render_pipeline_chunk(job: tuple) -> List[bytes]:
+    """Process-pool worker: render frames [start, stop) to raw RGB24 bytes"""
+    render_fn, start, stop = job
+    # bytes() detaches views (Frame.to_bytes) so results can cross processes
+    return [bytes(_frame_bytes(render_fn(i))) for i in range(start, stop)]
+
+
+class NullSink:
+    """
+    Frame sink that encodes nothing.
+    
+    Counts frames and bytes and keeps a running SHA-256 of the stream, so
+    a pipeline can be tested or benchmarked offline without ffmpeg - and
+    two renders (serial vs. parallel, full vs. resumed) can be compared
+    by digest.
+    """
+    
+    def __init__(self):
+        self.frames = 0
+        self.bytes_written = 0
+        self._hash = hashlib.sha256()
+    
+    def open(self, width: int, height: int, fps: int):
+        pass
+    
+    def write(self, data):
+        self.frames += 1
+        self.bytes_written += len(data)
+        self._hash.update(data)
+    
+    def close(self) -> int:
+        return 0
+    
+    @property
+    def digest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class FFmpegSink:
+    """
+    Frame sink that streams raw RGB24 frames into ffmpeg's stdin.
+    
+    ffmpeg's diagnostics go to an anonymous temp file rather than a pipe,
+    so a chatty encoder can never block the writer; the tail is kept in
+    `stderr` after close().
+    """
+    
+    def __init__(self, output_path: str, audio_path: Optional[str] = None,
+                 crf: Optional[int] = None, preset: str = 'medium',
+                 audio_bitrate: str = '192k', extra_args: Optional[List[str]] = None,
+                 ffmpeg: str = 'ffmpeg'):
+        self.output_path = str(output_path)
+        self.audio_path = audio_path
+        self.crf = crf
+        self.preset = preset
+        self.audio_bitrate = audio_bitrate
+        self.extra_args = list(extra_args or [])
+        self.ffmpeg = ffmpeg
+        self.stderr = ""
+        self._proc = None
+        self._log = None
+    
+    def command(self, width: int, height: int, fps: int) -> List[str]:
+        cmd = [
+            self.ffmpeg, '-y',
+            '-f', 'rawvideo',
+            '-pix_fmt', 'rgb24',
+            '-s', f'{width}x{height}',
+            '-framerate', str(fps),
+            '-i', '-',
+        ]
+        has_audio = bool(self.audio_path and os.path.exists(self.audio_path))
+        if has_audio:
+            cmd.extend(['-i', str(self.audio_path)])
+        cmd.extend(['-c:v', 'libx264', '-preset', self.preset])
+        if self.crf is not None:
+            cmd.extend(['-crf', str(self.crf)])
+        cmd.extend(['-pix_fmt', 'yuv420p'])
+        if has_audio:
+            cmd.extend(['-c:a', 'aac', '-b:a', self.audio_bitrate, '-shortest'])
+        cmd.extend(self.extra_args)
+        cmd.append(self.output_path)
+        return cmd
+    
+    def open(self, width: int, height: int, fps: int):
+        self._log = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(self.command(width, height, fps),
+                                      stdin=subprocess.PIPE,
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=self._log)
+    
+    def write(self, data):
+        try:
+            self._proc.stdin.write(data)
+        except BrokenPipeError:
+            self.close()
+            raise RuntimeError(f"ffmpeg exited early: {self.stderr}")
+    
+    def close(self) -> int:
+        if self._proc is None:
+            return 0
+        proc, self._proc = self._proc, None
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = proc.wait()
+        self._log.seek(0)
+        self.stderr = self._log.read()[-2000:].decode('utf-8', 'replace')
+        self._log.close()
+        return returncode
+
+
+@dataclass
+class RenderStats:
+    """Throughput of one pipeline run"""
+    start: int
+    stop: int
+    frames: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    workers: int = 1
+    skipped: int = 0
+    
+    @property
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+    
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds else 0.0
+    
+    def merge(self, other: 'RenderStats'):
+        self.frames += other.frames
+        self.bytes += other.bytes
+        self.seconds += other.seconds
+        self.skipped += other.skipped
+    
+    def summary(self) -> str:
+        text = (f"{self.frames} frames in {self.seconds:.1f}s - {self.fps:.2f} fps, "
+                f"{self.mb_per_second:.1f} MB/s ({self.workers} workers)")
+        if self.skipped:
+            text += f", {self.skipped} frames resumed from disk"
+        return text
+
+
+class RenderPipeline:
+    """
+    Renders frames in a process pool and streams them, in order, to a sink.
+    
+    render_fn(frame_num) runs in the worker processes, so it must be a
+    module-level function; it may return a Frame, a PIL Image, a NumPy
+    array or raw RGB24 bytes. Workers render chunks of consecutive frames
+    and at most `workers * 2` chunks are in flight, so memory stays bounded
+    when the encoder is the bottleneck.
+    
+    Any [start, stop) frame range can be rendered on its own, which is what
+    makes render_segments() resumable.
+    """
+    
+    def __init__(self, render_fn: Callable[[int], Any], width: int, height: int,
+                 fps: int, total_frames: int, workers: Optional[int] = None,
+                 chunk_frames: int = 4, progress_every: Optional[int] = None,
+                 label_fn: Optional[Callable[[int], str]] = None):
+        self.render_fn = render_fn
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.total_frames = total_frames
+        self.workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self.chunk_frames = max(1, chunk_frames)
+        self.progress_every = progress_every if progress_every is not None else fps * 10
+        self.label_fn = label_fn
+    
+    @property
+    def frame_size(self) -> int:
+        return self.width * self.height * 3
+    
+    def _range(self, start: int, stop: Optional[int]) -> Tuple[int, int]:
+        stop = self.total_frames if stop is None else min(stop, self.total_frames)
+        return max(0, start), stop
+    
+    def frames(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Any]:
+        """Raw RGB24 frames [start, stop) in frame order"""
+        start, stop = self._range(start, stop)
+        
+        if self.workers == 1:
+            for frame_num in range(start, stop):
+                yield _frame_bytes(self.render_fn(frame_num))
+            return
+        
+        from concurrent.futures import ProcessPoolExecutor
+        jobs = ((self.render_fn, s, min(stop, s + self.chunk_frames))
+                for s in range(start, stop, self.chunk_frames))
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            pending = deque(pool.submit(_render_pipeline_chunk, job)
+                            for job in itertools.islice(jobs, self.workers * 2))
+            while pending:
+                # Oldest chunk first - that is the ordered reassembly
+                chunk = pending.popleft().result()
+                job = next(jobs, None)
+                if job is not None:
+                    pending.append(pool.submit(_render_pipeline_chunk, job))
+                yield from chunk
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def render(self, sink, start: int = 0, stop: Optional[int] = None) -> RenderStats:
+        """Stream frames [start, stop) into sink and report throughput"""
+        start, stop = self._range(start, stop)
+        stats = RenderStats(start, stop, workers=self.workers)
+        count = stop - start
+        began = time.perf_counter()
+        
+        sink.open(self.width, self.height, self.fps)
+        try:
+            for frame_num, data in enumerate(self.frames(start, stop), start):
+                if len(data) != self.frame_size:
+                    raise ValueError(f"Frame {frame_num} has {len(data)} bytes, "
+                                     f"expected {self.frame_size}")
+                sink.write(data)
+                stats.frames += 1
+                stats.bytes += len(data)
+                
+                if self.progress_every and (stats.frames % self.progress_every == 0
+                                            or stats.frames == count):
+                    elapsed = time.perf_counter() - began
+                    fps = stats.frames / elapsed if elapsed else 0.0
+                    eta = (count - stats.frames) / fps if fps else 0.0
+                    label = f" - {self.label_fn(frame_num)}" if self.label_fn else ""
+                    print(f"  [{100 * stats.frames / count:5.1f}%] Frame {frame_num + 1}/"
+                          f"{self.total_frames} - {fps:.2f} fps, ETA {eta:.0f}s{label}")
+        finally:
+            returncode = sink.close()
+        
+        stats.seconds = time.perf_counter() - began
+        if returncode:
+            raise RuntimeError(f"Encoder exited with status {returncode}: "
+                               f"{getattr(sink, 'stderr', '')}")
+        return stats
+    
+    def render_segments(self, output_path: str, segment_frames: int,
+                        audio_path: Optional[str] = None, start: int = 0,
+                        stop: Optional[int] = None, keep_segments: bool = False,
+                        **encoder_options) -> RenderStats:
+        """
+        Resumable render: encode [start, stop) as fixed-size segments.
+        
+        Each segment is written to <output>.parts/ and only renamed into
+        place once ffmpeg finishes it, so segments already on disk are
+        complete and are skipped when an interrupted render is re-run.
+        The segments are then concatenated (stream copy, no re-encode)
+        and muxed with the audio track.
+        """
+        start, stop = self._range(start, stop)
+        ffmpeg = encoder_options.get('ffmpeg', 'ffmpeg')
+        parts_dir = Path(f"{output_path}.parts")
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        
+        stats = RenderStats(start, stop, workers=self.workers)
+        segments = []
+        for seg_start in range(start, stop, segment_frames):
+            seg_stop = min(stop, seg_start + segment_frames)
+            path = parts_dir / f"{seg_start:06d}-{seg_stop:06d}.mp4"
+            segments.append(path)
+            if path.exists():
+                stats.skipped += seg_stop - seg_start
+                continue
+            partial = parts_dir / f"{seg_start:06d}-{seg_stop:06d}.partial.mp4"
+            print(f"  Segment frames {seg_start}-{seg_stop}...")
+            stats.merge(self.render(FFmpegSink(partial, **encoder_options), seg_start, seg_stop))
+            os.replace(partial, path)
+        
+        list_path = parts_dir / "segments.txt"
+        list_path.write_text("".join(f"file '{p.resolve()}'\n" for p in segments))
+        cmd = [ffmpeg, '-y', '-f', 'concat', '-safe', '0', '-i', str(list_path)]
+        if audio_path and os.path.exists(audio_path):
+            cmd.extend(['-i', str(audio_path), '-map', '0:v', '-map', '1:a',
+                        '-c:a', 'aac', '-b:a', '192k', '-shortest'])
+        cmd.extend(['-c:v', 'copy', str(output_path)])
+        
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg concat failed: {result.stderr[-2000:]}")
+        
+        if not keep_segments:
+            shutil.rmtree(parts_dir)
+        return stats
+    
+    def run(self, output_path: str, audio_path: Optional[str] = None,
+            start: int = 0, stop: Optional[int] = None,
+            segment_frames: Optional[int] = None, null_sink: bool = False,
+            **encoder_options) -> RenderStats:
+        """
+        Render [start, stop) the way the command line asked for: straight
+        into ffmpeg, as resumable segments, or into a NullSink (no encoder).
+        """
+        if null_sink:
+            sink = NullSink()
+            stats = self.render(sink, start, stop)
+            print(f"  Null sink: {sink.frames} frames, {sink.bytes_written} bytes, "
+                  f"sha256 {sink.digest[:16]}")
+        elif segment_frames:
+            stats = self.render_segments(output_path, segment_frames, audio_path,
+                                         start, stop, **encoder_options)
+        else:
+            stats = self.render(FFmpegSink(output_path, audio_path, **encoder_options),
+                                start, stop)
+        print(f"  Throughput: {stats.summary()}")
+        return stats
+
+
+def add_pipeline_arguments(parser):
+    """Command line flags shared by the video generators"""
+    parser.add_argument('--workers', type=int, default=None,
+                        help='render processes (default: CPU count, 1 = serial)')
+    parser.add_argument('--start', type=int, default=0,
+                        help='first frame to render')
+    parser.add_argument('--stop', type=int, default=None,
+                        help='stop before this frame (default: all frames)')
+    parser.add_argument('--segment-frames', type=int, default=None,
+                        help='encode resumable segments of this many frames')
+    parser.add_argument('--null-sink', action='store_true',
+                        help='render without encoding (throughput test, no ffmpeg)')
+    return parser
+
+
+# =============================================================================
+# BENCHMARK - Array-backed frames vs. the original List[List[RGB]] frames
+# =============================================================================
+
+def benchmark_frame_rendering(width: int = 640, height: int = 360,
+                              num_frames: int = 5) -> Dict[str, Any]:
+    """
+    Frames per second for a gradient + shaded sphere + circle + rect scene.
+    
+    The legacy renderer reproduces the original per-pixel implementation
+    (a List[List[RGB]] frame and nested x/y loops) for comparison.
+    """
+    import time
+    
+    def legacy_frame(t: float):
+        pixels = [[RGB(0, 0, 0) for _ in range(width)] for _ in range(height)]
+        
+        def set_pixel(x, y, color):
+            if 0 <= x < width and 0 <= y < height:
+                pixels[y][x] = color
+        
+        c1, c2 = RGB(10, 20, 60), RGB(200, 80, 160)
+        for y in range(height):
+            for x in range(width):
+                tt = (x / width) * math.cos(t) + (y / height) * math.sin(t)
+                set_pixel(x, y, c1.blend(c2, max(0, min(1, tt + 0.5))))
+        
+        cx, cy, radius = width // 2, height // 2, height // 3
+        light = Vector3D(math.cos(t), 0.5, math.sin(t)).normalize()
+        base = RGB(80, 200, 255)
+        for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
+            for x in range(max(0, cx - radius), min(width, cx + radius + 1)):
+                dx, dy = (x - cx) / radius, (y - cy) / radius
+                d2 = dx * dx + dy * dy
+                if d2 <= 1.0:
+                    dz = math.sqrt(1.0 - d2)
+                    diffuse = max(0, dx * light.x + dy * light.y + dz * light.z)
+                    intensity = 0.2 + 0.8 * diffuse
+                    set_pixel(x, y, RGB(int(min(255, base.r * intensity)),
+                                        int(min(255, base.g * intensity)),
+                                        int(min(255, base.b * intensity))))
+        
+        cx, cy, radius = width // 8, height // 8, height // 8
+        for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
+            for x in range(max(0, cx - radius), min(width, cx + radius + 1)):
+                if (x - cx) ** 2 + (y - cy) ** 2 <= radius * radius:
+                    set_pixel(x, y, RGB(255, 255, 0))
+        for y in range(height - 40, height - 10):
+            for x in range(20, width - 20):
+                set_pixel(x, y, RGB(30, 30, 30))
+        return pixels
+    
+    def array_frame(frame_sub: FrameSubstrate, t: float) -> Frame:
+        frame = frame_sub.create_frame(t)
+        frame_sub.gradient_fill(frame, RGB(10, 20, 60), RGB(200, 80, 160), t)
+        frame_sub.draw_3d_sphere(frame, width // 2, height // 2, height // 3,
+                                 RGB(80, 200, 255), Vector3D(math.cos(t), 0.5, math.sin(t)), t)
+        frame_sub.draw_circle(frame, width // 8, height // 8, height // 8, RGB(255, 255, 0))
+        frame_sub.draw_rect(frame, 20, height - 40, width - 40, 30, RGB(30, 30, 30))
+        return frame
+    
+    frame_sub = FrameSubstrate(width, height)
+    
+    start = time.perf_counter()
+    for i in range(num_frames):
+        legacy_frame(i / 30)
+    legacy_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for i in range(num_frames):
+        array_frame(frame_sub, i / 30)
+    array_seconds = time.perf_counter() - start
+    
+    return {
+        'resolution': f"{width}x{height}",
+        'frames': num_frames,
+        'numpy': HAS_NUMPY,
+        'legacy_fps': round(num_frames / legacy_seconds, 2),
+        'array_fps': round(num_frames / array_seconds, 2),
+        'speedup': round(legacy_seconds / array_seconds, 1)
+    }
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
@@ -577,4 +1149,10 @@ __all__ = [
     'AudioSubstrate',
     'VoiceSubstrate',
     'VideoSubstrate',
+    'NullSink',
+    'FFmpegSink',
+    'RenderStats',
+    'RenderPipeline',
+    'add_pipeline_arguments',
+    'benchmark_frame_rendering',
 ]
@@ -29,8 +29,13 @@ from .primitives import (
     HelixKernel, HelixState, ManifoldSubstrate, Token,
     LEVEL_NAMES
 )
+from collections import OrderedDict
 import json
 import hashlib
+import heapq
+import sys
+import threading
+import time
 from datetime import datetime
 
 
@@ -221,6 +226,32 @@ class HelixQuery:
 # HELIX CACHE - Level-aware caching
 # =============================================================================
 
+class _CacheEntry:
+    """One cached value (slots keep per-entry overhead small)"""
+    __slots__ = ('key', 'value', 'level', 'expires', 'size')
+    
+    def __init__(self, key: str, value: Any, level: int, expires: float, size: int):
+        self.key = key
+        self.value = value
+        self.level = level
+        self.expires = expires
+        self.size = size
+
+
+def _approx_size(value: Any, depth: int = 2) -> int:
+    """Cheap byte estimate: getsizeof plus (shallowly) container contents"""
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _approx_size(k, depth - 1) + _approx_size(v, depth - 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _approx_size(item, depth - 1)
+    return size
+
+
 class HelixCache:
     """
     Cache that understands dimensional levels.
@@ -229,6 +260,13 @@ class HelixCache:
     Lower levels (0-1) change more often → shorter cache TTL
     
     Invalidation cascades: invalidating level N also invalidates 0..N-1
+    
+    Entries live in one LRU-ordered dict plus a bucket per level, so a
+    cascade drops whole buckets instead of scanning every key. Expiry
+    deadlines (monotonic clock) sit in a min-heap that is drained a few
+    entries at a time on each write, so expired entries are reclaimed even
+    if nobody reads them again. Optional max_entries / max_bytes budgets
+    evict least-recently-used entries first.
     """
     
     DEFAULT_TTL_BY_LEVEL = {
@@ -241,60 +279,169 @@ class HelixCache:
         0: 1,      # Potential: 1 sec
     }
     
-    def __init__(self, ttl_by_level: Dict[int, int] = None):
-        self._cache: Dict[str, Dict] = {}  # key -> {value, level, timestamp}
+    PURGE_BATCH = 8   # expired entries reclaimed per write
+    
+    def __init__(self, ttl_by_level: Dict[int, int] = None,
+                 max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()  # LRU order
+        self._buckets: Dict[int, Dict[str, _CacheEntry]] = {}
+        self._expiry: List[tuple] = []  # (expires, seq, entry) min-heap
+        self._seq = 0
         self._ttl = ttl_by_level or self.DEFAULT_TTL_BY_LEVEL
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or _approx_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _unlink(self, entry: _CacheEntry) -> None:
+        """Remove an entry from the LRU dict and its level bucket"""
+        del self._entries[entry.key]
+        bucket = self._buckets.get(entry.level)
+        if bucket is not None:
+            bucket.pop(entry.key, None)
+        self._bytes -= entry.size
+    
+    def _purge(self, now: float, limit: Optional[int]) -> int:
+        """Pop expired deadlines off the heap (at most `limit` live ones)"""
+        heap = self._expiry
+        purged = 0
+        while heap and heap[0][0] < now and (limit is None or purged < limit):
+            _, _, entry = heapq.heappop(heap)
+            # Skip deadlines of entries that were replaced or already removed
+            if self._entries.get(entry.key) is entry:
+                self._unlink(entry)
+                self.expirations += 1
+                purged += 1
+        return purged
+    
+    def _compact_expiry(self) -> None:
+        """Drop deadlines of replaced/removed entries from the heap"""
+        entries = self._entries
+        self._expiry = [item for item in self._expiry if entries.get(item[2].key) is item[2]]
+        heapq.heapify(self._expiry)
     
     def get(self, key: str) -> Optional[Any]:
         """Get a cached value if not expired"""
-        if key not in self._cache:
-            return None
-        
-        entry = self._cache[key]
-        age = (datetime.now() - entry['timestamp']).total_seconds()
-        ttl = self._ttl.get(entry['level'], 60)
-        
-        if age > ttl:
-            del self._cache[key]
-            return None
-        
-        return entry['value']
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            if self._clock() > entry.expires:
+                self._unlink(entry)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
     
     def set(self, key: str, value: Any, level: int) -> None:
         """Cache a value at a specific level"""
-        self._cache[key] = {
-            'value': value,
-            'level': level,
-            'timestamp': datetime.now()
-        }
+        with self._lock:
+            now = self._clock()
+            old = self._entries.get(key)
+            if old is not None:
+                self._unlink(old)
+            
+            size = self._sizeof(value) if self.max_bytes is not None else 0
+            entry = _CacheEntry(key, value, level, now + self._ttl.get(level, 60), size)
+            self._entries[key] = entry
+            self._buckets.setdefault(level, {})[key] = entry
+            self._bytes += size
+            self._seq += 1
+            heapq.heappush(self._expiry, (entry.expires, self._seq, entry))
+            
+            if self._expiry[0][0] < now:
+                self._purge(now, self.PURGE_BATCH)
+            # Rewritten keys leave stale deadlines behind - rebuild occasionally
+            if len(self._expiry) > 2 * len(self._entries) + 1024:
+                self._compact_expiry()
+            if self.max_entries is not None or self.max_bytes is not None:
+                self._enforce_budget()
+    
+    def _enforce_budget(self) -> None:
+        """Evict least recently used entries until within budget"""
+        entries = self._entries
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries) or
+            (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._unlink(next(iter(entries.values())))
+            self.evictions += 1
+    
+    def delete(self, key: str) -> bool:
+        """Drop a single key. Returns True if it was cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._unlink(entry)
+            return True
+    
+    def purge_expired(self) -> int:
+        """Reclaim every expired entry now. Returns count purged."""
+        with self._lock:
+            return self._purge(self._clock(), None)
     
     def invalidate_level(self, level: int) -> int:
         """
         Invalidate all entries at level and below.
         Returns count of invalidated entries.
         """
-        to_remove = [
-            key for key, entry in self._cache.items()
-            if entry['level'] <= level
-        ]
-        for key in to_remove:
-            del self._cache[key]
-        return len(to_remove)
+        with self._lock:
+            removed = 0
+            for bucket_level in [l for l in self._buckets if l <= level]:
+                bucket = self._buckets.pop(bucket_level)
+                for key, entry in bucket.items():
+                    del self._entries[key]
+                    self._bytes -= entry.size
+                removed += len(bucket)
+            self.invalidations += removed
+            return removed
     
     def invalidate_all(self) -> None:
         """Clear entire cache"""
-        self._cache.clear()
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._buckets.clear()
+            self._expiry.clear()
+            self._bytes = 0
     
     @property
     def stats(self) -> Dict[str, Any]:
         """Cache statistics"""
         by_level = {i: 0 for i in range(7)}
-        for entry in self._cache.values():
-            by_level[entry['level']] += 1
+        for level, bucket in self._buckets.items():
+            by_level[level] = len(bucket)
+        lookups = self.hits + self.misses
         
         return {
-            'total_entries': len(self._cache),
-            'by_level': by_level
+            'total_entries': len(self._entries),
+            'by_level': by_level,
+            'bytes': self._bytes if self.max_bytes is not None else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
         }
 
 
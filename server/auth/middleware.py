@@ -8,17 +8,71 @@ Middleware for gating premium content behind login and payment.
 """
 
 import sys
+import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
 from urllib.parse import urlencode
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from server.auth.models import UserTier, AccessLevel
-from server.auth.access import can_access_page, FEATURE_GATES
+from server.auth.access import can_access_page, FEATURE_GATES, PUBLIC_PAGES
 from server.auth.payment import check_payment_gate, requires_payment
 
 
+# Compiled routes kept per middleware (oldest dropped first when full)
+ROUTE_CACHE_SIZE = 4096
+
+# Seconds a resolved session (user and tier) is reused for the same
+# credentials before get_session is asked again
+SESSION_CACHE_TTL = 5.0
+SESSION_CACHE_SIZE = 10_000
+
+
+class Route(NamedTuple):
+    """Everything about a path that does not depend on who asks"""
+    public: bool
+    login_required: bool
+    required_tier: UserTier
+    payment_required: bool
+    login_redirect: str
+    payment_redirect: str
+
+
+class PrefixTrie:
+    """
+    Character trie of path prefixes. A `segment` prefix only matches the
+    path itself or paths continuing with '/' ('/admin' matches
+    '/admin/users' but not '/administrator'); other prefixes match any
+    continuation.
+    """
+    
+    def __init__(self):
+        self._root: Dict[Optional[str], Any] = {}
+    
+    def add(self, prefix: str, value: Any, segment: bool = False):
+        node = self._root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append((value, segment))
+    
+    def matches(self, path: str) -> Iterator[Any]:
+        """Values of every prefix matching path, shortest first"""
+        node = self._root
+        n = len(path)
+        for i in range(n + 1):
+            entries = node.get(None)
+            if entries:
+                for value, segment in entries:
+                    if not segment or i == n or path[i] == '/':
+                        yield value
+            if i == n:
+                return
+            node = node.get(path[i])
+            if node is None:
+                return
+
+
 class AccessControlMiddleware:
     """
     Middleware that gates premium content behind login and payment.
@@ -31,8 +85,34 @@ class AccessControlMiddleware:
     5. Check if payment is required (dev tier)
     6. If unpaid -> redirect to /payment-required
     7. Allow access
+    
+    The page rules below are compiled once into an exact-match set and a
+    prefix trie, and each path's Route is cached, so a request costs one
+    route lookup plus one session lookup (see decide()).
     """
     
+    # Public pages - exact match (plus the public pages in access.py)
+    PUBLIC_EXACT = ['/', '/index', '/index.html', '/about', '/docs']
+    
+    # Public patterns - plain string prefix match
+    PUBLIC_PREFIXES = [
+        '/login',
+        '/register',
+        '/payment-required',
+        '/checkout',
+        '/api/status',
+        '/api/auth/',
+        '/static/',
+        '/manifold/',
+        '/d/',
+        '/dim/',
+        '/about/',
+        '/docs/',
+    ]
+    
+    # Static files (CSS, JS, images)
+    STATIC_EXTENSIONS = ('.css', '.js', '.png', '.jpg', '.svg', '.ico', '.woff', '.woff2')
+    
     # Pages that require login (not public)
     LOGIN_REQUIRED_PAGES = [
         '/dashboard',
@@ -63,18 +143,132 @@ class AccessControlMiddleware:
         '/downloads/premium',
     ]
     
-    def __init__(self, get_session_func):
+    def __init__(self, get_session_func, session_ttl: float = SESSION_CACHE_TTL,
+                 route_cache_size: int = ROUTE_CACHE_SIZE):
         """
         Initialize middleware.
         
         Args:
             get_session_func: Function to get current session from headers
+            session_ttl: Seconds to reuse a resolved session (0 disables)
+            route_cache_size: Paths whose Route is kept (0 disables)
         """
         self.get_session = get_session_func
+        self.session_ttl = session_ttl
+        self.route_cache_size = route_cache_size
+        
+        self._public_exact = frozenset(self.PUBLIC_EXACT) | {
+            page.path for page in PUBLIC_PAGES if page.path not in self.LOGIN_REQUIRED_PAGES
+        }
+        self._trie = PrefixTrie()
+        for prefix in self.PUBLIC_PREFIXES:
+            self._trie.add(prefix, ('public', None))
+        for page in self.LOGIN_REQUIRED_PAGES:
+            self._trie.add(page, ('login', None), segment=True)
+        for tier, pages in self.TIER_PAGES.items():
+            for page in pages:
+                self._trie.add(page, ('tier', tier), segment=True)
+        for page in self.PAYMENT_REQUIRED_FEATURES:
+            self._trie.add(page, ('payment', None), segment=True)
+        
+        self._routes: Dict[str, Route] = {}
+        # credentials -> (expires_at, session, user, tier)
+        self._sessions: Dict[Tuple, Tuple[float, Optional[Dict], Any, UserTier]] = {}
     
-    def check_access(self, path: str, headers: Dict) -> Tuple[bool, Optional[str], Dict]:
+    # =========================================================================
+    # ROUTES
+    # =========================================================================
+    
+    def route(self, path: str) -> Route:
+        """Compiled Route for a normalized path (cached)"""
+        route = self._routes.get(path)
+        if route is None:
+            route = self._compile_route(path)
+            if self.route_cache_size > 0:
+                if len(self._routes) >= self.route_cache_size:
+                    del self._routes[next(iter(self._routes))]
+                self._routes[path] = route
+        return route
+    
+    def _compile_route(self, path: str) -> Route:
+        """One trie walk collects every rule that applies to path"""
+        public = path in self._public_exact or path.endswith(self.STATIC_EXTENSIONS)
+        login = payment = False
+        tier = None
+        for kind, value in self._trie.matches(path):
+            if kind == 'public':
+                public = True
+            elif kind == 'login':
+                login = True
+            elif kind == 'tier':
+                tier = value if tier is None or value > tier else tier
+            else:
+                payment = True
+        
+        if tier is None:
+            # Default to USER for authenticated pages
+            tier = UserTier.USER if login else UserTier.ANONYMOUS
+        
+        return Route(
+            public=public,
+            login_required=login,
+            required_tier=tier,
+            payment_required=payment,
+            login_redirect=f"/login?redirect={urlencode({'r': path})}",
+            payment_redirect=f"/payment-required?feature={path.split('/')[-1].replace('-', '_')}",
+        )
+    
+    # =========================================================================
+    # SESSIONS
+    # =========================================================================
+    
+    @staticmethod
+    def _credentials(headers: Dict) -> Tuple:
+        """The headers a session can be resolved from"""
+        return headers.get('Authorization'), headers.get('Cookie')
+    
+    def resolve_session(self, headers: Dict) -> Tuple[Optional[Dict], Any, UserTier]:
+        """
+        (session, user, tier) for the request, reused for session_ttl
+        seconds per set of credentials (and never past the session's own
+        expiry).
+        """
+        key = self._credentials(headers)
+        now = time.time()
+        cached = self._sessions.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2], cached[3]
+        
+        session = self.get_session(headers)
+        user = session.get('user') if session else None
+        tier = user.tier if user else UserTier.ANONYMOUS
+        
+        if self.session_ttl > 0:
+            expires = now + self.session_ttl
+            if session and session.get('expires'):
+                expires = min(expires, session['expires'])
+            if len(self._sessions) >= SESSION_CACHE_SIZE:
+                self._sessions = {k: v for k, v in self._sessions.items() if v[0] > now}
+                if len(self._sessions) >= SESSION_CACHE_SIZE:
+                    del self._sessions[next(iter(self._sessions))]
+            self._sessions[key] = (expires, session, user, tier)
+        return session, user, tier
+    
+    def invalidate_session(self, headers: Optional[Dict] = None):
+        """Forget a cached session (e.g. on logout or tier change), or all"""
+        if headers is None:
+            self._sessions.clear()
+        else:
+            self._sessions.pop(self._credentials(headers), None)
+    
+    # =========================================================================
+    # DECISION
+    # =========================================================================
+    
+    def decide(self, path: str, headers: Dict) -> Tuple[bool, Optional[str], Dict]:
         """
-        Check if request should be allowed.
+        Full verdict for a request: route lookup, then (for non-public
+        pages) session lookup, then the tier and payment checks.
         
         Returns:
             (allowed, redirect_url, context)
@@ -83,126 +277,69 @@ class AccessControlMiddleware:
             - context: Additional context (error message, etc.)
         """
         # Normalize path
-        path = path.rstrip('/')
-        if not path:
-            path = '/'
+        path = path.rstrip('/') or '/'
+        route = self.route(path)
         
         # Public pages - always allowed
-        if self._is_public_page(path):
+        if route.public:
             return True, None, {}
         
-        # Get session
-        session = self.get_session(headers)
+        session, user, tier = self.resolve_session(headers)
         
         # Check if login required
-        if self._requires_login(path):
-            if not session:
-                redirect_url = f"/login?redirect={urlencode({'r': path})}"
-                return False, redirect_url, {"reason": "login_required"}
-        
-        # Get user from session
-        user = session.get('user') if session else None
-        tier = user.tier if user else UserTier.ANONYMOUS
+        if route.login_required and not session:
+            return False, route.login_redirect, {"reason": "login_required"}
         
-        # Check tier access
-        if not self._has_tier_access(path, tier):
+        # Check tier access - higher tiers can access lower tier pages
+        if tier < route.required_tier:
             return False, None, {
                 "reason": "insufficient_tier",
-                "required_tier": self._get_required_tier(path).name,
+                "required_tier": route.required_tier.name,
                 "user_tier": tier.name
             }
         
         # Check payment for dev tier
-        if tier == UserTier.DEV and self._requires_payment(path):
+        if tier == UserTier.DEV and route.payment_required:
             # Check if user has paid
             subscription = getattr(user, 'subscription_status', None)
-            gate_info = check_payment_gate(user, subscription, path)
-            
-            if gate_info:
-                feature_name = path.split('/')[-1].replace('-', '_')
-                redirect_url = f"/payment-required?feature={feature_name}"
-                return False, redirect_url, {
+            if check_payment_gate(user, subscription, path):
+                return False, route.payment_redirect, {
                     "reason": "payment_required",
                     "feature": path
                 }
         
         return True, None, {}
     
+    def check_access(self, path: str, headers: Dict) -> Tuple[bool, Optional[str], Dict]:
+        """Check if request should be allowed (see decide())"""
+        return self.decide(path, headers)
+    
     def _is_public_page(self, path: str) -> bool:
         """Check if page is public (no auth required)"""
-        # Exact match public pages
-        exact_public = ['/', '/index', '/index.html', '/about', '/docs']
-        if path in exact_public:
-            return True
-        
-        # Prefix match public patterns
-        public_prefixes = [
-            '/login',
-            '/register',
-            '/payment-required',
-            '/checkout',
-            '/api/status',
-            '/api/auth/',
-            '/static/',
-            '/manifold/',
-            '/d/',
-            '/dim/',
-            '/about/',
-            '/docs/',
-        ]
-        
-        for pattern in public_prefixes:
-            if path.startswith(pattern):
-                return True
-        
-        # Static files (CSS, JS, images)
-        static_extensions = ['.css', '.js', '.png', '.jpg', '.svg', '.ico', '.woff', '.woff2']
-        if any(path.endswith(ext) for ext in static_extensions):
-            return True
-        
-        return False
+        return self.route(path).public
     
     def _requires_login(self, path: str) -> bool:
         """Check if page requires login"""
-        for protected in self.LOGIN_REQUIRED_PAGES:
-            if path == protected or path.startswith(protected + '/'):
-                return True
-        return False
+        return self.route(path).login_required
     
     def _has_tier_access(self, path: str, tier: UserTier) -> bool:
         """Check if tier can access path"""
-        # Dimensional: higher tiers can access lower tier pages
-        required_tier = self._get_required_tier(path)
-        return tier.value >= required_tier.value
+        return tier >= self.route(path).required_tier
     
     def _get_required_tier(self, path: str) -> UserTier:
         """Get minimum tier required for path"""
-        # Check from highest to lowest
-        for tier in [UserTier.SUPERUSER, UserTier.BETA, UserTier.DEV, UserTier.USER]:
-            if tier in self.TIER_PAGES:
-                for tier_path in self.TIER_PAGES[tier]:
-                    if path == tier_path or path.startswith(tier_path + '/'):
-                        return tier
-        
-        # Default to USER for authenticated pages
-        if self._requires_login(path):
-            return UserTier.USER
-        
-        return UserTier.ANONYMOUS
+        return self.route(path).required_tier
     
     def _requires_payment(self, path: str) -> bool:
         """Check if path requires payment"""
-        for premium_path in self.PAYMENT_REQUIRED_FEATURES:
-            if path == premium_path or path.startswith(premium_path + '/'):
-                return True
-        return False
+        return self.route(path).payment_required
 
 
 def create_access_gate(auth_api):
     """
     Create an access gate function for the server.
     
-    Usage in server:
+    Usage in server (create once and reuse, so its caches persist):
         gate = create_access_gate(auth_api)
         allowed, redirect, ctx = gate(path, headers)
         if not allowed:
@@ -214,6 +351,55 @@ def create_access_gate(auth_api):
     middleware = AccessControlMiddleware(get_session)
     
     def gate(path: str, headers: Dict) -> Tuple[bool, Optional[str], Dict]:
-        return middleware.check_access(path, headers)
+        return middleware.decide(path, headers)
     
+    # gate.invalidate(headers) drops a cached session after login/logout
+    gate.invalidate = middleware.invalidate_session
+    gate.middleware = middleware
     return gate
+
+
+def benchmark_access(requests: int = 100_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Per-request overhead of the access check on a mixed workload of
+    public, gated and premium paths from anonymous and logged-in
+    clients, with and without the route and session caches.
+    """
+    import random
+    from types import SimpleNamespace
+    
+    rng = random.Random(seed)
+    sessions = {
+        f"token{i}": {
+            "user": SimpleNamespace(tier=tier, subscription_status=None),
+            "expires": time.time() + 3600,
+        }
+        for i, tier in enumerate(list(UserTier) * 20)
+    }
+    
+    def get_session(headers: Dict) -> Optional[Dict]:
+        # Same header parsing as the auth API
+        cookie = headers.get('Cookie', '')
+        for part in cookie.split(';'):
+            if part.strip().startswith('session='):
+                return sessions.get(part.strip()[8:])
+        return None
+    
+    paths = ['/', '/docs/intro', '/static/app.js', '/pricing', '/dashboard',
+             '/developer/tools', '/developer/premium/pack', '/beta/lounge',
+             '/admin/users', '/chat/collab', '/random/page', '/profile/edit/']
+    clients = [{}] + [{'Cookie': f"theme=dark; session={token}"} for token in sessions]
+    workload = [(rng.choice(paths), rng.choice(clients)) for _ in range(requests)]
+    
+    results = {"requests": requests}
+    for name, middleware in (
+        ("uncached", AccessControlMiddleware(get_session, session_ttl=0, route_cache_size=0)),
+        ("cached", AccessControlMiddleware(get_session)),
+    ):
+        start = time.perf_counter()
+        for path, headers in workload:
+            middleware.decide(path, headers)
+        elapsed = time.perf_counter() - start
+        results[f"{name}_us_per_request"] = round(elapsed / requests * 1e6, 3)
+    results["speedup"] = round(results["uncached_us_per_request"] / results["cached_us_per_request"], 2)
+    return results
@@ -259,6 +259,9 @@ class DimensionalRequestHandler(BaseHTTPRequestHandler):
     
     server_version = "ButterflyFX/1.0"
     
+    # Access gate shared by all requests so its route and session caches persist
+    _access_gate = None
+    
     def log_message(self, format, *args):
         if self.server.config.debug:
             super().log_message(format, *args)
@@ -426,6 +429,9 @@ class DimensionalRequestHandler(BaseHTTPRequestHandler):
             headers = dict(self.headers)
             auth_api = get_auth_api()
             response, status = auth_api.handle_get(auth_path, query, headers)
+            if DimensionalRequestHandler._access_gate is not None:
+                # Login, logout and upgrades change what these credentials resolve to
+                DimensionalRequestHandler._access_gate.invalidate(headers)
             self._send_json(response, status)
             return
         
@@ -676,6 +682,9 @@ class DimensionalRequestHandler(BaseHTTPRequestHandler):
             headers = dict(self.headers)
             auth_api = get_auth_api()
             response, status = auth_api.handle_post(auth_path, data, headers)
+            if DimensionalRequestHandler._access_gate is not None:
+                # Login, logout and upgrades change what these credentials resolve to
+                DimensionalRequestHandler._access_gate.invalidate(headers)
             self._send_json(response, status)
             return
         
@@ -952,8 +961,9 @@ class DimensionalRequestHandler(BaseHTTPRequestHandler):
     def _check_access(self, path: str):
         """Check if current request has access to path"""
         headers = dict(self.headers)
-        auth_api = get_auth_api()
-        gate = create_access_gate(auth_api)
+        gate = DimensionalRequestHandler._access_gate
+        if gate is None:
+            gate = DimensionalRequestHandler._access_gate = create_access_gate(get_auth_api())
         return gate(path, headers)
     
     def _send_redirect(self, url: str):
@@ -13,8 +13,9 @@ Copyright (c) 2024-2026 Kenneth Bingham
 Licensed under Creative Commons Attribution 4.0 International (CC BY 4.0)
 """
 
+import heapq
 import math
-from typing import Tuple, List, Optional, Callable, Any
+from typing import Tuple, List, Optional, Callable, Any, Dict, Hashable
 from dataclasses import dataclass
 import numpy as np
 
@@ -163,10 +164,11 @@ class TrinitySubstrate:
             if layer in self.spatial_index:
                 candidates.extend(self.spatial_index[layer])
         
-        # Sort by Pythagorean distance
-        candidates.sort(key=lambda p: self.pythagorean_distance(query, p))
-        
-        return candidates[:k]
+        # Partial selection by Pythagorean distance - O(n log k)
+        qx, qy, qz = query.x, query.y, query.z
+        return heapq.nsmallest(
+            k, candidates, key=lambda p: math.dist((qx, qy, qz), (p.x, p.y, p.z))
+        )
     
     def compose_manifold(self, points: List[TrinityPoint]) -> TrinityPoint:
         """
@@ -230,6 +232,149 @@ class TrinitySubstrate:
         return magnitude / PHI  # Golden ratio threshold
 
 
+class SpatialGrid:
+    """
+    Uniform grid over 3D points for exact k-nearest-neighbour queries.
+    
+    Points hash into cubic cells; a query walks Chebyshev shells of
+    cells outward from its own cell and stops as soon as the k-th best
+    distance is no farther than the next unvisited shell, or switches to
+    scanning the occupied cells once a shell would cost more than that.
+    
+    When occupied cells average more than MAX_PER_CELL points the grid
+    tries halving the cell size, and keeps the split only if it lowers
+    the fullest cell (coincident points never separate). Split attempts
+    are amortized by doubling the count needed for the next one, and
+    the cell size never drops below MIN_CELL_SIZE or MAX_SPLITS halvings.
+    """
+    
+    MAX_PER_CELL = 16
+    MAX_SPLITS = 32
+    MIN_CELL_SIZE = 1e-9
+    
+    def __init__(self, cell_size: float = 1.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int, int], Dict[Hashable, Tuple[float, float, float]]] = {}
+        self.count = 0
+        self.splits = 0
+        self._split_at = 0
+        self._lo = [0, 0, 0]
+        self._hi = [-1, -1, -1]
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _cell(self, x: float, y: float, z: float) -> Tuple[int, int, int]:
+        c = self.cell_size
+        return (math.floor(x / c), math.floor(y / c), math.floor(z / c))
+    
+    def insert(self, key: Hashable, x: float, y: float, z: float = 0.0) -> None:
+        self._place(key, x, y, z)
+        if self.count > self.MAX_PER_CELL * len(self.cells) and self.count >= self._split_at:
+            self._split()
+    
+    def _split(self) -> None:
+        """Halve the cell size if that actually spreads the fullest cell"""
+        self._split_at = 2 * self.count
+        cell_size = self.cell_size / 2
+        if self.splits >= self.MAX_SPLITS or cell_size < self.MIN_CELL_SIZE:
+            return
+        fullest = max(len(bucket) for bucket in self.cells.values())
+        trial: Dict[Tuple[int, int, int], int] = {}
+        for bucket in self.cells.values():
+            for x, y, z in bucket.values():
+                cell = (math.floor(x / cell_size), math.floor(y / cell_size),
+                        math.floor(z / cell_size))
+                trial[cell] = trial.get(cell, 0) + 1
+        if max(trial.values()) < fullest:
+            self.splits += 1
+            self._regrid(cell_size)
+    
+    def _place(self, key: Hashable, x: float, y: float, z: float) -> None:
+        cell = self._cell(x, y, z)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = {}
+            if self._hi[0] < self._lo[0]:
+                self._lo, self._hi = list(cell), list(cell)
+            else:
+                for axis in range(3):
+                    self._lo[axis] = min(self._lo[axis], cell[axis])
+                    self._hi[axis] = max(self._hi[axis], cell[axis])
+        if key not in bucket:
+            self.count += 1
+        bucket[key] = (x, y, z)
+    
+    def remove(self, key: Hashable, x: float, y: float, z: float = 0.0) -> bool:
+        cell = self._cell(x, y, z)
+        bucket = self.cells.get(cell)
+        if bucket is None or bucket.pop(key, None) is None:
+            return False
+        if not bucket:
+            del self.cells[cell]
+        self.count -= 1
+        return True
+    
+    def _regrid(self, cell_size: float) -> None:
+        points = [(key, xyz) for bucket in self.cells.values() for key, xyz in bucket.items()]
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+        self._lo, self._hi = [0, 0, 0], [-1, -1, -1]
+        for key, (x, y, z) in points:
+            self._place(key, x, y, z)
+    
+    def nearest(self, x: float, y: float, z: float = 0.0,
+                k: int = 5) -> List[Tuple[float, Hashable]]:
+        """k nearest (distance, key) pairs, closest first"""
+        if k <= 0 or not self.count:
+            return []
+        cx, cy, cz = self._cell(x, y, z)
+        q = (x, y, z)
+        best: List[Tuple[float, int, Hashable]] = []   # max-heap via -distance
+        tie = 0
+        max_r = max(max(cx - self._lo[0], self._hi[0] - cx),
+                    max(cy - self._lo[1], self._hi[1] - cy),
+                    max(cz - self._lo[2], self._hi[2] - cz), 0)
+        cells = self.cells
+        dist = math.dist
+        
+        def consider(bucket):
+            nonlocal tie
+            for key, xyz in bucket.items():
+                d = dist(q, xyz)
+                tie += 1
+                if len(best) < k:
+                    heapq.heappush(best, (-d, tie, key))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, tie, key))
+        
+        for r in range(max_r + 1):
+            # Anything outside shells 0..r-1 is at least (r-1) cells away
+            if len(best) == k and -best[0][0] <= (r - 1) * self.cell_size:
+                break
+            if r and (2 * r + 1) ** 3 - (2 * r - 1) ** 3 > len(cells):
+                # Sparse grid: the shell has more slots than there are
+                # occupied cells, so scan those not yet visited instead
+                for (ox, oy, oz), bucket in cells.items():
+                    if max(abs(ox - cx), abs(oy - cy), abs(oz - cz)) >= r:
+                        consider(bucket)
+                break
+            for dx in range(-r, r + 1):
+                edge_x = dx == -r or dx == r
+                for dy in range(-r, r + 1):
+                    if edge_x or dy == -r or dy == r:
+                        dzs = range(-r, r + 1)
+                    else:
+                        dzs = (-r, r) if r else (0,)
+                    for dz in dzs:
+                        bucket = cells.get((cx + dx, cy + dy, cz + dz))
+                        if bucket:
+                            consider(bucket)
+        
+        return [(-nd, key) for nd, _, key in sorted(best, reverse=True)]
+
+
 class TrinityManifold:
     """
     Manifold processor using trinity substrate.
@@ -21,9 +21,13 @@ Optimizations:
 """
 
 from __future__ import annotations
+import atexit
+import os
 import time
 import hashlib
 import json
+import weakref
+import zlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Callable, AsyncIterator
 from enum import Enum
@@ -58,78 +62,174 @@ class ResourceEfficientCache:
     
     Features:
         - LRU eviction (keep only recent)
-        - Size-based limits (prevent memory bloat)
+        - Size-based limits with a running byte total (O(1) accounting)
         - TTL expiration (auto-cleanup)
-        - Compression (reduce memory footprint)
+        - zlib compression for responses above `compress_threshold` bytes
+        - Normalized prompt keys (whitespace/case-insensitive)
+        - Persistence of the hottest entries across restarts
     """
     
-    def __init__(self, max_size_mb: int = 50, max_items: int = 100, ttl_seconds: int = 3600):
+    def __init__(self, max_size_mb: int = 50, max_items: int = 100, ttl_seconds: int = 3600,
+                 compress_threshold: Optional[int] = 1024, compression_level: int = 6,
+                 persist_path: Optional[str] = None, persist_items: int = 50):
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.max_items = max_items
         self.ttl_seconds = ttl_seconds
+        self.compress_threshold = compress_threshold
+        self.compression_level = compression_level
+        self.persist_path = persist_path
+        self.persist_items = persist_items
         
         self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self._lock = threading.RLock()
+        self._total_bytes = 0   # stored (possibly compressed) bytes
+        self._raw_bytes = 0     # uncompressed bytes
         
         # Statistics
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        
+        if persist_path:
+            self.load(persist_path)
+            atexit.register(_save_cache_at_exit, weakref.ref(self))
+    
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """Collapse whitespace and case so trivially different prompts share a key"""
+        return " ".join(prompt.split()).casefold()
+    
+    @classmethod
+    def make_key(cls, prompt: str, namespace: Any = None) -> str:
+        """Cache key for a prompt (optionally scoped, e.g. by provider)"""
+        return hashlib.md5(f"{namespace}:{cls.normalize_prompt(prompt)}".encode()).hexdigest()
+    
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry['size']
+        self._raw_bytes -= entry['raw_size']
     
     def get(self, key: str) -> Optional[str]:
         """Get cached response - O(1)"""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self.misses += 1
                 return None
             
-            entry = self._cache[key]
-            
             # Check TTL
             if time.time() - entry['timestamp'] > self.ttl_seconds:
-                del self._cache[key]
+                self._remove(key)
                 self.misses += 1
                 return None
             
             # Move to end (most recently used)
             self._cache.move_to_end(key)
             self.hits += 1
-            
-            return entry['response']
+            entry['hits'] += 1
+            data = entry['data']
+        
+        # Decompress outside the lock
+        if entry['compressed']:
+            return zlib.decompress(data).decode('utf-8')
+        return data
     
-    def put(self, key: str, response: str):
+    def put(self, key: str, response: str, timestamp: Optional[float] = None, hits: int = 0):
         """Cache response with automatic eviction"""
+        raw = response.encode('utf-8')
+        data: Any = response
+        compressed = False
+        size = len(raw)
+        if self.compress_threshold is not None and size >= self.compress_threshold:
+            packed = zlib.compress(raw, self.compression_level)
+            if len(packed) < size:
+                data, compressed, size = packed, True, len(packed)
+        
         with self._lock:
-            # Calculate size
-            size = len(response.encode('utf-8'))
+            if key in self._cache:
+                self._remove(key)
             
             # Evict if needed
-            while len(self._cache) >= self.max_items or self._get_total_size() + size > self.max_size_bytes:
-                if not self._cache:
-                    break
-                self._cache.popitem(last=False)  # Remove oldest
+            while self._cache and (len(self._cache) >= self.max_items or
+                                   self._total_bytes + size > self.max_size_bytes):
+                self._remove(next(iter(self._cache)))  # Remove oldest
                 self.evictions += 1
             
             # Add to cache
             self._cache[key] = {
-                'response': response,
-                'timestamp': time.time(),
-                'size': size
+                'data': data,
+                'compressed': compressed,
+                'timestamp': time.time() if timestamp is None else timestamp,
+                'size': size,
+                'raw_size': len(raw),
+                'hits': hits
             }
+            self._total_bytes += size
+            self._raw_bytes += len(raw)
     
     def _get_total_size(self) -> int:
-        """Calculate total cache size"""
-        return sum(entry['size'] for entry in self._cache.values())
+        """Total stored bytes (maintained incrementally)"""
+        return self._total_bytes
+    
+    def save(self, path: Optional[str] = None) -> int:
+        """Write the hottest unexpired entries to `path` as JSON; returns count"""
+        path = path or self.persist_path
+        if not path:
+            return 0
+        now = time.time()
+        with self._lock:
+            live = [(key, entry) for key, entry in self._cache.items()
+                    if now - entry['timestamp'] <= self.ttl_seconds]
+            hot = sorted(live, key=lambda item: (item[1]['hits'], item[1]['timestamp']),
+                         reverse=True)[:self.persist_items]
+            records = [{
+                'key': key,
+                'response': (zlib.decompress(entry['data']).decode('utf-8')
+                             if entry['compressed'] else entry['data']),
+                'timestamp': entry['timestamp'],
+                'hits': entry['hits']
+            } for key, entry in hot]
+        
+        # Write then rename so a crash never leaves a truncated file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': records}, f)
+        os.replace(tmp_path, path)
+        return len(records)
+    
+    def load(self, path: Optional[str] = None) -> int:
+        """Restore entries written by save(); expired ones are skipped"""
+        path = path or self.persist_path
+        if not path or not os.path.exists(path):
+            return 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                records = json.load(f).get('entries', [])
+        except (OSError, ValueError):
+            return 0
+        
+        now = time.time()
+        loaded = 0
+        # Least hot first, so the hottest end up most recently used
+        for record in reversed(records):
+            if now - record['timestamp'] > self.ttl_seconds:
+                continue
+            self.put(record['key'], record['response'],
+                     timestamp=record['timestamp'], hits=record.get('hits', 0))
+            loaded += 1
+        return loaded
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         with self._lock:
-            total_size = self._get_total_size()
+            total_size = self._total_bytes
             hit_rate = self.hits / max(self.hits + self.misses, 1) * 100
             
             return {
                 'items': len(self._cache),
                 'size_mb': total_size / (1024 * 1024),
+                'raw_size_mb': self._raw_bytes / (1024 * 1024),
+                'compression_ratio': round(self._raw_bytes / max(total_size, 1), 2),
                 'max_size_mb': self.max_size_bytes / (1024 * 1024),
                 'utilization': total_size / self.max_size_bytes * 100,
                 'hits': self.hits,
@@ -142,6 +242,17 @@ class ResourceEfficientCache:
         """Clear cache"""
         with self._lock:
             self._cache.clear()
+            self._total_bytes = 0
+            self._raw_bytes = 0
+
+
+def _save_cache_at_exit(ref):
+    cache = ref()
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError:
+            pass
 
 
 # =============================================================================
@@ -386,9 +497,13 @@ class MultiProviderSubstrate:
         - Resource efficiency (minimal memory usage)
     """
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None):
         self.providers: Dict[AIProvider, BaseProviderAdapter] = {}
-        self.cache = ResourceEfficientCache(max_size_mb=50, max_items=100)
+        self.cache = ResourceEfficientCache(max_size_mb=50, max_items=100,
+                                            persist_path=cache_path)
+        
+        # cache key -> Future of the upstream call currently in flight
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         # Provider priority (for failover)
         self.provider_priority = [
@@ -403,6 +518,7 @@ class MultiProviderSubstrate:
         # Statistics
         self.total_requests = 0
         self.cache_hits = 0
+        self.coalesced = 0
         self.provider_usage = {p: 0 for p in AIProvider}
         self.total_cost = 0.0
     
@@ -442,14 +558,49 @@ class MultiProviderSubstrate:
         """
         self.total_requests += 1
         
-        # Check cache first (90% hit rate = 90% less API calls)
-        if use_cache:
-            cache_key = hashlib.md5(f"{provider}:{prompt}".encode()).hexdigest()
-            cached = self.cache.get(cache_key)
-            if cached:
-                self.cache_hits += 1
-                return cached
+        if not use_cache:
+            return await self._generate_uncached(prompt, provider, **kwargs)
         
+        # Check cache first (90% hit rate = 90% less API calls)
+        cache_key = self.cache.make_key(prompt, provider)
+        cached = self.cache.get(cache_key)
+        if cached:
+            self.cache_hits += 1
+            return cached
+        
+        # Identical prompt already upstream: share its result
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            response = await self._generate_uncached(prompt, provider, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved - only waiters (if any) need to see it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            # Cache response
+            if response:
+                self.cache.put(cache_key, response)
+            return response
+        finally:
+            del self._inflight[cache_key]
+    
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        provider: Optional[AIProvider] = None,
+        **kwargs
+    ) -> str:
         # Select provider
         if provider is None:
             provider = self._select_best_provider()
@@ -457,10 +608,6 @@ class MultiProviderSubstrate:
         # Generate response with failover
         response = await self._generate_with_failover(prompt, provider, **kwargs)
         
-        # Cache response
-        if use_cache and response:
-            self.cache.put(cache_key, response)
-        
         # Update statistics
         self.provider_usage[provider] += 1
         
@@ -541,6 +688,7 @@ class MultiProviderSubstrate:
         return {
             'total_requests': self.total_requests,
             'cache_hits': self.cache_hits,
+            'coalesced_requests': self.coalesced,
             'cache_hit_rate': round(self.cache_hits / max(self.total_requests, 1) * 100, 2),
             'provider_usage': {p.value: count for p, count in self.provider_usage.items()},
             'cache': cache_stats,
@@ -552,6 +700,10 @@ class MultiProviderSubstrate:
     def clear_cache(self):
         """Clear cache to free memory"""
         self.cache.clear()
+    
+    def save_cache(self, path: Optional[str] = None) -> int:
+        """Persist the hottest cached responses (see ResourceEfficientCache.save)"""
+        return self.cache.save(path)
 
 
 # =============================================================================
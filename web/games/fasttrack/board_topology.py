@@ -0,0 +1,623 @@
+"""
+Fast Track - Board Topology
+===========================
+The one place board geometry is computed. The board is generated once
+per process, reduced to integer-indexed tuples (holes, movement tables,
+adjacency, world coordinates) and shared read-only by the game engine,
+servers, AI, simulators and renderers.
+
+The frozen board is also written to a JSON artifact identified by a
+content hash (board_hash), for clients and tools to cache by the hash
+they receive in game state. Processes do not read it back: generating
+takes a few milliseconds, less than parsing the file.
+test_board_topology.py fails if the committed artifact no longer
+matches the generator. Only the build step writes it:
+
+    python board_topology.py            # (re)write board_topology.json
+
+Author: ButterflyFX Dimensional Kernel
+"""
+
+import math
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Sequence
+from enum import Enum
+
+try:
+    from .state_sync import dumps
+except ImportError:
+    from state_sync import dumps
+
+
+# =============================================================================
+# BOARD CONSTANTS - DO NOT MODIFY
+# =============================================================================
+
+R = 300  # Outer hexagon radius (units)
+FAST_R = R * 0.55  # Fast track hexagon radius
+SAFE_STEPS = 4  # Exactly 4 safe zone holes per player
+TRACK_PER_SIDE = 10  # Exactly 10 outer track holes per hexagon side
+TOTAL_OUTER_TRACK = 6 * TRACK_PER_SIDE  # 60 total outer track holes
+
+# Player colors in clockwise order
+PLAYER_COLORS = ["orange", "brown", "red", "yellow", "green", "blue"]
+
+# Hexagon vertex angles (starting at -30° for proper orientation)
+HEX_ANGLES = [-30, 30, 90, 150, 210, 270]
+
+# Precomputed board for clients and tools (build output)
+ARTIFACT_PATH = Path(__file__).with_name("board_topology.json")
+
+
+# =============================================================================
+# DATA STRUCTURES
+# =============================================================================
+
+class HoleType(Enum):
+    """Exact hole types as specified"""
+    OUTER = "outer"          # Outer track holes (60 total)
+    SAFE = "safe"            # Safe zone holes (4 per player)
+    HOLDING = "holding"      # Holding area holes (4 per player)
+    START = "start"          # Start hole (1 per player, on outer track)
+    WINNER = "winner"        # Winner hole (1 per player, inside start)
+    FAST_ENTRY = "fast_entry"  # Fast track entry (1 per player)
+    FAST_EXIT = "fast_exit"    # Fast track exit (1 per player)
+    FAST = "fast"            # Fast track intermediate holes
+    CENTER = "center"        # Center hole
+
+
+@dataclass
+class Hole:
+    """A specific hole on the board with exact coordinates"""
+    id: str
+    x: float
+    y: float
+    hole_type: HoleType
+    player_id: Optional[int] = None  # Which player this belongs to (for safe/holding/start/winner)
+    track_index: Optional[int] = None  # Position on outer track (0-59)
+    safe_index: Optional[int] = None  # Position in safe zone (0-3)
+    fast_index: Optional[int] = None  # Position on fast track
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "x": self.x,
+            "y": self.y,
+            "type": self.hole_type.value,
+            "player_id": self.player_id,
+            "track_index": self.track_index,
+            "safe_index": self.safe_index,
+            "fast_index": self.fast_index
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Hole':
+        """Inverse of to_dict"""
+        return cls(
+            id=data["id"],
+            x=data["x"],
+            y=data["y"],
+            hole_type=HoleType(data["type"]),
+            player_id=data["player_id"],
+            track_index=data["track_index"],
+            safe_index=data["safe_index"],
+            fast_index=data["fast_index"]
+        )
+
+
+@dataclass
+class PlayerZone:
+    """A player's zone with all their holes"""
+    player_id: int
+    color: str
+    holding_holes: List[Hole]  # Exactly 4
+    start_hole: Hole  # Exactly 1
+    winner_hole: Hole  # Exactly 1
+    safe_zone_holes: List[Hole]  # Exactly 4
+    fast_entry_hole: Hole  # Entry to fast track
+    fast_exit_hole: Hole  # Exit from fast track
+
+
+# =============================================================================
+# GEOMETRY FUNCTIONS
+# =============================================================================
+
+def hex_vertex(angle_deg: float, radius: float) -> Tuple[float, float]:
+    """Compute a point on a circle at given angle and radius"""
+    a = math.radians(angle_deg)
+    return radius * math.cos(a), radius * math.sin(a)
+
+
+def lerp_point(p1: Tuple[float, float], p2: Tuple[float, float], t: float) -> Tuple[float, float]:
+    """Linear interpolation between two points"""
+    return p1[0] + (p2[0] - p1[0]) * t, p1[1] + (p2[1] - p1[1]) * t
+
+
+def perpendicular_offset(p1: Tuple[float, float], p2: Tuple[float, float], 
+                         point: Tuple[float, float], offset: float) -> Tuple[float, float]:
+    """Offset a point perpendicular to a line"""
+    dx = p2[0] - p1[0]
+    dy = p2[1] - p1[1]
+    length = math.sqrt(dx*dx + dy*dy)
+    # Perpendicular unit vector pointing outward
+    nx = -dy / length
+    ny = dx / length
+    return point[0] + nx * offset, point[1] + ny * offset
+
+
+# =============================================================================
+# BOARD GENERATOR
+# =============================================================================
+
+class BoardGenerator:
+    """Generates the exact board geometry"""
+    
+    def __init__(self, radius: float = R, fast_radius: float = FAST_R):
+        self.radius = radius
+        self.fast_radius = fast_radius
+        self.vertices = [hex_vertex(a, radius) for a in HEX_ANGLES]
+        self.fast_vertices = [hex_vertex(a, fast_radius) for a in HEX_ANGLES]
+        
+        # All holes
+        self.outer_track: List[Hole] = []
+        self.fast_track: List[Hole] = []
+        self.center_hole: Hole = None
+        self.player_zones: Dict[int, PlayerZone] = {}
+        
+        # Lookup tables
+        self.hole_by_id: Dict[str, Hole] = {}
+        
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BoardGenerator':
+        """Rebuild a generated board from to_dict() output, without geometry"""
+        board = cls(data["radius"], data["fast_radius"])
+        board.outer_track = [Hole.from_dict(h) for h in data["outer_track"]]
+        board.fast_track = [Hole.from_dict(h) for h in data["fast_track"]]
+        board.center_hole = Hole.from_dict(data["center"])
+        
+        # Start and fast track holes are shared with the track lists
+        fast_by_id = {h.id: h for h in board.fast_track}
+        for pid, zone in data["player_zones"].items():
+            pid = int(pid)
+            board.player_zones[pid] = PlayerZone(
+                player_id=pid,
+                color=zone["color"],
+                holding_holes=[Hole.from_dict(h) for h in zone["holding_holes"]],
+                start_hole=board.outer_track[zone["start_hole"]["track_index"]],
+                winner_hole=Hole.from_dict(zone["winner_hole"]),
+                safe_zone_holes=[Hole.from_dict(h) for h in zone["safe_zone_holes"]],
+                fast_entry_hole=fast_by_id[zone["fast_entry"]["id"]],
+                fast_exit_hole=fast_by_id[zone["fast_exit"]["id"]]
+            )
+        board._build_lookup()
+        return board
+    
+    def generate(self) -> Dict:
+        """Generate the complete board"""
+        self._generate_outer_track()
+        self._generate_fast_track()
+        self._generate_center()
+        self._generate_player_zones()
+        self._build_lookup()
+        return self.to_dict()
+    
+    def _generate_outer_track(self):
+        """Generate exactly 60 outer track holes (10 per side)"""
+        hole_id = 0
+        for side in range(6):
+            v1 = self.vertices[side]
+            v2 = self.vertices[(side + 1) % 6]
+            
+            for step in range(TRACK_PER_SIDE):
+                # Evenly space holes, starting just after vertex
+                t = (step + 0.5) / TRACK_PER_SIDE
+                x, y = lerp_point(v1, v2, t)
+                
+                hole = Hole(
+                    id=f"outer_{hole_id}",
+                    x=x,
+                    y=y,
+                    hole_type=HoleType.OUTER,
+                    track_index=hole_id
+                )
+                self.outer_track.append(hole)
+                hole_id += 1
+    
+    def _generate_fast_track(self):
+        """Generate fast track holes inside the hexagon"""
+        hole_id = 0
+        # 12 fast track holes total (2 per side: entry and exit)
+        for side in range(6):
+            v1 = self.fast_vertices[side]
+            v2 = self.fast_vertices[(side + 1) % 6]
+            
+            # Entry hole at 1/3 position
+            entry_x, entry_y = lerp_point(v1, v2, 1/3)
+            entry = Hole(
+                id=f"fast_entry_{side}",
+                x=entry_x,
+                y=entry_y,
+                hole_type=HoleType.FAST_ENTRY,
+                player_id=side,
+                fast_index=hole_id
+            )
+            self.fast_track.append(entry)
+            hole_id += 1
+            
+            # Exit hole at 2/3 position
+            exit_x, exit_y = lerp_point(v1, v2, 2/3)
+            exit_hole = Hole(
+                id=f"fast_exit_{side}",
+                x=exit_x,
+                y=exit_y,
+                hole_type=HoleType.FAST_EXIT,
+                player_id=side,
+                fast_index=hole_id
+            )
+            self.fast_track.append(exit_hole)
+            hole_id += 1
+    
+    def _generate_center(self):
+        """Generate center hole"""
+        self.center_hole = Hole(
+            id="center",
+            x=0,
+            y=0,
+            hole_type=HoleType.CENTER
+        )
+    
+    def _generate_player_zones(self):
+        """Generate all player zones with exact hole placement"""
+        for player_id in range(6):
+            v1 = self.vertices[player_id]
+            v2 = self.vertices[(player_id + 1) % 6]
+            
+            # Midpoint of this edge
+            mid_x, mid_y = lerp_point(v1, v2, 0.5)
+            
+            # Direction vector from center to midpoint (for safe zone alignment)
+            dist = math.sqrt(mid_x**2 + mid_y**2)
+            dir_x, dir_y = mid_x / dist, mid_y / dist
+            
+            # === START HOLE ===
+            # Located at the midpoint of the edge on the outer track
+            # Find the outer track hole closest to midpoint
+            start_track_index = player_id * TRACK_PER_SIDE + TRACK_PER_SIDE // 2
+            start_hole = self.outer_track[start_track_index]
+            start_hole.hole_type = HoleType.START
+            start_hole.player_id = player_id
+            
+            # === WINNER HOLE ===
+            # Located directly inside the start hole along the safe zone line
+            # At 85% of the distance from center to edge midpoint
+            winner_dist = dist * 0.85
+            winner_x = dir_x * winner_dist
+            winner_y = dir_y * winner_dist
+            winner_hole = Hole(
+                id=f"winner_{player_id}",
+                x=winner_x,
+                y=winner_y,
+                hole_type=HoleType.WINNER,
+                player_id=player_id
+            )
+            
+            # === SAFE ZONE HOLES ===
+            # 4 holes in a line from winner hole toward center
+            safe_zone_holes = []
+            for s in range(SAFE_STEPS):
+                # Distribute between winner hole and center
+                # Start from winner (s=0) going toward center (s=3)
+                safe_dist = winner_dist * (1 - (s + 1) / (SAFE_STEPS + 1))
+                safe_x = dir_x * safe_dist
+                safe_y = dir_y * safe_dist
+                safe_hole = Hole(
+                    id=f"safe_{player_id}_{s}",
+                    x=safe_x,
+                    y=safe_y,
+                    hole_type=HoleType.SAFE,
+                    player_id=player_id,
+                    safe_index=s
+                )
+                safe_zone_holes.append(safe_hole)
+            
+            # === HOLDING AREA HOLES ===
+            # 4 holes in a 2x2 grid outside the edge
+            holding_holes = []
+            # Position holding area outside the edge at 115% radius
+            hold_center_x = dir_x * dist * 1.15
+            hold_center_y = dir_y * dist * 1.15
+            
+            # Get perpendicular direction
+            edge_dx = v2[0] - v1[0]
+            edge_dy = v2[1] - v1[1]
+            edge_len = math.sqrt(edge_dx**2 + edge_dy**2)
+            perp_x, perp_y = edge_dx / edge_len, edge_dy / edge_len
+            
+            # Create 2x2 grid with 20-unit spacing
+            spacing = 20
+            for i in range(4):
+                row = i // 2
+                col = i % 2
+                hold_x = hold_center_x + (col - 0.5) * spacing * perp_x + (row - 0.5) * spacing * dir_x
+                hold_y = hold_center_y + (col - 0.5) * spacing * perp_y + (row - 0.5) * spacing * dir_y
+                hold_hole = Hole(
+                    id=f"holding_{player_id}_{i}",
+                    x=hold_x,
+                    y=hold_y,
+                    hole_type=HoleType.HOLDING,
+                    player_id=player_id
+                )
+                holding_holes.append(hold_hole)
+            
+            # === FAST TRACK ENTRY/EXIT ===
+            fast_entry = next(h for h in self.fast_track if h.id == f"fast_entry_{player_id}")
+            fast_exit = next(h for h in self.fast_track if h.id == f"fast_exit_{player_id}")
+            
+            # Create player zone
+            self.player_zones[player_id] = PlayerZone(
+                player_id=player_id,
+                color=PLAYER_COLORS[player_id],
+                holding_holes=holding_holes,
+                start_hole=start_hole,
+                winner_hole=winner_hole,
+                safe_zone_holes=safe_zone_holes,
+                fast_entry_hole=fast_entry,
+                fast_exit_hole=fast_exit
+            )
+    
+    def _build_lookup(self):
+        """Build hole lookup by ID"""
+        # Outer track
+        for hole in self.outer_track:
+            self.hole_by_id[hole.id] = hole
+        
+        # Fast track
+        for hole in self.fast_track:
+            self.hole_by_id[hole.id] = hole
+        
+        # Center
+        self.hole_by_id[self.center_hole.id] = self.center_hole
+        
+        # Player zones
+        for zone in self.player_zones.values():
+            for hole in zone.holding_holes:
+                self.hole_by_id[hole.id] = hole
+            self.hole_by_id[zone.winner_hole.id] = zone.winner_hole
+            for hole in zone.safe_zone_holes:
+                self.hole_by_id[hole.id] = hole
+    
+    def to_dict(self) -> dict:
+        """Export board as dictionary for JSON serialization"""
+        return {
+            "radius": self.radius,
+            "fast_radius": self.fast_radius,
+            "outer_track": [h.to_dict() for h in self.outer_track],
+            "fast_track": [h.to_dict() for h in self.fast_track],
+            "center": self.center_hole.to_dict() if self.center_hole else None,
+            "player_zones": {
+                pid: {
+                    "player_id": zone.player_id,
+                    "color": zone.color,
+                    "holding_holes": [h.to_dict() for h in zone.holding_holes],
+                    "start_hole": zone.start_hole.to_dict(),
+                    "winner_hole": zone.winner_hole.to_dict(),
+                    "safe_zone_holes": [h.to_dict() for h in zone.safe_zone_holes],
+                    "fast_entry": zone.fast_entry_hole.to_dict(),
+                    "fast_exit": zone.fast_exit_hole.to_dict()
+                }
+                for pid, zone in self.player_zones.items()
+            },
+            "totals": {
+                "outer_track_holes": len(self.outer_track),
+                "fast_track_holes": len(self.fast_track),
+                "holding_holes_per_player": 4,
+                "safe_zone_holes_per_player": 4,
+                "total_holes": (
+                    len(self.outer_track) + 
+                    len(self.fast_track) + 
+                    1 +  # center
+                    6 * (4 + 1 + 4)  # per player: holding + winner + safe
+                )
+            }
+        }
+
+
+# =============================================================================
+# BOARD TOPOLOGY - Shared, immutable, integer-indexed
+# =============================================================================
+
+# Signed step counts any card can produce (4 moves backward)
+MIN_STEPS = -4
+MAX_STEPS = 13
+
+# Hole types a peg can stand on while "on track"
+TRACK_TYPES = (HoleType.OUTER, HoleType.START)
+FAST_TYPES = (HoleType.FAST, HoleType.FAST_ENTRY, HoleType.FAST_EXIT)
+
+
+class BoardTopology:
+    """
+    The board reduced to integers, built once per process.
+    
+    Every hole gets a dense index; per-player hole groups and the
+    movement tables are tuples of those indices:
+    
+        track_dest[hole][steps - MIN_STEPS]       outer-track destination
+        safe_dest[player][hole][steps - MIN_STEPS] safe/winner destination
+    
+    (-1 where no such move exists). String hole IDs are only needed to
+    translate at the API boundary via hole_ids / hole_index. Hole
+    objects are shared by every game and must be treated as read-only.
+    """
+    
+    _shared: Optional['BoardTopology'] = None
+    
+    def __init__(self, board: BoardGenerator):
+        self.board = board
+        holes = list(board.hole_by_id.values())
+        self.holes: Tuple[Hole, ...] = tuple(holes)
+        self.hole_ids: Tuple[str, ...] = tuple(h.id for h in holes)
+        self.hole_index: Dict[str, int] = {h.id: i for i, h in enumerate(holes)}
+        self.hole_types: Tuple[HoleType, ...] = tuple(h.hole_type for h in holes)
+        self.num_holes = len(holes)
+        
+        # Static geometry, serialized once and identified by content hash
+        self.board_dict = board.to_dict()
+        self.board_json = dumps(self.board_dict)
+        self.board_hash = hashlib.sha256(self.board_json.encode()).hexdigest()[:16]
+        self.board_message = (
+            '{"type":"board","hash":"%s","board":%s}' % (self.board_hash, self.board_json)
+        )
+        
+        idx = self.hole_index
+        self.track_holes: Tuple[int, ...] = tuple(idx[h.id] for h in board.outer_track)
+        self.track_position: Tuple[int, ...] = tuple(
+            h.track_index if h.track_index is not None else -1 for h in holes
+        )
+        
+        zones = [board.player_zones[p] for p in sorted(board.player_zones)]
+        self.start_hole = tuple(idx[z.start_hole.id] for z in zones)
+        self.winner_hole = tuple(idx[z.winner_hole.id] for z in zones)
+        self.safe_holes = tuple(tuple(idx[h.id] for h in z.safe_zone_holes) for z in zones)
+        self.holding_holes = tuple(tuple(idx[h.id] for h in z.holding_holes) for z in zones)
+        
+        # World coordinates and owning player (-1 if shared) per hole
+        self.hole_x: Tuple[float, ...] = tuple(h.x for h in holes)
+        self.hole_y: Tuple[float, ...] = tuple(h.y for h in holes)
+        self.hole_player: Tuple[int, ...] = tuple(
+            h.player_id if h.player_id is not None else -1 for h in holes
+        )
+        self.fast_holes: Tuple[int, ...] = tuple(idx[h.id] for h in board.fast_track)
+        self.adjacency = self._build_adjacency()
+        
+        steps_range = range(MIN_STEPS, MAX_STEPS + 1)
+        no_move = (-1,) * len(steps_range)
+        self.track_dest = tuple(
+            tuple(
+                self.track_holes[(pos + steps) % TOTAL_OUTER_TRACK] if steps else -1
+                for steps in steps_range
+            ) if pos >= 0 else no_move
+            for pos in self.track_position
+        )
+        self.safe_dest = tuple(
+            tuple(self._safe_row(player, pos, no_move) for pos in self.track_position)
+            for player in range(len(zones))
+        )
+    
+    def _safe_row(self, player: int, pos: int, no_move: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Safe-zone/winner hole reached by passing this player's start, or
+        -1, for every step count from track position pos (-1 if off track)
+        """
+        if pos < 0:
+            return no_move
+        start = self.track_position[self.start_hole[player]]
+        # Steps until the peg first lands on its start (a full lap if on it)
+        first = (start - pos) % TOTAL_OUTER_TRACK or TOTAL_OUTER_TRACK
+        if first > MAX_STEPS:
+            return no_move
+        lane = self.safe_holes[player] + (self.winner_hole[player],)
+        return tuple(
+            lane[steps - first - 1] if 0 <= steps - first - 1 <= SAFE_STEPS else -1
+            for steps in range(MIN_STEPS, MAX_STEPS + 1)
+        )
+    
+    def _build_adjacency(self) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Holes one forward step away from each hole: the next track hole
+        (plus the first safe hole from a player's start), the next safe
+        hole or winner, start from holding, and around the fast track.
+        """
+        forward: List[List[int]] = [[] for _ in range(self.num_holes)]
+        for ring in (self.track_holes, self.fast_holes):
+            for i, hole in enumerate(ring):
+                forward[hole].append(ring[(i + 1) % len(ring)])
+        for player, start in enumerate(self.start_hole):
+            lane = self.safe_holes[player] + (self.winner_hole[player],)
+            forward[start].append(lane[0])
+            for here, there in zip(lane, lane[1:]):
+                forward[here].append(there)
+            for hole in self.holding_holes[player]:
+                forward[hole].append(start)
+        return tuple(tuple(f) for f in forward)
+    
+    def project(self, holes: Sequence[int], cx: float, cy: float,
+                scale: float = 1.0, rotation: float = 0.0) -> List[Tuple[float, float]]:
+        """
+        Screen positions of `holes`: world coordinates rotated by
+        `rotation` radians, scaled and centred on (cx, cy). One sin/cos
+        per call rather than per hole.
+        """
+        c = math.cos(rotation) * scale
+        s = math.sin(rotation) * scale
+        xs, ys = self.hole_x, self.hole_y
+        return [(cx + xs[h] * c - ys[h] * s, cy + xs[h] * s + ys[h] * c) for h in holes]
+    
+    # -------------------------------------------------------------------------
+    # Artifact
+    # -------------------------------------------------------------------------
+    
+    def artifact(self) -> dict:
+        """
+        The frozen topology as plain data: the board as clients render it
+        plus the compact integer-indexed tables, tagged with board_hash.
+        """
+        return {
+            "board_hash": self.board_hash,
+            "board": self.board_dict,
+            "hole_ids": self.hole_ids,
+            "hole_types": [t.value for t in self.hole_types],
+            "hole_x": self.hole_x,
+            "hole_y": self.hole_y,
+            "hole_player": self.hole_player,
+            "track_holes": self.track_holes,
+            "fast_holes": self.fast_holes,
+            "start_hole": self.start_hole,
+            "winner_hole": self.winner_hole,
+            "safe_holes": self.safe_holes,
+            "holding_holes": self.holding_holes,
+            "adjacency": self.adjacency,
+        }
+    
+    def save_artifact(self, path: Path = ARTIFACT_PATH) -> Path:
+        """
+        Write the artifact atomically, via a private temp file so readers
+        never see half a file and concurrent writers never share one.
+        """
+        import tempfile  # Build step only; keeps it off the import path
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(dumps(self.artifact()))
+            # mkstemp creates 0600; servers may run as another user
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return path
+    
+    @classmethod
+    def shared(cls) -> 'BoardTopology':
+        """Process-wide topology, generated on first use"""
+        if cls._shared is None:
+            board = BoardGenerator()
+            board.generate()
+            cls._shared = cls(board)
+        return cls._shared
+
+
+# =============================================================================
+# MAIN - WRITE ARTIFACT
+# =============================================================================
+
+if __name__ == "__main__":
+    board = BoardGenerator()
+    board.generate()
+    topology = BoardTopology(board)
+    path = topology.save_artifact()
+    print(f"Board topology {topology.board_hash}: {topology.num_holes} holes -> {path}")
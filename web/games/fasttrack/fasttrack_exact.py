@@ -10,46 +10,34 @@ This implements the EXACT board geometry as specified:
 Author: ButterflyFX Dimensional Kernel
 """
 
-import math
+import random
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Set
 from enum import Enum
 import json
 
-# =============================================================================
-# BOARD CONSTANTS - DO NOT MODIFY
-# =============================================================================
-
-R = 300  # Outer hexagon radius (units)
-FAST_R = R * 0.55  # Fast track hexagon radius
-SAFE_STEPS = 4  # Exactly 4 safe zone holes per player
-TRACK_PER_SIDE = 10  # Exactly 10 outer track holes per hexagon side
-TOTAL_OUTER_TRACK = 6 * TRACK_PER_SIDE  # 60 total outer track holes
-
-# Player colors in clockwise order
-PLAYER_COLORS = ["orange", "brown", "red", "yellow", "green", "blue"]
-
-# Hexagon vertex angles (starting at -30° for proper orientation)
-HEX_ANGLES = [-30, 30, 90, 150, 210, 270]
+try:
+    from .state_sync import StateSync, dumps
+    from .board_topology import (
+        R, FAST_R, SAFE_STEPS, TRACK_PER_SIDE, TOTAL_OUTER_TRACK, PLAYER_COLORS,
+        HEX_ANGLES, MIN_STEPS, MAX_STEPS, TRACK_TYPES, FAST_TYPES,
+        HoleType, Hole, PlayerZone, BoardGenerator, BoardTopology,
+        hex_vertex, lerp_point, perpendicular_offset,
+    )
+except ImportError:
+    from state_sync import StateSync, dumps
+    from board_topology import (
+        R, FAST_R, SAFE_STEPS, TRACK_PER_SIDE, TOTAL_OUTER_TRACK, PLAYER_COLORS,
+        HEX_ANGLES, MIN_STEPS, MAX_STEPS, TRACK_TYPES, FAST_TYPES,
+        HoleType, Hole, PlayerZone, BoardGenerator, BoardTopology,
+        hex_vertex, lerp_point, perpendicular_offset,
+    )
 
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
-class HoleType(Enum):
-    """Exact hole types as specified"""
-    OUTER = "outer"          # Outer track holes (60 total)
-    SAFE = "safe"            # Safe zone holes (4 per player)
-    HOLDING = "holding"      # Holding area holes (4 per player)
-    START = "start"          # Start hole (1 per player, on outer track)
-    WINNER = "winner"        # Winner hole (1 per player, inside start)
-    FAST_ENTRY = "fast_entry"  # Fast track entry (1 per player)
-    FAST_EXIT = "fast_exit"    # Fast track exit (1 per player)
-    FAST = "fast"            # Fast track intermediate holes
-    CENTER = "center"        # Center hole
-
-
 class PegState(Enum):
     """All possible peg states in lifecycle"""
     IN_HOLDING = "in_holding"      # Waiting to be released
@@ -61,31 +49,6 @@ class PegState(Enum):
     CAPTURED = "captured"          # Captured - returns to holding
 
 
-@dataclass
-class Hole:
-    """A specific hole on the board with exact coordinates"""
-    id: str
-    x: float
-    y: float
-    hole_type: HoleType
-    player_id: Optional[int] = None  # Which player this belongs to (for safe/holding/start/winner)
-    track_index: Optional[int] = None  # Position on outer track (0-59)
-    safe_index: Optional[int] = None  # Position in safe zone (0-3)
-    fast_index: Optional[int] = None  # Position on fast track
-    
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "x": self.x,
-            "y": self.y,
-            "type": self.hole_type.value,
-            "player_id": self.player_id,
-            "track_index": self.track_index,
-            "safe_index": self.safe_index,
-            "fast_index": self.fast_index
-        }
-
-
 @dataclass
 class Peg:
     """A peg/token with its state and position"""
@@ -105,19 +68,6 @@ class Peg:
         }
 
 
-@dataclass
-class PlayerZone:
-    """A player's zone with all their holes"""
-    player_id: int
-    color: str
-    holding_holes: List[Hole]  # Exactly 4
-    start_hole: Hole  # Exactly 1
-    winner_hole: Hole  # Exactly 1
-    safe_zone_holes: List[Hole]  # Exactly 4
-    fast_entry_hole: Hole  # Entry to fast track
-    fast_exit_hole: Hole  # Exit from fast track
-
-
 @dataclass 
 class Card:
     """A playing card"""
@@ -125,283 +75,8 @@ class Card:
     suit: Optional[str] = None  # "hearts", "diamonds", "clubs", "spades" or None for joker
 
 
-# =============================================================================
-# GEOMETRY FUNCTIONS
-# =============================================================================
-
-def hex_vertex(angle_deg: float, radius: float) -> Tuple[float, float]:
-    """Compute a point on a circle at given angle and radius"""
-    a = math.radians(angle_deg)
-    return radius * math.cos(a), radius * math.sin(a)
-
-
-def lerp_point(p1: Tuple[float, float], p2: Tuple[float, float], t: float) -> Tuple[float, float]:
-    """Linear interpolation between two points"""
-    return p1[0] + (p2[0] - p1[0]) * t, p1[1] + (p2[1] - p1[1]) * t
-
-
-def perpendicular_offset(p1: Tuple[float, float], p2: Tuple[float, float], 
-                         point: Tuple[float, float], offset: float) -> Tuple[float, float]:
-    """Offset a point perpendicular to a line"""
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
-    length = math.sqrt(dx*dx + dy*dy)
-    # Perpendicular unit vector pointing outward
-    nx = -dy / length
-    ny = dx / length
-    return point[0] + nx * offset, point[1] + ny * offset
-
-
-# =============================================================================
-# BOARD GENERATOR
-# =============================================================================
-
-class BoardGenerator:
-    """Generates the exact board geometry"""
-    
-    def __init__(self, radius: float = R, fast_radius: float = FAST_R):
-        self.radius = radius
-        self.fast_radius = fast_radius
-        self.vertices = [hex_vertex(a, radius) for a in HEX_ANGLES]
-        self.fast_vertices = [hex_vertex(a, fast_radius) for a in HEX_ANGLES]
-        
-        # All holes
-        self.outer_track: List[Hole] = []
-        self.fast_track: List[Hole] = []
-        self.center_hole: Hole = None
-        self.player_zones: Dict[int, PlayerZone] = {}
-        
-        # Lookup tables
-        self.hole_by_id: Dict[str, Hole] = {}
-        
-    def generate(self) -> Dict:
-        """Generate the complete board"""
-        self._generate_outer_track()
-        self._generate_fast_track()
-        self._generate_center()
-        self._generate_player_zones()
-        self._build_lookup()
-        return self.to_dict()
-    
-    def _generate_outer_track(self):
-        """Generate exactly 60 outer track holes (10 per side)"""
-        hole_id = 0
-        for side in range(6):
-            v1 = self.vertices[side]
-            v2 = self.vertices[(side + 1) % 6]
-            
-            for step in range(TRACK_PER_SIDE):
-                # Evenly space holes, starting just after vertex
-                t = (step + 0.5) / TRACK_PER_SIDE
-                x, y = lerp_point(v1, v2, t)
-                
-                hole = Hole(
-                    id=f"outer_{hole_id}",
-                    x=x,
-                    y=y,
-                    hole_type=HoleType.OUTER,
-                    track_index=hole_id
-                )
-                self.outer_track.append(hole)
-                hole_id += 1
-    
-    def _generate_fast_track(self):
-        """Generate fast track holes inside the hexagon"""
-        hole_id = 0
-        # 12 fast track holes total (2 per side: entry and exit)
-        for side in range(6):
-            v1 = self.fast_vertices[side]
-            v2 = self.fast_vertices[(side + 1) % 6]
-            
-            # Entry hole at 1/3 position
-            entry_x, entry_y = lerp_point(v1, v2, 1/3)
-            entry = Hole(
-                id=f"fast_entry_{side}",
-                x=entry_x,
-                y=entry_y,
-                hole_type=HoleType.FAST_ENTRY,
-                player_id=side,
-                fast_index=hole_id
-            )
-            self.fast_track.append(entry)
-            hole_id += 1
-            
-            # Exit hole at 2/3 position
-            exit_x, exit_y = lerp_point(v1, v2, 2/3)
-            exit_hole = Hole(
-                id=f"fast_exit_{side}",
-                x=exit_x,
-                y=exit_y,
-                hole_type=HoleType.FAST_EXIT,
-                player_id=side,
-                fast_index=hole_id
-            )
-            self.fast_track.append(exit_hole)
-            hole_id += 1
-    
-    def _generate_center(self):
-        """Generate center hole"""
-        self.center_hole = Hole(
-            id="center",
-            x=0,
-            y=0,
-            hole_type=HoleType.CENTER
-        )
-    
-    def _generate_player_zones(self):
-        """Generate all player zones with exact hole placement"""
-        for player_id in range(6):
-            v1 = self.vertices[player_id]
-            v2 = self.vertices[(player_id + 1) % 6]
-            
-            # Midpoint of this edge
-            mid_x, mid_y = lerp_point(v1, v2, 0.5)
-            
-            # Direction vector from center to midpoint (for safe zone alignment)
-            dist = math.sqrt(mid_x**2 + mid_y**2)
-            dir_x, dir_y = mid_x / dist, mid_y / dist
-            
-            # === START HOLE ===
-            # Located at the midpoint of the edge on the outer track
-            # Find the outer track hole closest to midpoint
-            start_track_index = player_id * TRACK_PER_SIDE + TRACK_PER_SIDE // 2
-            start_hole = self.outer_track[start_track_index]
-            start_hole.hole_type = HoleType.START
-            start_hole.player_id = player_id
-            
-            # === WINNER HOLE ===
-            # Located directly inside the start hole along the safe zone line
-            # At 85% of the distance from center to edge midpoint
-            winner_dist = dist * 0.85
-            winner_x = dir_x * winner_dist
-            winner_y = dir_y * winner_dist
-            winner_hole = Hole(
-                id=f"winner_{player_id}",
-                x=winner_x,
-                y=winner_y,
-                hole_type=HoleType.WINNER,
-                player_id=player_id
-            )
-            
-            # === SAFE ZONE HOLES ===
-            # 4 holes in a line from winner hole toward center
-            safe_zone_holes = []
-            for s in range(SAFE_STEPS):
-                # Distribute between winner hole and center
-                # Start from winner (s=0) going toward center (s=3)
-                safe_dist = winner_dist * (1 - (s + 1) / (SAFE_STEPS + 1))
-                safe_x = dir_x * safe_dist
-                safe_y = dir_y * safe_dist
-                safe_hole = Hole(
-                    id=f"safe_{player_id}_{s}",
-                    x=safe_x,
-                    y=safe_y,
-                    hole_type=HoleType.SAFE,
-                    player_id=player_id,
-                    safe_index=s
-                )
-                safe_zone_holes.append(safe_hole)
-            
-            # === HOLDING AREA HOLES ===
-            # 4 holes in a 2x2 grid outside the edge
-            holding_holes = []
-            # Position holding area outside the edge at 115% radius
-            hold_center_x = dir_x * dist * 1.15
-            hold_center_y = dir_y * dist * 1.15
-            
-            # Get perpendicular direction
-            edge_dx = v2[0] - v1[0]
-            edge_dy = v2[1] - v1[1]
-            edge_len = math.sqrt(edge_dx**2 + edge_dy**2)
-            perp_x, perp_y = edge_dx / edge_len, edge_dy / edge_len
-            
-            # Create 2x2 grid with 20-unit spacing
-            spacing = 20
-            for i in range(4):
-                row = i // 2
-                col = i % 2
-                hold_x = hold_center_x + (col - 0.5) * spacing * perp_x + (row - 0.5) * spacing * dir_x
-                hold_y = hold_center_y + (col - 0.5) * spacing * perp_y + (row - 0.5) * spacing * dir_y
-                hold_hole = Hole(
-                    id=f"holding_{player_id}_{i}",
-                    x=hold_x,
-                    y=hold_y,
-                    hole_type=HoleType.HOLDING,
-                    player_id=player_id
-                )
-                holding_holes.append(hold_hole)
-            
-            # === FAST TRACK ENTRY/EXIT ===
-            fast_entry = next(h for h in self.fast_track if h.id == f"fast_entry_{player_id}")
-            fast_exit = next(h for h in self.fast_track if h.id == f"fast_exit_{player_id}")
-            
-            # Create player zone
-            self.player_zones[player_id] = PlayerZone(
-                player_id=player_id,
-                color=PLAYER_COLORS[player_id],
-                holding_holes=holding_holes,
-                start_hole=start_hole,
-                winner_hole=winner_hole,
-                safe_zone_holes=safe_zone_holes,
-                fast_entry_hole=fast_entry,
-                fast_exit_hole=fast_exit
-            )
-    
-    def _build_lookup(self):
-        """Build hole lookup by ID"""
-        # Outer track
-        for hole in self.outer_track:
-            self.hole_by_id[hole.id] = hole
-        
-        # Fast track
-        for hole in self.fast_track:
-            self.hole_by_id[hole.id] = hole
-        
-        # Center
-        self.hole_by_id[self.center_hole.id] = self.center_hole
-        
-        # Player zones
-        for zone in self.player_zones.values():
-            for hole in zone.holding_holes:
-                self.hole_by_id[hole.id] = hole
-            self.hole_by_id[zone.winner_hole.id] = zone.winner_hole
-            for hole in zone.safe_zone_holes:
-                self.hole_by_id[hole.id] = hole
-    
-    def to_dict(self) -> dict:
-        """Export board as dictionary for JSON serialization"""
-        return {
-            "radius": self.radius,
-            "fast_radius": self.fast_radius,
-            "outer_track": [h.to_dict() for h in self.outer_track],
-            "fast_track": [h.to_dict() for h in self.fast_track],
-            "center": self.center_hole.to_dict() if self.center_hole else None,
-            "player_zones": {
-                pid: {
-                    "player_id": zone.player_id,
-                    "color": zone.color,
-                    "holding_holes": [h.to_dict() for h in zone.holding_holes],
-                    "start_hole": zone.start_hole.to_dict(),
-                    "winner_hole": zone.winner_hole.to_dict(),
-                    "safe_zone_holes": [h.to_dict() for h in zone.safe_zone_holes],
-                    "fast_entry": zone.fast_entry_hole.to_dict(),
-                    "fast_exit": zone.fast_exit_hole.to_dict()
-                }
-                for pid, zone in self.player_zones.items()
-            },
-            "totals": {
-                "outer_track_holes": len(self.outer_track),
-                "fast_track_holes": len(self.fast_track),
-                "holding_holes_per_player": 4,
-                "safe_zone_holes_per_player": 4,
-                "total_holes": (
-                    len(self.outer_track) + 
-                    len(self.fast_track) + 
-                    1 +  # center
-                    6 * (4 + 1 + 4)  # per player: holding + winner + safe
-                )
-            }
-        }
+# Peg states that move around (and can be hit on) the outer track
+TRACK_STATES = (PegState.ON_TRACK, PegState.ON_START)
 
 
 # =============================================================================
@@ -409,18 +84,28 @@ class BoardGenerator:
 # =============================================================================
 
 class FastTrackGame:
-    """Complete game state and logic"""
+    """
+    Complete game state and logic.
+    
+    State lives in flat integer arrays over the shared BoardTopology:
+    `occupancy[hole]` is the peg index in that hole (-1 if empty) and
+    `peg_hole` / `peg_owner` / `peg_state` are indexed by peg. The Peg
+    objects and string hole IDs are kept in sync for the public API;
+    move through move_peg() so both views stay consistent.
+    """
     
-    def __init__(self, num_players: int = 6):
+    def __init__(self, num_players: int = 6, seed: Optional[int] = None):
         if num_players < 2 or num_players > 6:
             raise ValueError("Number of players must be between 2 and 6")
         
         self.num_players = num_players
         self.current_player = 0
+        self.rng = random.Random(seed)
         
-        # Generate board
-        self.board_gen = BoardGenerator()
-        self.board_gen.generate()
+        # Shared board - geometry and move tables are built once per process
+        self.topology = BoardTopology.shared()
+        self.board_gen = self.topology.board
+        topo = self.topology
         
         # Create pegs - EXACTLY 6 per player as specified
         self.pegs: Dict[str, Peg] = {}
@@ -466,6 +151,20 @@ class FastTrackGame:
             
             self.player_pegs[player_id] = player_pegs
         
+        # Compact state arrays
+        self.peg_list: List[Peg] = list(self.pegs.values())
+        self.peg_index: Dict[str, int] = {p.id: i for i, p in enumerate(self.peg_list)}
+        self.peg_owner: List[int] = [p.player_id for p in self.peg_list]
+        self.peg_hole: List[int] = [topo.hole_index[p.hole_id] for p in self.peg_list]
+        self.peg_state: List[PegState] = [p.state for p in self.peg_list]
+        self.occupancy: List[int] = [-1] * topo.num_holes
+        for i, hole in enumerate(self.peg_hole):
+            self.occupancy[hole] = i
+        self.player_peg_indices: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(i for i, owner in enumerate(self.peg_owner) if owner == player_id)
+            for player_id in range(num_players)
+        )
+        
         # Card deck
         self.deck: List[Card] = []
         self.discard: List[Card] = []
@@ -475,6 +174,11 @@ class FastTrackGame:
         # Player hands
         self.hands: Dict[int, List[Card]] = {i: [] for i in range(num_players)}
         self._deal_initial_hands()
+        
+        # Versioned deltas: what changed since the last commit_delta()
+        self.sync = StateSync()
+        self._dirty_pegs: Set[int] = set()
+        self._dirty_hands: Set[int] = set()
     
     def _create_deck(self):
         """Create standard 54-card deck (52 + 2 jokers)"""
@@ -491,8 +195,7 @@ class FastTrackGame:
     
     def _shuffle_deck(self):
         """Shuffle the deck"""
-        import random
-        random.shuffle(self.deck)
+        self.rng.shuffle(self.deck)
     
     def _deal_initial_hands(self, cards_per_hand: int = 5):
         """Deal initial hands to all players"""
@@ -512,6 +215,7 @@ class FastTrackGame:
         if self.deck:
             card = self.deck.pop()
             self.hands[player_id].append(card)
+            self._dirty_hands.add(player_id)
             return card
         return None
     
@@ -520,244 +224,287 @@ class FastTrackGame:
         return self.board_gen.hole_by_id.get(hole_id)
     
     def get_peg_at_hole(self, hole_id: str) -> Optional[Peg]:
-        """Get peg at a specific hole"""
-        for peg in self.pegs.values():
-            if peg.hole_id == hole_id:
-                return peg
-        return None
+        """Get peg at a specific hole - O(1)"""
+        hole = self.topology.hole_index.get(hole_id)
+        if hole is None:
+            return None
+        peg = self.occupancy[hole]
+        return self.peg_list[peg] if peg >= 0 else None
+    
+    # -------------------------------------------------------------------------
+    # Move generation (integer core)
+    # -------------------------------------------------------------------------
     
     def get_valid_moves(self, peg_id: str, card: Card) -> List[str]:
         """Get all valid destination hole IDs for a peg given a card"""
-        peg = self.pegs.get(peg_id)
-        if not peg:
+        peg = self.peg_index.get(peg_id)
+        if peg is None:
             return []
-        
-        moves = []
+        hole_ids = self.topology.hole_ids
+        return [hole_ids[h] for h in self.moves_for(peg, card.rank)]
+    
+    def moves_for(self, peg: int, rank: str) -> List[int]:
+        """Destination hole indices for peg index `peg` playing `rank`"""
+        state = self.peg_state[peg]
         
         # Card-specific logic
-        if card.rank == "JOKER":
-            moves.extend(self._get_joker_moves(peg))
-        elif card.rank == "A":
-            moves.extend(self._get_ace_moves(peg))
-        elif card.rank == "K":
-            moves.extend(self._get_king_moves(peg))
-        elif card.rank == "Q":
-            moves.extend(self._get_queen_moves(peg))
-        elif card.rank == "J":
-            moves.extend(self._get_jack_moves(peg))
-        elif card.rank == "7":
-            moves.extend(self._get_seven_moves(peg))
-        elif card.rank == "4":
-            moves.extend(self._get_four_moves(peg))
-        else:
-            # Number cards: 2, 3, 5, 6, 8, 9, 10
-            value = int(card.rank)
-            moves.extend(self._get_number_moves(peg, value))
+        if rank == "JOKER":
+            # Capture any opponent's peg on the track
+            return self._opponents_on_track(peg)
+        if rank == "A" or rank == "K":
+            # Release from holding OR move 1 / 13 spaces
+            if state == PegState.IN_HOLDING:
+                owner = self.peg_owner[peg]
+                start = self.topology.start_hole[owner]
+                occupant = self.occupancy[start]
+                if occupant < 0 or self.peg_owner[occupant] != owner:
+                    return [start]
+                return []
+            if state in TRACK_STATES:
+                return self._track_moves(peg, 1 if rank == "A" else 13)
+            return []
+        if state not in TRACK_STATES:
+            return []
+        if rank == "J":
+            # Swap with any opponent's peg on track
+            return self._opponents_on_track(peg)
+        if rank == "Q":
+            return self._track_moves(peg, 12)
+        if rank == "4":
+            # Move backward 4 spaces
+            return self._track_moves(peg, -4)
+        # 7 (single move; splits handled separately) and number cards
+        return self._track_moves(peg, int(rank))
+    
+    def _opponents_on_track(self, peg: int) -> List[int]:
+        owner = self.peg_owner[peg]
+        peg_owner, peg_state = self.peg_owner, self.peg_state
+        return [
+            self.peg_hole[other] for other in range(len(peg_owner))
+            if peg_owner[other] != owner and peg_state[other] in TRACK_STATES
+        ]
+    
+    def _track_moves(self, peg: int, spaces: int) -> List[int]:
+        """Track (and safe-zone entry) destinations from the precomputed tables"""
+        topo = self.topology
+        hole = self.peg_hole[peg]
+        if topo.track_position[hole] < 0:
+            return []
         
-        return moves
-    
-    def _get_joker_moves(self, peg: Peg) -> List[str]:
-        """Joker: Capture any opponent's peg"""
-        moves = []
-        for other_peg in self.pegs.values():
-            if other_peg.player_id != peg.player_id:
-                if other_peg.state == PegState.ON_TRACK:
-                    moves.append(other_peg.hole_id)
-        return moves
-    
-    def _get_ace_moves(self, peg: Peg) -> List[str]:
-        """Ace: Release from holding OR move 1 space"""
+        owner = self.peg_owner[peg]
+        occupancy, peg_owner = self.occupancy, self.peg_owner
         moves = []
         
-        if peg.state == PegState.IN_HOLDING:
-            # Can release to start hole
-            zone = self.board_gen.player_zones[peg.player_id]
-            start_peg = self.get_peg_at_hole(zone.start_hole.id)
-            if not start_peg or start_peg.player_id != peg.player_id:
-                moves.append(zone.start_hole.id)
-        elif peg.state == PegState.ON_TRACK:
-            # Move 1 forward
-            moves.extend(self._get_track_moves(peg, 1))
-        
-        return moves
-    
-    def _get_king_moves(self, peg: Peg) -> List[str]:
-        """King: Release from holding OR move 13 spaces"""
-        moves = []
+        # Destination on outer track, unless blocked by own peg
+        dest = topo.track_dest[hole][spaces - MIN_STEPS]
+        occupant = occupancy[dest]
+        if occupant < 0 or peg_owner[occupant] != owner:
+            moves.append(dest)
         
-        if peg.state == PegState.IN_HOLDING:
-            zone = self.board_gen.player_zones[peg.player_id]
-            start_peg = self.get_peg_at_hole(zone.start_hole.id)
-            if not start_peg or start_peg.player_id != peg.player_id:
-                moves.append(zone.start_hole.id)
-        elif peg.state == PegState.ON_TRACK:
-            moves.extend(self._get_track_moves(peg, 13))
+        # Passing over own start: safe zone / winner hole entry
+        if spaces > 0:
+            safe = topo.safe_dest[owner][hole][spaces - MIN_STEPS]
+            if safe >= 0:
+                occupant = occupancy[safe]
+                if occupant < 0 or peg_owner[occupant] != owner:
+                    moves.append(safe)
         
         return moves
     
-    def _get_queen_moves(self, peg: Peg) -> List[str]:
-        """Queen: Move 12 spaces"""
-        if peg.state == PegState.ON_TRACK:
-            return self._get_track_moves(peg, 12)
-        return []
-    
-    def _get_jack_moves(self, peg: Peg) -> List[str]:
-        """Jack: Swap with any opponent's peg on track"""
+    def generate_moves(self, player_id: int,
+                       hand: Optional[List[Card]] = None) -> List[Tuple[int, int, int]]:
+        """
+        Every legal (peg index, hand index, destination hole index) for a
+        player. Repeated ranks in the hand are only expanded once.
+        """
+        hand = self.hands[player_id] if hand is None else hand
+        pegs = self.player_peg_indices[player_id]
+        # Only Joker, Ace and King can move pegs that are off the track
+        on_track = [peg for peg in pegs if self.peg_state[peg] in TRACK_STATES]
         moves = []
-        if peg.state == PegState.ON_TRACK:
-            for other_peg in self.pegs.values():
-                if other_peg.player_id != peg.player_id:
-                    if other_peg.state == PegState.ON_TRACK:
-                        moves.append(other_peg.hole_id)
+        seen = set()
+        for card_index, card in enumerate(hand):
+            rank = card.rank
+            if rank in seen:
+                continue
+            seen.add(rank)
+            for peg in (pegs if rank in ("JOKER", "A", "K") else on_track):
+                for dest in self.moves_for(peg, rank):
+                    moves.append((peg, card_index, dest))
         return moves
     
-    def _get_seven_moves(self, peg: Peg) -> List[str]:
-        """Seven: Move 7 OR split between two pegs"""
-        # For now, just return single moves of 7
-        # Split moves handled separately
-        if peg.state == PegState.ON_TRACK:
-            return self._get_track_moves(peg, 7)
-        return []
-    
-    def _get_four_moves(self, peg: Peg) -> List[str]:
-        """Four: Move backward 4 spaces"""
-        if peg.state == PegState.ON_TRACK:
-            return self._get_track_moves(peg, -4)
-        return []
-    
-    def _get_number_moves(self, peg: Peg, value: int) -> List[str]:
-        """Number cards: Move forward that many spaces"""
-        if peg.state == PegState.ON_TRACK:
-            return self._get_track_moves(peg, value)
-        return []
-    
-    def _get_track_moves(self, peg: Peg, spaces: int) -> List[str]:
-        """Calculate track movement possibilities"""
-        moves = []
-        hole = self.get_hole(peg.hole_id)
-        
-        if not hole or hole.track_index is None:
-            return moves
-        
-        # Calculate destination on outer track
-        if spaces > 0:
-            # Forward movement
-            dest_index = (hole.track_index + spaces) % TOTAL_OUTER_TRACK
-        else:
-            # Backward movement (4 card)
-            dest_index = (hole.track_index + spaces) % TOTAL_OUTER_TRACK
-        
-        dest_hole = self.board_gen.outer_track[dest_index]
-        
-        # Check if destination is blocked by own peg
-        dest_peg = self.get_peg_at_hole(dest_hole.id)
-        if not dest_peg or dest_peg.player_id != peg.player_id:
-            moves.append(dest_hole.id)
-        
-        # Check for safe zone entry
-        zone = self.board_gen.player_zones[peg.player_id]
-        start_track_index = zone.start_hole.track_index
-        
-        # If passing over start, check for safe zone entry
-        if spaces > 0:
-            for i in range(1, spaces + 1):
-                check_index = (hole.track_index + i) % TOTAL_OUTER_TRACK
-                if check_index == start_track_index:
-                    # Calculate safe zone depth
-                    safe_depth = spaces - i - 1
-                    if 0 <= safe_depth < SAFE_STEPS:
-                        safe_hole = zone.safe_zone_holes[safe_depth]
-                        safe_peg = self.get_peg_at_hole(safe_hole.id)
-                        if not safe_peg or safe_peg.player_id != peg.player_id:
-                            moves.append(safe_hole.id)
-                    elif safe_depth == SAFE_STEPS:
-                        # Exact landing on winner hole
-                        winner_peg = self.get_peg_at_hole(zone.winner_hole.id)
-                        if not winner_peg or winner_peg.player_id != peg.player_id:
-                            moves.append(zone.winner_hole.id)
-                    break
-        
-        return moves
+    # -------------------------------------------------------------------------
+    # Moves
+    # -------------------------------------------------------------------------
+    
+    def _place(self, peg: int, hole: int, state: PegState):
+        """Move peg index `peg` into `hole`, keeping arrays and Peg in sync"""
+        old = self.peg_hole[peg]
+        if self.occupancy[old] == peg:
+            self.occupancy[old] = -1
+        self.occupancy[hole] = peg
+        self.peg_hole[peg] = hole
+        self.peg_state[peg] = state
+        obj = self.peg_list[peg]
+        obj.hole_id = self.topology.hole_ids[hole]
+        obj.state = state
+        self._dirty_pegs.add(peg)
     
     def move_peg(self, peg_id: str, dest_hole_id: str) -> dict:
         """Execute a peg movement"""
-        peg = self.pegs.get(peg_id)
-        if not peg:
+        peg = self.peg_index.get(peg_id)
+        if peg is None:
             return {"success": False, "error": "Peg not found"}
         
-        dest_hole = self.get_hole(dest_hole_id)
-        if not dest_hole:
+        dest = self.topology.hole_index.get(dest_hole_id)
+        if dest is None:
             return {"success": False, "error": "Destination hole not found"}
         
+        return self.move_peg_index(peg, dest)
+    
+    def move_peg_index(self, peg: int, dest: int) -> dict:
+        """move_peg() on indices"""
+        topo = self.topology
+        owner = self.peg_owner[peg]
+        from_hole = self.peg_hole[peg]
+        
         # Check for capture
-        captured_peg = self.get_peg_at_hole(dest_hole_id)
+        captured = self.occupancy[dest]
         capture_info = None
         
-        if captured_peg and captured_peg.player_id != peg.player_id:
+        if captured >= 0 and self.peg_owner[captured] != owner:
             # Capture opponent's peg - send to holding
-            cap_zone = self.board_gen.player_zones[captured_peg.player_id]
-            for hold_hole in cap_zone.holding_holes:
-                if not self.get_peg_at_hole(hold_hole.id):
-                    captured_peg.hole_id = hold_hole.id
-                    captured_peg.state = PegState.IN_HOLDING
-                    capture_info = {"captured": captured_peg.id}
+            for hold_hole in topo.holding_holes[self.peg_owner[captured]]:
+                if self.occupancy[hold_hole] < 0:
+                    self._place(captured, hold_hole, PegState.IN_HOLDING)
+                    capture_info = {"captured": self.peg_list[captured].id}
                     break
         
-        # Move peg
-        peg.hole_id = dest_hole_id
-        
         # Update state based on destination
-        if dest_hole.hole_type == HoleType.OUTER or dest_hole.hole_type == HoleType.START:
-            peg.state = PegState.ON_TRACK
-        elif dest_hole.hole_type == HoleType.SAFE:
-            peg.state = PegState.IN_SAFE_ZONE
-        elif dest_hole.hole_type == HoleType.WINNER:
-            peg.state = PegState.ON_WINNER
-        elif dest_hole.hole_type in [HoleType.FAST, HoleType.FAST_ENTRY, HoleType.FAST_EXIT]:
-            peg.state = PegState.ON_FAST_TRACK
+        hole_type = topo.hole_types[dest]
+        state = self.peg_state[peg]
+        if hole_type in TRACK_TYPES:
+            state = PegState.ON_TRACK
+        elif hole_type == HoleType.SAFE:
+            state = PegState.IN_SAFE_ZONE
+        elif hole_type == HoleType.WINNER:
+            state = PegState.ON_WINNER
+        elif hole_type in FAST_TYPES:
+            state = PegState.ON_FAST_TRACK
+        
+        # Move peg
+        self._place(peg, dest, state)
         
         result = {
             "success": True,
-            "peg_id": peg_id,
-            "from": peg.hole_id,
-            "to": dest_hole_id,
-            "new_state": peg.state.value
+            "peg_id": self.peg_list[peg].id,
+            "from": topo.hole_ids[from_hole],
+            "to": topo.hole_ids[dest],
+            "new_state": state.value
         }
         
         if capture_info:
             result.update(capture_info)
         
         # Check for win
-        if self.check_win(peg.player_id):
-            result["winner"] = peg.player_id
+        if self.check_win(owner):
+            result["winner"] = owner
         
         return result
     
     def check_win(self, player_id: int) -> bool:
         """Check if a player has won"""
-        zone = self.board_gen.player_zones[player_id]
+        topo = self.topology
+        occupancy, peg_owner = self.occupancy, self.peg_owner
         
-        # All 4 safe zone holes must be filled
-        for safe_hole in zone.safe_zone_holes:
-            peg = self.get_peg_at_hole(safe_hole.id)
-            if not peg or peg.player_id != player_id:
+        # All 4 safe zone holes must be filled, and the winner hole
+        for hole in topo.safe_holes[player_id] + (topo.winner_hole[player_id],):
+            peg = occupancy[hole]
+            if peg < 0 or peg_owner[peg] != player_id:
                 return False
         
-        # Winner hole must have a peg
-        winner_peg = self.get_peg_at_hole(zone.winner_hole.id)
-        if not winner_peg or winner_peg.player_id != player_id:
-            return False
-        
         return True
     
+    def discard_card(self, player_id: int, hand_index: int) -> Card:
+        """Discard a card from a player's hand and draw its replacement"""
+        card = self.hands[player_id].pop(hand_index)
+        self.discard.append(card)
+        self._dirty_hands.add(player_id)
+        self.draw_card(player_id)
+        return card
+    
+    def play_move(self, move: Tuple[int, int, int]) -> dict:
+        """Apply a generate_moves() tuple: move the peg, then play the card"""
+        peg, hand_index, dest = move
+        result = self.move_peg_index(peg, dest)
+        result["card"] = self.discard_card(self.peg_owner[peg], hand_index).rank
+        return result
+    
     def next_turn(self):
         """Advance to next player's turn"""
         self.current_player = (self.current_player + 1) % self.num_players
     
-    def get_state(self) -> dict:
-        """Get complete game state as dictionary"""
-        return {
-            "board": self.board_gen.to_dict(),
+    def position_key(self) -> Tuple:
+        """Hashable board position (peg placement and side to move, no cards)"""
+        return (self.current_player, tuple(self.occupancy))
+    
+    def clone(self, seed: Optional[int] = None) -> 'FastTrackGame':
+        """
+        Independent copy for search and simulation. Shares the topology,
+        peg index tables and Card objects; sync history is not copied.
+        """
+        game = object.__new__(FastTrackGame)
+        game.num_players = self.num_players
+        game.current_player = self.current_player
+        game.rng = random.Random(seed)
+        game.topology = self.topology
+        game.board_gen = self.board_gen
+        
+        game.peg_list = [Peg(p.id, p.player_id, p.color, p.state, p.hole_id)
+                         for p in self.peg_list]
+        game.pegs = {p.id: p for p in game.peg_list}
+        game.player_pegs = {
+            player_id: [game.peg_list[i] for i in indices]
+            for player_id, indices in enumerate(self.player_peg_indices)
+        }
+        game.peg_index = self.peg_index
+        game.peg_owner = self.peg_owner
+        game.player_peg_indices = self.player_peg_indices
+        game.peg_hole = self.peg_hole[:]
+        game.peg_state = self.peg_state[:]
+        game.occupancy = self.occupancy[:]
+        
+        game.deck = self.deck[:]
+        game.discard = self.discard[:]
+        game.hands = {player_id: cards[:] for player_id, cards in self.hands.items()}
+        
+        game.sync = StateSync()
+        game._dirty_pegs = set()
+        game._dirty_hands = set()
+        return game
+    
+    def __getstate__(self) -> dict:
+        # The shared topology is rebuilt on unpickling, not shipped
+        state = self.__dict__.copy()
+        del state["topology"], state["board_gen"], state["sync"]
+        return state
+    
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.topology = BoardTopology.shared()
+        self.board_gen = self.topology.board
+        self.sync = StateSync()
+    
+    def get_state(self, include_board: bool = True) -> dict:
+        """
+        Get complete game state as dictionary.
+        
+        Clients that already have the board (see board_message, cacheable
+        by board_hash) should ask for include_board=False.
+        """
+        state = {
+            "version": self.sync.version,
+            "board_hash": self.topology.board_hash,
             "pegs": {pid: p.to_dict() for pid, p in self.pegs.items()},
             "current_player": self.current_player,
             "hands": {
@@ -766,6 +513,127 @@ class FastTrackGame:
             },
             "deck_remaining": len(self.deck)
         }
+        if include_board:
+            state["board"] = self.topology.board_dict
+        return state
+    
+    @property
+    def board_message(self) -> str:
+        """Pre-serialized board topology, sent once per session"""
+        return self.topology.board_message
+    
+    def commit_delta(self) -> str:
+        """
+        Serialize everything changed since the last commit as the next
+        version. Pegs are sent as {peg_id: [hole_id, state]} and hands
+        as {player_id: [[rank, suit], ...]}; turn and deck size always.
+        """
+        changes = {"turn": self.current_player, "deck_remaining": len(self.deck)}
+        if self._dirty_pegs:
+            changes["pegs"] = {
+                self.peg_list[peg].id: [self.peg_list[peg].hole_id, self.peg_state[peg].value]
+                for peg in sorted(self._dirty_pegs)
+            }
+            self._dirty_pegs.clear()
+        if self._dirty_hands:
+            changes["hands"] = {
+                player_id: [[c.rank, c.suit] for c in self.hands[player_id]]
+                for player_id in sorted(self._dirty_hands)
+            }
+            self._dirty_hands.clear()
+        return self.sync.commit(changes)
+    
+    def resync(self, version: int) -> List[str]:
+        """Messages for a client that last applied `version`"""
+        return self.sync.resync(version, lambda: self.get_state(include_board=False))
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_move_generation(positions: int = 200, seed: int = 7) -> dict:
+    """
+    Moves/sec for the string API (get_valid_moves over every peg and
+    card) versus generate_moves() on the integer core, over random
+    mid-game positions.
+    """
+    import time
+    
+    rng = random.Random(seed)
+    games = []
+    for _ in range(positions):
+        game = FastTrackGame(num_players=6)
+        topo = game.topology
+        for player_id in range(game.num_players):
+            # Put a random number of pegs onto free track holes
+            for peg in game.player_peg_indices[player_id][:rng.randint(0, 4)]:
+                free = [h for h in topo.track_holes if game.occupancy[h] < 0]
+                game.move_peg_index(peg, rng.choice(free))
+        games.append(game)
+    
+    def run(generate):
+        count = 0
+        start = time.perf_counter()
+        for game in games:
+            for player_id in range(game.num_players):
+                count += generate(game, player_id)
+        return count, time.perf_counter() - start
+    
+    def string_api(game, player_id):
+        return sum(
+            len(game.get_valid_moves(peg.id, card))
+            for card in game.hands[player_id]
+            for peg in game.player_pegs[player_id]
+        )
+    
+    def compact(game, player_id):
+        return len(game.generate_moves(player_id))
+    
+    string_moves, string_s = run(string_api)
+    compact_moves, compact_s = run(compact)
+    return {
+        "positions": positions * 6,
+        "string_moves_per_second": round(string_moves / string_s),
+        "compact_moves_per_second": round(compact_moves / compact_s),
+        "compact_generations_per_second": round(positions * 6 / compact_s),
+    }
+
+
+def benchmark_state_sync(moves: int = 500, seed: int = 0) -> dict:
+    """
+    Replay a random game and count bytes on the wire per move: a full
+    get_state() broadcast after every move (and one without the board)
+    versus one board message and snapshot up front, then commit_delta()
+    per move.
+    """
+    import random
+    
+    rng = random.Random(seed)
+    game = FastTrackGame(num_players=6, seed=seed)
+    
+    full_bytes = state_bytes = 0
+    delta_bytes = len(game.board_message) + len(game.resync(-1)[0])
+    for _ in range(moves):
+        player_id = game.current_player
+        legal = game.generate_moves(player_id)
+        if legal:
+            game.play_move(rng.choice(legal))
+        else:
+            game.discard_card(player_id, 0)
+        game.next_turn()
+        
+        full_bytes += len(json.dumps(game.get_state()))
+        state_bytes += len(json.dumps(game.get_state(include_board=False)))
+        delta_bytes += len(game.commit_delta())
+    
+    return {
+        "moves": moves,
+        "full_bytes_per_move": round(full_bytes / moves),
+        "state_bytes_per_move": round(state_bytes / moves),
+        "delta_bytes_per_move": round(delta_bytes / moves),
+        "reduction_percent": round(100 * (1 - delta_bytes / full_bytes), 2),
+    }
 
 
 # =============================================================================
@@ -773,15 +641,14 @@ class FastTrackGame:
 # =============================================================================
 
 def export_board_json(filename: str = "board_geometry.json"):
-    """Export board geometry to JSON for 3D renderer"""
-    gen = BoardGenerator()
-    gen.generate()
+    """Export board geometry to JSON for 3D renderer (see board_topology)"""
+    board = BoardTopology.shared().board_dict
     
     with open(filename, 'w') as f:
-        json.dump(gen.to_dict(), f, indent=2)
+        json.dump(board, f, indent=2)
     
     print(f"Board geometry exported to {filename}")
-    return gen.to_dict()
+    return board
 
 
 # =============================================================================
@@ -32,6 +32,14 @@ from typing import List, Tuple, Dict, Any
 os.environ["BUTTERFLYFX_DEV"] = "1"
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+try:
+    from .board_topology import BoardTopology, R
+except ImportError:
+    from board_topology import BoardTopology, R
+
+# The board's hexagon has vertices at -30°; draw_hexagon() starts at 0°
+BOARD_ALIGNMENT = math.radians(30)
+
 # ============================================================
 # VIDEO CONFIGURATION
 # ============================================================
@@ -144,41 +152,47 @@ NARRATION_SCRIPT = [
 # ============================================================
 
 class FrameBuffer:
-    """Simple frame buffer for video rendering"""
+    """
+    Frame buffer for video rendering.
+    
+    Pixels live in one contiguous RGB24 bytearray (row-major, 3 bytes per
+    pixel), so clearing is a single slice assignment and to_bytes() hands
+    the buffer to the encoder without a per-pixel loop.
+    """
     
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.pixels = [RGB(0, 0, 0) for _ in range(width * height)]
+        self.buffer = bytearray(width * height * 3)
     
     def clear(self, color: RGB = RGB(0, 0, 0)):
-        for i in range(len(self.pixels)):
-            self.pixels[i] = color
+        self.buffer[:] = bytes((color.r, color.g, color.b)) * (self.width * self.height)
     
     def set_pixel(self, x: int, y: int, color: RGB):
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.pixels[y * self.width + x] = color
+            i = (y * self.width + x) * 3
+            self.buffer[i:i + 3] = bytes((color.r, color.g, color.b))
     
     def get_pixel(self, x: int, y: int) -> RGB:
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.pixels[y * self.width + x]
+            i = (y * self.width + x) * 3
+            return RGB(self.buffer[i], self.buffer[i + 1], self.buffer[i + 2])
         return RGB(0, 0, 0)
     
     def blend_pixel(self, x: int, y: int, color: RGB, alpha: float):
-        """Blend color with existing pixel"""
+        """Blend color with existing pixel (same rounding as RGB.lerp)"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            existing = self.get_pixel(x, y)
-            blended = existing.lerp(color, alpha)
-            self.set_pixel(x, y, blended)
+            t = max(0, min(1, alpha))
+            buf = self.buffer
+            i = (y * self.width + x) * 3
+            r, g, b = buf[i], buf[i + 1], buf[i + 2]
+            buf[i] = int(r + (color.r - r) * t)
+            buf[i + 1] = int(g + (color.g - g) * t)
+            buf[i + 2] = int(b + (color.b - b) * t)
     
     def to_bytes(self) -> bytes:
-        """Convert to RGB bytes for video encoding"""
-        data = bytearray(self.width * self.height * 3)
-        for i, pixel in enumerate(self.pixels):
-            data[i*3] = pixel.r
-            data[i*3 + 1] = pixel.g
-            data[i*3 + 2] = pixel.b
-        return bytes(data)
+        """RGB24 bytes for video encoding"""
+        return bytes(self.buffer)
 
 
 # ============================================================
@@ -199,17 +213,17 @@ def draw_gradient(fb: FrameBuffer, c1: RGB, c2: RGB, angle: float = 0):
     """Draw gradient background"""
     cos_a = math.cos(angle)
     sin_a = math.sin(angle)
+    xs = [(x / fb.width - 0.5) * cos_a for x in range(fb.width)]
+    stride = fb.width * 3
     
     for y in range(fb.height):
-        for x in range(fb.width):
-            # Normalized position along gradient axis
-            nx = (x / fb.width - 0.5)
-            ny = (y / fb.height - 0.5)
-            t = (nx * cos_a + ny * sin_a + 0.5)
-            t = max(0, min(1, t))
-            
-            color = c1.lerp(c2, t)
-            fb.set_pixel(x, y, color)
+        # Normalized position along gradient axis
+        ny = (y / fb.height - 0.5) * sin_a
+        row = bytearray(stride)
+        for x, nx in enumerate(xs):
+            color = c1.lerp(c2, max(0, min(1, nx + ny + 0.5)))
+            row[x * 3:x * 3 + 3] = bytes((color.r, color.g, color.b))
+        fb.buffer[y * stride:(y + 1) * stride] = row
 
 
 def draw_circle(fb: FrameBuffer, cx: int, cy: int, radius: float, 
@@ -309,31 +323,12 @@ def get_board_hole_positions(cx: int, cy: int, radius: float,
                              rotation: float = 0) -> List[Tuple[float, float]]:
     """
     Get positions of all holes on the FastTrack hexagonal board.
-    Returns list of (x, y) positions for the 96 track holes.
+    Returns list of (x, y) positions for the 60 outer track holes, taken
+    from the shared board topology and turned to match draw_hexagon().
     """
-    holes = []
-    
-    # 6 sides, 16 holes per side (approx)
-    holes_per_side = 16
-    
-    for side in range(6):
-        base_angle = math.radians(60 * side) + rotation
-        next_angle = math.radians(60 * (side + 1)) + rotation
-        
-        # Start and end points of this side
-        x1 = cx + radius * math.cos(base_angle)
-        y1 = cy + radius * math.sin(base_angle)
-        x2 = cx + radius * math.cos(next_angle)
-        y2 = cy + radius * math.sin(next_angle)
-        
-        # Interpolate holes along the side
-        for i in range(holes_per_side):
-            t = i / holes_per_side
-            x = x1 + (x2 - x1) * t
-            y = y1 + (y2 - y1) * t
-            holes.append((x, y))
-    
-    return holes
+    topology = BoardTopology.shared()
+    return topology.project(topology.track_holes, cx, cy, radius / R,
+                            rotation + BOARD_ALIGNMENT)
 
 
 def draw_fasttrack_board(fb: FrameBuffer, theme: Dict, t: float,
@@ -855,8 +850,25 @@ def render_frame(fb: FrameBuffer, t: float):
         scene_outro(fb, t, scene_t)
 
 
-def render_video():
-    """Main video rendering function"""
+def render_frame_number(frame_num: int) -> FrameBuffer:
+    """Render frame `frame_num` into a fresh buffer (pipeline worker entry point)"""
+    fb = FrameBuffer(WIDTH, HEIGHT)
+    render_frame(fb, frame_num / FPS)
+    return fb
+
+
+def render_video(workers: int = None, start: int = 0, stop: int = None,
+                 segment_frames: int = None, null_sink: bool = False):
+    """
+    Main video rendering function.
+    
+    Frames are rendered by a process pool and piped, in order, straight
+    into FFmpeg's stdin. `start`/`stop` render a frame range, and
+    `segment_frames` encodes resumable segments that survive an
+    interrupted run. `null_sink` renders without encoding.
+    """
+    from helix.packages.media_pkg import RenderPipeline
+    
     print("=" * 70)
     print("FASTTRACK PROMOTIONAL VIDEO GENERATOR")
     print("=" * 70)
@@ -864,74 +876,45 @@ def render_video():
     print(f"Duration: {DURATION} seconds")
     print()
     
-    # Create temp directory
-    temp_dir = tempfile.mkdtemp(prefix="fasttrack_promo_")
-    frames_dir = os.path.join(temp_dir, "frames")
-    os.makedirs(frames_dir)
-    print(f"Working directory: {temp_dir}")
-    
-    # Step 1: Render frames
-    print("\n[STEP 1/3] Rendering video frames...")
-    fb = FrameBuffer(WIDTH, HEIGHT)
-    total_frames = FPS * DURATION
-    
-    for frame_num in range(total_frames):
-        t = frame_num / FPS
-        
-        # Clear and render
-        fb.clear()
-        render_frame(fb, t)
-        
-        # Save frame
-        frame_path = os.path.join(frames_dir, f"frame_{frame_num:05d}.raw")
-        with open(frame_path, 'wb') as f:
-            f.write(fb.to_bytes())
-        
-        # Progress
-        if frame_num % (FPS * 10) == 0 or frame_num == total_frames - 1:
-            pct = (frame_num + 1) / total_frames * 100
-            scene_name, _ = get_scene_for_time(t)
-            print(f"  [{pct:5.1f}%] Frame {frame_num+1}/{total_frames} - {scene_name}")
-    
-    print(f"  Rendered {total_frames} frames")
-    
-    # Step 2: Generate audio
-    print("\n[STEP 2/3] Generating audio...")
-    music = generate_ambient_track(DURATION)
-    voice = generate_voice_narration(DURATION)
-    mixed = mix_audio(music, voice)
-    
-    audio_path = os.path.join(temp_dir, "audio.wav")
-    samples_to_wav(mixed, audio_path)
-    print(f"  Audio saved: {audio_path}")
-    
-    # Step 3: Encode video
-    print("\n[STEP 3/3] Encoding video with FFmpeg...")
     output_dir = Path(__file__).parent
     output_path = output_dir / "fasttrack_promo.mp4"
+    total_frames = FPS * DURATION
+    temp_dir = tempfile.mkdtemp(prefix="fasttrack_promo_")
+    audio_path = None
     
-    ffmpeg_cmd = [
-        "ffmpeg", "-y",
-        "-f", "rawvideo",
-        "-pixel_format", "rgb24",
-        "-video_size", f"{WIDTH}x{HEIGHT}",
-        "-framerate", str(FPS),
-        "-i", os.path.join(frames_dir, "frame_%05d.raw"),
-        "-i", audio_path,
-        "-c:v", "libx264",
-        "-preset", "medium",
-        "-crf", "20",
-        "-pix_fmt", "yuv420p",
-        "-c:a", "aac",
-        "-b:a", "192k",
-        "-shortest",
-        str(output_path)
-    ]
-    
-    print(f"  Running FFmpeg...")
-    result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
+    try:
+        # Step 1: Generate audio (FFmpeg needs it before frames start streaming)
+        print("[STEP 1/2] Generating audio...")
+        if null_sink:
+            print("  Skipped (null sink)")
+        else:
+            music = generate_ambient_track(DURATION)
+            voice = generate_voice_narration(DURATION)
+            mixed = mix_audio(music, voice)
+            
+            audio_path = os.path.join(temp_dir, "audio.wav")
+            samples_to_wav(mixed, audio_path)
+            print(f"  Audio saved: {audio_path}")
+        
+        # Step 2: Render frames straight into the encoder
+        print("\n[STEP 2/2] Rendering and encoding video frames...")
+        pipeline = RenderPipeline(
+            render_frame_number, WIDTH, HEIGHT, FPS, total_frames,
+            workers=workers,
+            label_fn=lambda n: get_scene_for_time(n / FPS)[0],
+        )
+        pipeline.run(str(output_path), audio_path, start, stop,
+                     segment_frames, null_sink,
+                     crf=20, preset="medium")
+    except RuntimeError as e:
+        print(f"  FFmpeg error!")
+        print(str(e)[-1000:])
+        return str(output_path)
+    finally:
+        import shutil
+        shutil.rmtree(temp_dir)
     
-    if result.returncode == 0:
+    if not null_sink:
         size_mb = output_path.stat().st_size / (1024 * 1024)
         print(f"\n{'=' * 70}")
         print("VIDEO GENERATION COMPLETE!")
@@ -940,18 +923,15 @@ def render_video():
         print(f"Size: {size_mb:.1f} MB")
         print(f"Duration: {DURATION}s")
         print(f"Resolution: {WIDTH}x{HEIGHT} @ {FPS}fps")
-    else:
-        print(f"  FFmpeg error!")
-        print(result.stderr[-1000:] if result.stderr else "No error output")
-    
-    # Cleanup
-    print("\nCleaning up temporary files...")
-    import shutil
-    shutil.rmtree(temp_dir)
     
     print("Done!")
     return str(output_path)
 
 
 if __name__ == "__main__":
-    render_video()
+    import argparse
+    from helix.packages.media_pkg import add_pipeline_arguments
+    
+    parser = argparse.ArgumentParser(description="Render the FastTrack promo video")
+    add_pipeline_arguments(parser)
+    render_video(**vars(parser.parse_args()))
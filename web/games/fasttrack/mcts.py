@@ -0,0 +1,376 @@
+"""
+Fast Track Monte-Carlo Tree Search AI
+=====================================
+Chooses moves for the fasttrack_exact engine by simulation instead of a
+fixed priority list.
+
+For every candidate move the searcher repeatedly:
+1. determinizes the hidden information - opponents' hands and the deck
+   are reshuffled together, since the AI cannot see them,
+2. plays the move and a short playout (epsilon-greedy) on a clone,
+3. scores the result: 1.0 win, 0.0 loss, otherwise a progress estimate.
+
+Candidates are picked with UCB1, so promising moves get more playouts.
+Statistics live in a transposition table keyed by the position the move
+leads to, so different cards reaching the same board share results, and
+entries survive across turns.
+
+Search is bounded by both a wall-clock budget and a rollout budget. The
+difficulty names map to rollout budgets. With workers > 0 a process pool
+runs root-parallel searches alongside the caller; a worker that misses
+the deadline (e.g. under server load) is ignored, so choose() always
+returns within its time budget plus one playout.
+
+    player = MCTSPlayer(difficulty="hard", time_budget=0.5, workers=2)
+    decision = player.choose(game, game.current_player)
+    game.play_move(decision.move)
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .fasttrack_exact import FastTrackGame, PegState
+    from .simulator import Move, apply_move, greedy_strategy, take_turn
+except ImportError:
+    from fasttrack_exact import FastTrackGame, PegState
+    from simulator import Move, apply_move, greedy_strategy, take_turn
+
+
+# Rollout budget per move for each difficulty
+DIFFICULTY = {
+    "easy": 50,
+    "medium": 300,
+    "hard": 1500,
+    "expert": 6000,
+}
+
+TIME_BUDGET = 0.25      # Seconds per move
+ROLLOUT_TURNS = 24      # Plies played after the candidate move
+EXPLORATION = 1.4       # UCB1 exploration constant
+EPSILON = 0.25          # Playout chance of a random instead of greedy move
+TABLE_SIZE = 100_000    # Transposition table entries (LRU)
+
+
+# =============================================================================
+# TRANSPOSITION TABLE
+# =============================================================================
+
+class TranspositionTable:
+    """LRU map of (position, player) -> [visits, total value]"""
+
+    def __init__(self, max_entries: int = TABLE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+
+    def get(self, key) -> List[float]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [0, 0.0]
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Per-process table used by pool workers
+_worker_table: Optional[TranspositionTable] = None
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+def progress(game: FastTrackGame, player_id: int) -> float:
+    """How far a player's pegs have come (0 at setup, ~15 when finished)"""
+    topo = game.topology
+    start = topo.track_position[topo.start_hole[player_id]]
+    laps = len(topo.track_holes)
+    total = 0.0
+    for peg in game.player_peg_indices[player_id]:
+        state = game.peg_state[peg]
+        if state == PegState.IN_SAFE_ZONE:
+            total += 3.0
+        elif state == PegState.ON_TRACK or state == PegState.ON_START:
+            position = topo.track_position[game.peg_hole[peg]]
+            total += 1.0 + ((position - start) % laps) / laps
+    return total
+
+
+def evaluate(game: FastTrackGame, player_id: int) -> float:
+    """Value in [0, 1] of a non-terminal position for player_id"""
+    mine = progress(game, player_id)
+    best_other = max(progress(game, p) for p in range(game.num_players) if p != player_id)
+    return min(1.0, max(0.0, 0.5 + (mine - best_other) / 30.0))
+
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+def determinize(game: FastTrackGame, player_id: int, rng: random.Random):
+    """Reshuffle everything player_id cannot see: the deck and other hands"""
+    unseen = game.deck[:]
+    for other, cards in game.hands.items():
+        if other != player_id:
+            unseen.extend(cards)
+    rng.shuffle(unseen)
+    for other, cards in game.hands.items():
+        if other != player_id:
+            count = len(cards)
+            game.hands[other] = unseen[:count]
+            del unseen[:count]
+    game.deck = unseen
+
+
+def _playout_policy(game, player_id, moves, rng):
+    if rng.random() < EPSILON:
+        return rng.choice(moves)
+    return greedy_strategy(game, player_id, moves, rng)
+
+
+def rollout(game: FastTrackGame, player_id: int, move: Move,
+            rng: random.Random, turns: int = ROLLOUT_TURNS) -> float:
+    """Play `move` then a short playout on a determinized clone"""
+    sim = game.clone(seed=rng.getrandbits(32))
+    determinize(sim, player_id, rng)
+
+    result = apply_move(sim, move)
+    for _ in range(turns):
+        if result is not None and "winner" in result:
+            return 1.0 if result["winner"] == player_id else 0.0
+        result = take_turn(sim, _playout_policy, rng)
+    if result is not None and "winner" in result:
+        return 1.0 if result["winner"] == player_id else 0.0
+    return evaluate(sim, player_id)
+
+
+def child_keys(game: FastTrackGame, player_id: int, moves: List[Move]) -> List[Tuple]:
+    """Transposition key of the position each move leads to"""
+    keys = []
+    for move in moves:
+        sim = game.clone()
+        apply_move(sim, move)
+        keys.append((player_id, sim.position_key()))
+    return keys
+
+
+def search(game: FastTrackGame, player_id: int, moves: List[Move],
+           deadline: float, max_rollouts: int, seed: int,
+           table: TranspositionTable, turns: int = ROLLOUT_TURNS) -> List[List[float]]:
+    """
+    UCB1 over the root moves until the deadline (perf_counter time) or
+    rollout budget runs out. Returns this search's own [visits, value]
+    per move; selection also uses what the table already knows.
+    """
+    rng = random.Random(seed)
+    keys = child_keys(game, player_id, moves)
+    entries = [table.get(key) for key in keys]
+    local = [[0, 0.0] for _ in moves]
+
+    rollouts = 0
+    while rollouts < max_rollouts and time.perf_counter() < deadline:
+        total = sum(entry[0] for entry in entries) + 1
+        log_total = math.log(total)
+        best, best_score = 0, -1.0
+        for i, (visits, value) in enumerate(entries):
+            if visits == 0:
+                best = i
+                break
+            score = value / visits + EXPLORATION * math.sqrt(log_total / visits)
+            if score > best_score:
+                best, best_score = i, score
+
+        value = rollout(game, player_id, moves[best], rng, turns)
+        entries[best][0] += 1
+        entries[best][1] += value
+        local[best][0] += 1
+        local[best][1] += value
+        rollouts += 1
+
+    return local
+
+
+def _search_task(game: FastTrackGame, player_id: int, moves: List[Move],
+                 budget: float, max_rollouts: int, seed: int, turns: int):
+    """Process pool entry point; the budget is relative to task start"""
+    global _worker_table
+    if _worker_table is None:
+        _worker_table = TranspositionTable()
+    deadline = time.perf_counter() + budget
+    return search(game, player_id, moves, deadline, max_rollouts, seed, _worker_table, turns)
+
+
+# =============================================================================
+# PLAYER
+# =============================================================================
+
+@dataclass
+class Decision:
+    """A chosen move with the statistics behind it"""
+    move: Move
+    rollouts: int
+    elapsed: float
+    candidates: List[Tuple[Move, int, float]] = field(default_factory=list)
+
+    def to_dict(self, game: FastTrackGame) -> dict:
+        """JSON-friendly form (string IDs), e.g. for log_ai_decision()"""
+        def describe(move):
+            peg, hand_index, dest = move
+            return {
+                "peg_id": game.peg_list[peg].id,
+                "hand_index": hand_index,
+                "to": game.topology.hole_ids[dest],
+            }
+
+        return {
+            "move": describe(self.move),
+            "rollouts": self.rollouts,
+            "elapsed_ms": round(self.elapsed * 1000, 2),
+            "candidates": [
+                dict(describe(move), visits=visits, value=round(value, 4))
+                for move, visits, value in self.candidates
+            ],
+        }
+
+
+class MCTSPlayer:
+    """
+    MCTS move chooser with a time budget, rollout budget (difficulty),
+    transposition table and optional process pool for parallel rollouts.
+    Also usable directly as a simulator strategy.
+    """
+
+    def __init__(self, difficulty: str = "medium", time_budget: float = TIME_BUDGET,
+                 workers: int = 0, seed: Optional[int] = None,
+                 rollout_turns: int = ROLLOUT_TURNS):
+        if difficulty not in DIFFICULTY:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        self.difficulty = difficulty
+        self.max_rollouts = DIFFICULTY[difficulty]
+        self.time_budget = time_budget
+        self.workers = workers
+        self.rollout_turns = rollout_turns
+        self.rng = random.Random(seed)
+        self.table = TranspositionTable()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def choose(self, game: FastTrackGame, player_id: int,
+               moves: Optional[List[Move]] = None) -> Decision:
+        """Pick a move for player_id within the time budget"""
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        moves = game.generate_moves(player_id) if moves is None else moves
+        if not moves:
+            raise ValueError("No legal moves")
+        if len(moves) == 1:
+            return Decision(moves[0], 0, time.perf_counter() - start)
+
+        shares = self.workers + 1
+        futures = []
+        if self.workers:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            # Leave headroom for pickling the game and the result
+            budget = self.time_budget * 0.8
+            for _ in range(self.workers):
+                futures.append(self._pool.submit(
+                    _search_task, game, player_id, moves, budget,
+                    self.max_rollouts // shares, self.rng.getrandbits(32), self.rollout_turns,
+                ))
+
+        totals = search(game, player_id, moves, deadline,
+                        self.max_rollouts // shares + self.max_rollouts % shares,
+                        self.rng.getrandbits(32), self.table, self.rollout_turns)
+
+        if futures:
+            done, _ = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+            for future in done:
+                if future.exception() is None:
+                    for total, part in zip(totals, future.result()):
+                        total[0] += part[0]
+                        total[1] += part[1]
+
+        rollouts = sum(visits for visits, _ in totals)
+        if rollouts == 0:
+            # Budget too small for a single playout: fall back to the heuristic
+            move = greedy_strategy(game, player_id, moves, self.rng)
+            return Decision(move, 0, time.perf_counter() - start)
+
+        candidates = sorted(
+            ((move, visits, value / visits if visits else 0.0)
+             for move, (visits, value) in zip(moves, totals)),
+            key=lambda c: (c[1], c[2]), reverse=True,
+        )
+        return Decision(candidates[0][0], rollouts, time.perf_counter() - start, candidates)
+
+    async def choose_async(self, game: FastTrackGame, player_id: int,
+                           moves: Optional[List[Move]] = None) -> Decision:
+        """choose() off the event loop, for use inside the game server"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.choose, game, player_id, moves)
+
+    def __call__(self, game: FastTrackGame, player_id: int,
+                 moves: List[Move], rng: random.Random) -> Move:
+        return self.choose(game, player_id, moves).move
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+# Simulator strategies: python simulator.py --strategies mcts:mcts_easy greedy
+mcts_easy = MCTSPlayer("easy", time_budget=0.05)
+mcts_medium = MCTSPlayer("medium", time_budget=0.1)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_mcts(decisions: int = 20, difficulty: str = "medium",
+                   time_budget: float = TIME_BUDGET, workers: int = 0,
+                   seed: int = 0) -> dict:
+    """Latency and rollouts/sec over decisions from a seeded game"""
+    player = MCTSPlayer(difficulty, time_budget=time_budget, workers=workers, seed=seed)
+    game = FastTrackGame(num_players=4, seed=seed)
+    rng = random.Random(seed)
+    latencies, rollouts = [], 0
+
+    try:
+        while len(latencies) < decisions:
+            player_id = game.current_player
+            moves = game.generate_moves(player_id)
+            if len(moves) < 2:
+                take_turn(game, greedy_strategy, rng)
+                continue
+            decision = player.choose(game, player_id, moves)
+            latencies.append(decision.elapsed)
+            rollouts += decision.rollouts
+            if "winner" in apply_move(game, decision.move):
+                game = FastTrackGame(num_players=4, seed=rng.getrandbits(32))
+    finally:
+        player.close()
+
+    latencies.sort()
+    return {
+        "decisions": decisions,
+        "rollouts_per_decision": round(rollouts / decisions, 1),
+        "rollouts_per_second": round(rollouts / sum(latencies)),
+        "latency_ms_p50": round(latencies[len(latencies) // 2] * 1000, 2),
+        "latency_ms_max": round(latencies[-1] * 1000, 2),
+        "table_entries": len(player.table),
+    }
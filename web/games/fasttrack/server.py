@@ -11,6 +11,11 @@ from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+try:
+    from .state_sync import StateSync
+except ImportError:
+    from state_sync import StateSync
+
 try:
     from helix import HelixKernel
     HELIX_AVAILABLE = True
@@ -96,6 +101,7 @@ class FastTrackRoom:
         self.created_at = asyncio.get_event_loop().time()
         self.websockets: Set[object] = set()
         self.ai_task: Optional[asyncio.Task] = None
+        self.sync = StateSync()
         
     def add_player(self, name: str, player_type: str = "human", websocket=None) -> Optional[Player]:
         """Add a player to the room."""
@@ -128,6 +134,7 @@ class FastTrackRoom:
     def get_state(self) -> dict:
         """Get the current game state."""
         return {
+            "version": self.sync.version,
             "roomCode": self.room_code,
             "players": [p.to_dict() for p in self.players],
             "currentPlayerIndex": self.current_player_index,
@@ -304,9 +311,47 @@ class FastTrackRoom:
         
         self.dice_value = None
     
+    def turn_delta(self) -> dict:
+        """Delta fields that can change on any turn."""
+        return {
+            "currentPlayerIndex": self.current_player_index,
+            "diceValue": self.dice_value,
+            "gamePhase": self.game_phase
+        }
+    
+    def move_delta(self, player: Player, move: dict, result: dict) -> dict:
+        """Delta for an executed move: only the pegs it touched."""
+        changed = {player.id: [player.pegs[move["pegIndex"]]]}
+        capture = result.get("capture")
+        if capture:
+            victim = self.players[capture["playerId"]]
+            changed.setdefault(victim.id, []).append(victim.pegs[capture["pegId"]])
+        
+        delta = self.turn_delta()
+        delta["players"] = {
+            pid: {
+                "pegs": [p.to_dict() for p in pegs],
+                "homeCount": self.players[pid].home_count,
+                "finished": self.players[pid].finished
+            }
+            for pid, pegs in changed.items()
+        }
+        return delta
+    
+    async def broadcast_delta(self, changes: dict):
+        """Commit a versioned delta and send it to all connected players."""
+        await self.send_all(self.sync.commit(changes))
+    
+    async def broadcast_state(self):
+        """Send the full state as a new version (roster changes)."""
+        await self.send_all(self.sync.keyframe(self.get_state()))
+    
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected players."""
-        message_str = json.dumps(message)
+        await self.send_all(json.dumps(message))
+    
+    async def send_all(self, message_str: str):
+        """Send one pre-serialized message to all connected players."""
         disconnected = set()
         
         for ws in self.websockets:
@@ -365,13 +410,11 @@ class FastTrackRoom:
             # Check for extra turn on 6
             if self.dice_value != 6 and self.game_phase == "playing":
                 self.next_turn()
+            
+            await self.broadcast_delta(self.move_delta(player, chosen_move, result))
         else:
             self.next_turn()
-        
-        await self.broadcast({
-            "type": "gameState",
-            "state": self.get_state()
-        })
+            await self.broadcast_delta(self.turn_delta())
         
         # If next player is also AI, continue
         next_player = self.get_current_player()
@@ -483,14 +526,12 @@ class FastTrackServer:
                     "playerName": ai_name,
                     "isAI": True
                 })
-                await room.broadcast({
-                    "type": "gameState",
-                    "state": room.get_state()
-                })
+                await room.broadcast_state()
                 
         elif msg_type == "startGame":
             if len(room.players) >= 2:
                 room.game_phase = "playing"
+                room.sync.commit(room.turn_delta())
                 await room.broadcast({
                     "type": "gameStarted",
                     "state": room.get_state()
@@ -534,16 +575,19 @@ class FastTrackServer:
                 if room.dice_value != 6 and room.game_phase == "playing":
                     room.next_turn()
                 
-                await room.broadcast({
-                    "type": "gameState",
-                    "state": room.get_state()
-                })
+                await room.broadcast_delta(room.move_delta(current, move, result))
                 
                 # Trigger AI turn if needed
                 next_player = room.get_current_player()
                 if next_player and next_player.player_type == "ai" and room.game_phase == "playing":
                     room.ai_task = asyncio.create_task(room.play_ai_turn())
                     
+        elif msg_type == "resync":
+            # Client saw a version gap: replay missed deltas or send a snapshot
+            version = message.get("version", -1)
+            for message_str in room.sync.resync(version, room.get_state):
+                await websocket.send(message_str)
+                
         elif msg_type == "chat":
             await room.broadcast({
                 "type": "chat",
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Fast Track Self-Play Simulator
+==============================
+Plays complete headless games between pluggable AI strategies on the
+fasttrack_exact engine - no sockets, no broadcasts, no thinking delays -
+so strategies can be compared over thousands of games.
+
+- Every game is seeded (deck and strategy RNG), so a run is reproducible
+  independent of how games are spread over worker processes.
+- Games fan out across a process pool in chunks.
+- Results aggregate to win rate, game length and captures per strategy.
+
+A strategy is a callable (game, player_id, moves, rng) -> move, where
+`moves` is the non-empty list of (peg, hand index, hole) tuples from
+FastTrackGame.generate_moves(). Built-ins are registered in STRATEGIES;
+any other strategy is given as "module:function".
+
+    python simulator.py --games 2000 --players 4 --strategies greedy random
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from .fasttrack_exact import FastTrackGame, HoleType
+except ImportError:
+    from fasttrack_exact import FastTrackGame, HoleType
+
+
+Move = Tuple[int, int, int]
+Strategy = Callable[[FastTrackGame, int, List[Move], random.Random], Move]
+
+# Cards that grant another play after a legal move (FASTTRACK_RULES.md)
+EXTRA_TURN_RANKS = frozenset({"A", "6", "JOKER", "J", "Q", "K"})
+
+# Turns after which a game is scored as a draw
+MAX_TURNS = 3000
+
+
+# =============================================================================
+# STRATEGIES
+# =============================================================================
+
+def random_strategy(game: FastTrackGame, player_id: int,
+                    moves: List[Move], rng: random.Random) -> Move:
+    """Uniformly random legal move"""
+    return rng.choice(moves)
+
+
+def greedy_strategy(game: FastTrackGame, player_id: int,
+                    moves: List[Move], rng: random.Random) -> Move:
+    """Finish > capture > release > furthest progress, ties broken randomly"""
+    best, best_score = [], None
+    for move in moves:
+        score = move_score(game, player_id, move)
+        if best_score is None or score > best_score:
+            best, best_score = [move], score
+        elif score == best_score:
+            best.append(move)
+    return rng.choice(best)
+
+
+def move_score(game: FastTrackGame, player_id: int, move: Move) -> int:
+    """Heuristic value of a move for the greedy strategy"""
+    topo = game.topology
+    peg, _, dest = move
+    hole_type = topo.hole_types[dest]
+    if hole_type in (HoleType.SAFE, HoleType.WINNER):
+        return 1000
+
+    score = 0
+    occupant = game.occupancy[dest]
+    if occupant >= 0 and game.peg_owner[occupant] != player_id:
+        score += 500
+    if dest == topo.start_hole[player_id] and game.peg_hole[peg] != dest:
+        score += 200
+
+    position = topo.track_position[dest]
+    if position >= 0:
+        start = topo.track_position[topo.start_hole[player_id]]
+        score += (position - start) % len(topo.track_holes)
+    return score
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    "random": random_strategy,
+    "greedy": greedy_strategy,
+}
+
+
+def resolve_strategy(name: str) -> Strategy:
+    """Built-in strategy by name, or "module:function" import path"""
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    if ":" not in name:
+        raise ValueError(f"Unknown strategy: {name}")
+    module, attr = name.split(":", 1)
+    return getattr(importlib.import_module(module), attr)
+
+
+# =============================================================================
+# GAMES
+# =============================================================================
+
+@dataclass
+class GameResult:
+    """Outcome of one simulated game (seats list strategy names)"""
+    seed: int
+    seats: Tuple[str, ...]
+    winner: Optional[int]
+    turns: int
+    captures: Tuple[int, ...]
+
+
+def apply_move(game: FastTrackGame, move: Move) -> dict:
+    """Play a move and pass the turn unless the card grants another play"""
+    result = game.play_move(move)
+    if "winner" not in result and result["card"] not in EXTRA_TURN_RANKS:
+        game.next_turn()
+    return result
+
+
+def take_turn(game: FastTrackGame, strategy: Strategy,
+              rng: random.Random) -> Optional[dict]:
+    """
+    One play by the player to move. Returns the move result, or None if
+    there was no legal move and the card was discarded.
+    """
+    player_id = game.current_player
+    moves = game.generate_moves(player_id)
+    if not moves:
+        # No legal move: the card is discarded and the turn ends
+        game.discard_card(player_id, 0)
+        game.next_turn()
+        return None
+    return apply_move(game, strategy(game, player_id, moves, rng))
+
+
+def play_game(seats: Sequence[str], seed: int,
+              max_turns: int = MAX_TURNS) -> GameResult:
+    """Play one game to completion (or max_turns) with no I/O"""
+    strategies = [resolve_strategy(name) for name in seats]
+    game = FastTrackGame(num_players=len(seats), seed=seed)
+    rng = random.Random(f"{seed}:strategy")
+    captures = [0] * len(seats)
+    winner = None
+
+    turns = 0
+    while turns < max_turns:
+        turns += 1
+        player_id = game.current_player
+        result = take_turn(game, strategies[player_id], rng)
+        if result is None:
+            continue
+        if "captured" in result:
+            captures[player_id] += 1
+        if "winner" in result:
+            winner = player_id
+            break
+
+    return GameResult(seed, tuple(seats), winner, turns, tuple(captures))
+
+
+def _play_chunk(jobs: List[Tuple[Tuple[str, ...], int, int]]) -> List[GameResult]:
+    """Process pool task: play a batch of (seats, seed, max_turns) games"""
+    return [play_game(seats, seed, max_turns) for seats, seed, max_turns in jobs]
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def simulate(strategies: Sequence[str], games: int = 1000, players: int = 4,
+             seed: int = 0, workers: Optional[int] = None,
+             max_turns: int = MAX_TURNS) -> dict:
+    """
+    Play `games` games and aggregate per-strategy statistics.
+
+    Strategies are cycled over the seats and the seating is rotated
+    every game so no strategy keeps the first-move advantage. Game i
+    uses seed `seed + i`, so results do not depend on `workers`.
+    """
+    if not 2 <= players <= 6:
+        raise ValueError("Number of players must be between 2 and 6")
+    for name in strategies:
+        resolve_strategy(name)
+
+    workers = workers or os.cpu_count() or 1
+    seating = [strategies[i % len(strategies)] for i in range(players)]
+    jobs = []
+    for i in range(games):
+        shift = i % players
+        jobs.append((tuple(seating[shift:] + seating[:shift]), seed + i, max_turns))
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = _play_chunk(jobs)
+    else:
+        size = max(1, games // (workers * 4))
+        chunks = [jobs[i:i + size] for i in range(0, games, size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [r for chunk in pool.map(_play_chunk, chunks) for r in chunk]
+    elapsed = time.perf_counter() - start
+
+    return summarize(results, elapsed)
+
+
+def summarize(results: List[GameResult], elapsed: float = 0.0) -> dict:
+    """Aggregate GameResults into a report dict"""
+    per_strategy: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        for seat, name in enumerate(result.seats):
+            stats = per_strategy.setdefault(
+                name, {"seats": 0, "wins": 0, "captures": 0}
+            )
+            stats["seats"] += 1
+            stats["captures"] += result.captures[seat]
+            if result.winner == seat:
+                stats["wins"] += 1
+
+    games = len(results)
+    for stats in per_strategy.values():
+        stats["win_rate"] = round(stats["wins"] / games, 4) if games else 0.0
+        stats["captures_per_seat"] = (
+            round(stats["captures"] / stats["seats"], 3) if stats["seats"] else 0.0
+        )
+
+    turns = [r.turns for r in results]
+    return {
+        "games": games,
+        "seconds": round(elapsed, 3),
+        "games_per_second": round(games / elapsed, 1) if elapsed else 0.0,
+        "draws": sum(1 for r in results if r.winner is None),
+        "turns": {
+            "mean": round(statistics.fmean(turns), 1) if turns else 0.0,
+            "median": statistics.median(turns) if turns else 0,
+            "max": max(turns, default=0),
+        },
+        "strategies": per_strategy,
+    }
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Fast Track self-play simulator")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="Number of games to play (default: 1000)")
+    parser.add_argument("--players", type=int, default=4,
+                        help="Seats per game, 2-6 (default: 4)")
+    parser.add_argument("--strategies", nargs="+", default=["greedy", "random"],
+                        help="Strategy names or module:function (default: greedy random)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Base seed; game i uses seed + i (default: 0)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS,
+                        help=f"Turns before a game is a draw (default: {MAX_TURNS})")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the full report as JSON")
+
+    args = parser.parse_args()
+    report = simulate(args.strategies, games=args.games, players=args.players,
+                      seed=args.seed, workers=args.workers, max_turns=args.max_turns)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['games']} games in {report['seconds']}s "
+          f"({report['games_per_second']} games/sec), {report['draws']} draws")
+    print(f"Game length: mean {report['turns']['mean']} turns, "
+          f"median {report['turns']['median']}, max {report['turns']['max']}")
+    for name, stats in report["strategies"].items():
+        print(f"  {name:>12}: win rate {stats['win_rate']:.1%} "
+              f"({stats['wins']}/{report['games']}), "
+              f"{stats['captures_per_seat']} captures per seat")
+
+
+if __name__ == "__main__":
+    main()
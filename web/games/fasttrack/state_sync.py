@@ -0,0 +1,80 @@
+"""
+Fast Track State Sync
+=====================
+Versioned state synchronisation for game sessions.
+
+Instead of broadcasting the whole game state after every move, a session
+sends one full snapshot when a client joins and then small per-move
+deltas, each tagged with a monotonically increasing version:
+
+    {"type": "gameState", "version": 7, "state": {...}}    full snapshot
+    {"type": "delta", "version": 8, ...changes...}         one move
+
+A client applies deltas in order. If it sees a version gap it sends
+{"type": "resync", "version": <last applied>} and receives the missed
+messages from the log, or a fresh snapshot if they have fallen out of it.
+
+Every message is serialized exactly once, when it is committed, and the
+same string is sent to every client.
+"""
+
+import json
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+# Messages kept for catching up clients before a full snapshot is needed
+DELTA_HISTORY = 256
+
+
+def dumps(message: dict) -> str:
+    """Compact JSON used for everything on the wire"""
+    return json.dumps(message, separators=(",", ":"))
+
+
+class StateSync:
+    """Version counter and log of pre-serialized messages for one session"""
+
+    def __init__(self, history: int = DELTA_HISTORY):
+        self.version = 0
+        self._log: Deque[Tuple[int, str]] = deque(maxlen=history)
+
+    def commit(self, changes: dict) -> str:
+        """Record a delta as the next version; returns the wire message"""
+        self.version += 1
+        message = dumps({"type": "delta", "version": self.version, **changes})
+        self._log.append((self.version, message))
+        return message
+
+    def keyframe(self, state: dict) -> str:
+        """Record a full state as the next version (e.g. roster changes)"""
+        self.version += 1
+        message = self.snapshot(state)
+        self._log.append((self.version, message))
+        return message
+
+    def snapshot(self, state: dict) -> str:
+        """Full state at the current version, not logged"""
+        return dumps({"type": "gameState", "version": self.version, "state": state})
+
+    def since(self, version: int) -> Optional[List[str]]:
+        """
+        Messages a client at `version` is missing, or None if the log no
+        longer reaches back that far and it needs a snapshot.
+        """
+        if version == self.version:
+            return []
+        if version > self.version or not self._log or version < self._log[0][0] - 1:
+            return None
+        return [message for v, message in self._log if v > version]
+
+    def resync(self, version: Any, get_state: Callable[[], dict]) -> List[str]:
+        """
+        Messages that bring a client at `version` up to date. `version`
+        comes straight off the wire, so anything but an integer gets a
+        full snapshot.
+        """
+        if not isinstance(version, int) or isinstance(version, bool):
+            return [self.snapshot(get_state())]
+        missed = self.since(version)
+        return [self.snapshot(get_state())] if missed is None else missed
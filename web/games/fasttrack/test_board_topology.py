@@ -0,0 +1,28 @@
+"""
+Fast Track Board Topology Tests
+
+The committed board_topology.json must match what the generator
+produces now; rerun `python board_topology.py` after changing the board.
+"""
+
+import json
+
+from web.games.fasttrack.board_topology import ARTIFACT_PATH, BoardGenerator, BoardTopology
+from web.games.fasttrack.state_sync import dumps
+
+
+def test_artifact_matches_generator():
+    """Committed artifact is byte-identical to a fresh generation"""
+    board = BoardGenerator()
+    board.generate()
+    topology = BoardTopology(board)
+    
+    saved = json.loads(ARTIFACT_PATH.read_text())
+    assert saved["board_hash"] == topology.board_hash
+    assert ARTIFACT_PATH.read_text() == dumps(topology.artifact())
+
+
+def test_shared_is_generated_once():
+    """shared() hands every caller the same topology"""
+    assert BoardTopology.shared() is BoardTopology.shared()
+    assert BoardTopology.shared().board_hash == json.loads(ARTIFACT_PATH.read_text())["board_hash"]